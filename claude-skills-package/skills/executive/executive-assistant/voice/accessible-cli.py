@@ -17,6 +17,9 @@ Usage:
     python accessible-cli.py                    # Start accessible CLI
     python accessible-cli.py --beginner         # Extra guidance for new users
     python accessible-cli.py --no-confirm       # Skip safety confirmations (advanced)
+    python accessible-cli.py --vad              # Stop recording when you stop talking
+    python accessible-cli.py --cascade          # Fast model first, base only when unsure
+    python accessible-cli.py --source clips/    # Replay recordings instead of the mic (headless runs)
 
 Voice Commands:
     Navigation:
@@ -74,6 +77,12 @@ HISTORY_FILE = Path.home() / ".accessible-cli-history.json"
 # Microphone settings
 DEFAULT_MIC_INDEX = 18  # Logitech C525 HD WebCam
 
+# Capture mode: False = fixed-duration recording, True = stop when the speaker goes quiet (VAD)
+USE_VAD = False
+
+# Speech model: "base", or "cascade" to decode with tiny and re-decode with base only when unsure
+STT_MODEL = "base"
+
 # Safety lists
 DESTRUCTIVE_COMMANDS = [
     "rm", "rmdir", "del", "delete", "format", "kill",
@@ -105,12 +114,24 @@ def speak(text, style="default", rate="+0%"):
         print(f"[Voice Error] {e}")
 
 def listen(duration=8, mic_index=DEFAULT_MIC_INDEX):
-    """Listen for user speech."""
+    """
+    Listen for user speech.
+
+    With USE_VAD, `duration` is how long to wait for speech to start and
+    recording stops as soon as the speaker goes quiet.
+    """
     try:
+        if USE_VAD:
+            return listen_module.listen_vad(
+                timeout=duration,
+                mic_index=mic_index,
+                model_size=STT_MODEL,
+                verbose=False
+            )
         return listen_module.listen_fixed(
             duration=duration,
             mic_index=mic_index,
-            model_size="base",
+            model_size=STT_MODEL,
             verbose=False
         )
     except Exception as e:
@@ -466,9 +487,23 @@ def main():
                        help="Skip safety confirmations (advanced users)")
     parser.add_argument("--mic-index", "-m", type=int, default=DEFAULT_MIC_INDEX,
                        help="Microphone device index")
+    parser.add_argument("--vad", action="store_true",
+                       help="Stop recording when you stop talking instead of fixed-length windows")
+    parser.add_argument("--cascade", action="store_true",
+                       help="Transcribe with the fast model first, re-check with base only when unsure")
+    parser.add_argument("--source", default=None, metavar="SPEC",
+                       help="Listen to recordings or test signals instead of the mic, e.g. 'clips/,gap=1' "
+                            "(see evie-listen.py open_audio_source)")
 
     args = parser.parse_args()
 
+    global USE_VAD, STT_MODEL
+    USE_VAD = args.vad
+    if args.source:
+        listen_module.AUDIO_SOURCE = args.source
+    if args.cascade:
+        STT_MODEL = listen_module.CASCADE
+
     cli = AccessibleCLI(
         beginner_mode=args.beginner,
         skip_confirms=args.no_confirm
@@ -0,0 +1,1356 @@
+#!/usr/bin/env python3
+"""
+Evie Audio - NumPy signal processing shared by the voice scripts
+
+Pure NumPy building blocks (no microphone or model access) used by
+evie-listen.py and friends:
+
+    NoiseFloorTracker       Running background-noise level from recent frame energies
+    VoiceActivityDetector   Frame-level speech/non-speech decisions
+    UtteranceSegmenter      Opens an utterance on speech onset, closes it after a hangover
+    SpeechGate              Cheap "is there any speech in this window?" check with counters
+    resample                Vectorized polyphase resampling (e.g. 44.1/48 kHz -> 16 kHz)
+    StreamingResampler      The same resampling for audio that arrives in pieces
+    RingBuffer              Preallocated single-writer ring buffer indexed by absolute sample
+    AudioNormalizer         In-place float32 DC removal + automatic gain control
+    NoiseSuppressor         Streaming STFT Wiener filter against steady fan/HVAC noise
+    PlaybackReference       Recently played speaker audio on the monotonic clock (echo reference)
+    EchoCanceller           Frequency-domain NLMS acoustic echo cancellation
+    pcm_to_float32          Decode 8/16/24/32-bit, mono or multi-channel PCM to float32 mono
+    silence, tone, noise    Synthetic test signals for replay sources and benchmarks
+    MfccExtractor           Vectorized log-mel / MFCC features (keyword spotting)
+
+Load it the same way the frontends load evie-listen.py:
+
+    audio = load_module(SCRIPT_DIR / "evie-audio.py")
+    vad = audio.VoiceActivityDetector(sample_rate=16000)
+"""
+
+import threading
+import time
+from collections import deque
+from math import exp, gcd, pi, sqrt
+
+import numpy as np
+
+
+def to_float32(samples):
+    """
+    Convert int16 PCM (array or raw bytes) to float32 in [-1, 1].
+
+    Float input is returned unchanged (no copy) so callers can pass either.
+    """
+    if isinstance(samples, (bytes, bytearray, memoryview)):
+        samples = np.frombuffer(samples, dtype=np.int16)
+    if samples.dtype == np.int16:
+        return samples.astype(np.float32) * (1.0 / 32768.0)
+    return samples.astype(np.float32, copy=False)
+
+
+def pcm_to_float32(raw, sample_width=2, channels=1, out=None):
+    """
+    Decode interleaved PCM bytes to a float32 mono array in [-1, 1].
+
+    Multi-channel input is downmixed by averaging channels rather than
+    being misread as one long mono signal.
+
+    Args:
+        raw: PCM bytes (or int16 array, treated as sample_width=2)
+        sample_width: Bytes per sample (1 = unsigned 8-bit, 2, 3 or 4 = signed)
+        channels: Number of interleaved channels
+        out: Optional preallocated float32 array of at least n_frames
+
+    Returns:
+        float32 mono array (a view of `out` when given)
+    """
+    if isinstance(raw, np.ndarray):
+        ints = raw.reshape(-1)
+        scale = 1.0 / 32768.0
+    elif sample_width == 1:
+        ints = np.frombuffer(raw, dtype=np.uint8)
+        scale = 1.0 / 128.0
+    elif sample_width == 2:
+        ints = np.frombuffer(raw, dtype=np.int16)
+        scale = 1.0 / 32768.0
+    elif sample_width == 3:
+        # Sign-extend 24-bit little-endian samples into int32
+        b = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+        ints = (b[:, 0] | (b[:, 1] << 8) | (b[:, 2] << 16)) << 8 >> 8
+        scale = 1.0 / 8388608.0
+    elif sample_width == 4:
+        ints = np.frombuffer(raw, dtype=np.int32)
+        scale = 1.0 / 2147483648.0
+    else:
+        raise ValueError(f"Unsupported sample width: {sample_width}")
+
+    n_frames = len(ints) // channels
+    if out is None:
+        out = np.empty(n_frames, dtype=np.float32)
+    out = out[:n_frames]
+
+    # Cast then scale in place (a mixed-type multiply would buffer through float64)
+    if channels == 1:
+        np.copyto(out, ints[:n_frames], casting="unsafe")
+    else:
+        downmix(ints[:n_frames * channels].reshape(n_frames, channels), out)
+        scale /= channels
+    out *= scale
+    if sample_width == 1 and not isinstance(raw, np.ndarray):
+        out -= 1.0  # 8-bit WAV is unsigned, centred on 128
+    return out
+
+
+def downmix(frames, out):
+    """
+    Sum the channels of a (n_frames, channels) array into `out`.
+
+    Adds one channel at a time, which is several times faster than
+    np.mean(axis=1, dtype=...) on integer input and avoids the float64
+    buffers it casts through.
+
+    Returns:
+        out, holding the channel sum (divide by the channel count for the mean)
+    """
+    np.copyto(out, frames[:, 0], casting="unsafe")
+    for c in range(1, frames.shape[1]):
+        out += frames[:, c]
+    return out
+
+
+def resample(samples, orig_rate, target_rate, half_width=16):
+    """
+    Resample float32 audio with a windowed-sinc polyphase filter.
+
+    Equivalent to upsampling by `up`, low-pass filtering and decimating by
+    `down`, but only the output samples are ever computed.
+
+    Args:
+        samples: 1-D float32 array
+        orig_rate: Input sample rate in Hz
+        target_rate: Output sample rate in Hz
+        half_width: Filter half-width in input-rate zero crossings (quality vs speed)
+
+    Returns:
+        float32 array at target_rate
+    """
+    samples = np.asarray(samples, dtype=np.float32)
+    g = gcd(int(orig_rate), int(target_rate))
+    up, down = int(target_rate) // g, int(orig_rate) // g
+    if up == down:
+        return samples
+
+    H, K = _polyphase_filter(up, down, half_width)
+
+    n_out = (len(samples) * up) // down
+    padded = np.concatenate([np.zeros(K, np.float32), samples, np.zeros(K + 1, np.float32)])
+    offsets = np.arange(-K, K + 1)
+    out = np.empty(n_out, dtype=np.float32)
+
+    # Process in blocks so the gather matrix stays small for long clips
+    block = 8192
+    for start in range(0, n_out, block):
+        k = np.arange(start, min(start + block, n_out))
+        m = k * down
+        phase = m % up
+        base = m // up + K
+        gathered = padded[base[:, None] + offsets[None, :]]
+        out[start:start + len(k)] = np.einsum("ij,ij->i", H[phase], gathered)
+    return out
+
+
+_polyphase_cache = {}
+
+
+def _polyphase_filter(up, down, half_width):
+    """Build (and cache) the polyphase filter bank for an up/down ratio."""
+    key = (up, down, half_width)
+    if key not in _polyphase_cache:
+        L = half_width * max(up, down)
+        n = np.arange(-L, L + 1)
+        cutoff = 1.0 / max(up, down)
+        h = cutoff * np.sinc(cutoff * n) * np.kaiser(2 * L + 1, 8.0) * up
+
+        # H[p, d] is the tap applied to input sample (m // up + d) for output phase p
+        K = L // up + 1
+        offsets = np.arange(-K, K + 1)
+        idx = np.arange(up)[:, None] - offsets[None, :] * up + L
+        valid = (idx >= 0) & (idx <= 2 * L)
+        H = np.where(valid, h[np.clip(idx, 0, 2 * L)], 0.0).astype(np.float32)
+        _polyphase_cache[key] = (H, K)
+    return _polyphase_cache[key]
+
+
+class StreamingResampler:
+    """
+    resample() for audio that arrives in pieces.
+
+    The filter history is kept between calls, so consecutive pieces come
+    out exactly as if the whole signal had been resampled at once (no
+    clicks at the joins). Output lags input by the filter half-width
+    (about 1 ms); flush() releases the rest at the end of a signal.
+    """
+
+    def __init__(self, orig_rate, target_rate, half_width=16):
+        """
+        Args:
+            orig_rate: Input sample rate in Hz
+            target_rate: Output sample rate in Hz
+            half_width: Filter half-width, as for resample()
+        """
+        g = gcd(int(orig_rate), int(target_rate))
+        self.up, self.down = int(target_rate) // g, int(orig_rate) // g
+        self._H, self._K = (None, 0) if self.up == self.down else _polyphase_filter(self.up, self.down, half_width)
+        self.reset()
+
+    def reset(self):
+        """Forget the signal so far (the next piece starts a new one)."""
+        # Inputs from absolute index _origin on; negative indexes are the leading zeros
+        self._buffer = np.zeros(self._K, dtype=np.float32)
+        self._origin = -self._K
+        self._received = 0
+        self._next = 0
+
+    def process(self, samples):
+        """Resample the next piece; returns every output sample it completes."""
+        samples = np.asarray(samples, dtype=np.float32)
+        if self.up == self.down:
+            return samples
+        self._buffer = np.concatenate([self._buffer, samples])
+        self._received += len(samples)
+        return self._emit(self._origin + len(self._buffer))
+
+    def flush(self):
+        """Output still held back for the filter's look-ahead; then reset."""
+        if self.up == self.down:
+            return np.zeros(0, dtype=np.float32)
+        total = (self._received * self.up) // self.down
+        self._buffer = np.concatenate([self._buffer, np.zeros(self._K + 1, dtype=np.float32)])
+        out = self._emit(self._origin + len(self._buffer), limit=total)
+        self.reset()
+        return out
+
+    def _emit(self, available, limit=None):
+        K = self._K
+        # Output k needs inputs up to (k * down) // up + K
+        stop = ((available - K) * self.up - 1) // self.down + 1 if available > K else 0
+        if limit is not None:
+            stop = min(stop, limit)
+        if stop <= self._next:
+            return np.zeros(0, dtype=np.float32)
+        m = np.arange(self._next, stop) * self.down
+        start = m // self.up - K - self._origin
+        gathered = self._buffer[start[:, None] + np.arange(2 * K + 1)[None, :]]
+        out = np.einsum("ij,ij->i", self._H[m % self.up], gathered).astype(np.float32)
+        self._next = stop
+        # Drop input no later output reaches back to
+        drop = (stop * self.down) // self.up - K - self._origin
+        if drop > 0:
+            self._buffer = self._buffer[drop:]
+            self._origin += drop
+        return out
+
+
+def silence(seconds, sample_rate=16000):
+    """Digital silence as float32."""
+    return np.zeros(int(round(seconds * sample_rate)), dtype=np.float32)
+
+
+def tone(frequency, seconds, sample_rate=16000, level_db=-20.0):
+    """
+    Sine tone as float32.
+
+    Args:
+        frequency: Tone frequency in Hz
+        seconds: Duration
+        sample_rate: Output sample rate in Hz
+        level_db: RMS level in dB relative to full scale
+    """
+    t = np.arange(int(round(seconds * sample_rate)), dtype=np.float64) / sample_rate
+    amplitude = sqrt(2.0) * 10.0 ** (level_db / 20.0)
+    return (amplitude * np.sin(2.0 * pi * frequency * t)).astype(np.float32)
+
+
+def noise(seconds, sample_rate=16000, level_db=-50.0, seed=0):
+    """
+    White Gaussian noise as float32 (seeded, so replays are repeatable).
+
+    Args:
+        seconds: Duration
+        sample_rate: Output sample rate in Hz
+        level_db: RMS level in dB relative to full scale
+        seed: Random seed (None = different noise every call)
+    """
+    rng = np.random.default_rng(seed)
+    n = int(round(seconds * sample_rate))
+    return (10.0 ** (level_db / 20.0) * rng.standard_normal(n)).astype(np.float32)
+
+
+class NoiseFloorTracker:
+    """
+    Running estimate of the background noise level of a live stream.
+
+    Frame energies from the last `window_seconds` are kept in a circular
+    array and the floor is a low percentile of them (minimum statistics):
+    speech only raises some of the frames in a window, so the percentile
+    follows the room rather than the talker, climbing within a few seconds
+    when a fan switches on and dropping again when it stops.
+
+    update() only computes frame energies, so it is cheap enough to run in
+    an audio callback; the percentile is taken when the floor is read.
+    """
+
+    def __init__(self, sample_rate=16000, frame_ms=30, window_seconds=5.0, percentile=10):
+        """
+        Args:
+            sample_rate: Input sample rate in Hz
+            frame_ms: Energy frame length in milliseconds
+            window_seconds: How much recent audio the estimate covers
+            percentile: Percentile of frame energies taken as the floor
+        """
+        self.frame_length = max(1, int(sample_rate * frame_ms / 1000))
+        self.percentile = percentile
+        n_frames = max(1, int(window_seconds * sample_rate / self.frame_length))
+        self._energies = np.zeros(n_frames, dtype=np.float32)
+        self._count = 0
+        self._pending = np.zeros(0, dtype=np.float32)
+
+    def update(self, samples):
+        """Add newly captured int16 or float32 samples (array or bytes)."""
+        samples = to_float32(samples)
+        if len(self._pending):
+            samples = np.concatenate([self._pending, samples])
+        n_frames = len(samples) // self.frame_length
+        self._pending = samples[n_frames * self.frame_length:].copy()
+        if n_frames == 0:
+            return
+
+        frames = samples[:n_frames * self.frame_length].reshape(n_frames, self.frame_length)
+        energy_db = 10.0 * np.log10(np.mean(frames * frames, axis=1) + 1e-10)
+        size = len(self._energies)
+        kept = energy_db[-size:]
+        self._energies[(self._count + n_frames - len(kept) + np.arange(len(kept))) % size] = kept
+        self._count += n_frames
+
+    @property
+    def floor_db(self):
+        """Current noise floor in dB (None before any audio has been seen)."""
+        n = min(self._count, len(self._energies))
+        if n == 0:
+            return None
+        return float(np.percentile(self._energies[:n], self.percentile))
+
+
+class VoiceActivityDetector:
+    """
+    Frame-level voice activity detector.
+
+    Each frame is classified from three cheap features computed in one
+    vectorized pass over all frames of a chunk:
+
+    - short-time energy (dB) compared against a tracked noise floor
+    - zero-crossing rate (voiced speech sits well below broadband noise)
+    - spectral flatness in the 100-4000 Hz speech band (speech is tonal,
+      fans and HVAC are flat)
+
+    The floor is either learned from the frames the detector classifies
+    or, with `noise_floor`, read from a NoiseFloorTracker that a live
+    stream keeps up to date, so every detector on that stream shares one
+    current estimate and none needs calibrating.
+    """
+
+    def __init__(self, sample_rate=16000, frame_ms=30, energy_margin_db=12.0,
+                 min_energy_db=-55.0, max_zcr=0.35, max_flatness=0.6,
+                 floor_adapt=0.05, noise_floor=None):
+        """
+        Args:
+            sample_rate: Input sample rate in Hz
+            frame_ms: Analysis frame length in milliseconds
+            energy_margin_db: How far above the noise floor a frame must be to count as speech
+            min_energy_db: Absolute floor; quieter frames are never speech
+            max_zcr: Frames with a higher zero-crossing rate are treated as noise
+            max_flatness: Frames with a flatter spectrum are treated as noise
+            floor_adapt: Smoothing factor for the noise floor (0-1, higher adapts faster)
+            noise_floor: Optional NoiseFloorTracker to take the floor from instead
+        """
+        self.sample_rate = sample_rate
+        self.frame_length = max(1, int(sample_rate * frame_ms / 1000))
+        self.frame_ms = 1000.0 * self.frame_length / sample_rate
+        self.energy_margin_db = energy_margin_db
+        self.min_energy_db = min_energy_db
+        self.max_zcr = max_zcr
+        self.max_flatness = max_flatness
+        self.floor_adapt = floor_adapt
+        self.noise_floor_db = None
+        self.noise_floor = noise_floor
+
+        # Precomputed analysis window and speech-band bin mask
+        self._window = np.hanning(self.frame_length).astype(np.float32)
+        freqs = np.fft.rfftfreq(self.frame_length, 1.0 / sample_rate)
+        self._band = (freqs >= 100) & (freqs <= 4000)
+
+    def frame_features(self, frames):
+        """
+        Compute per-frame features.
+
+        Args:
+            frames: float32 array of shape (n_frames, frame_length)
+
+        Returns:
+            (energy_db, zcr, flatness) arrays of shape (n_frames,)
+        """
+        energy_db = 10.0 * np.log10(np.mean(frames * frames, axis=1) + 1e-10)
+
+        signs = np.signbit(frames)
+        zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / float(self.frame_length)
+
+        power = np.abs(np.fft.rfft(frames * self._window, axis=1)[:, self._band]) ** 2 + 1e-12
+        flatness = np.exp(np.mean(np.log(power), axis=1)) / np.mean(power, axis=1)
+
+        return energy_db, zcr, flatness
+
+    def calibrate(self, samples):
+        """Seed the noise floor from audio known to contain no speech."""
+        frames = self._frames(to_float32(samples))
+        if len(frames):
+            energy_db, _, _ = self.frame_features(frames)
+            self.noise_floor_db = float(np.median(energy_db))
+
+    def threshold_db(self):
+        """Current energy threshold in dB for a frame to count as speech."""
+        floor_db = self.noise_floor.floor_db if self.noise_floor is not None else self.noise_floor_db
+        if floor_db is None:
+            return self.min_energy_db
+        return max(self.min_energy_db, floor_db + self.energy_margin_db)
+
+    def classify(self, frames):
+        """
+        Classify frames as speech (True) or non-speech (False).
+
+        Without a NoiseFloorTracker, non-speech frames update the noise
+        floor, so the detector follows slow changes in room noise.
+        """
+        energy_db, zcr, flatness = self.frame_features(frames)
+        if self.noise_floor is not None:
+            voiced = (zcr < self.max_zcr) | (flatness < self.max_flatness)
+            return (energy_db > self.threshold_db()) & voiced
+
+        if self.noise_floor_db is None and len(energy_db):
+            self.noise_floor_db = float(np.min(energy_db))
+
+        decisions = np.empty(len(frames), dtype=bool)
+        for i in range(len(frames)):
+            loud = energy_db[i] > self.threshold_db()
+            voiced = zcr[i] < self.max_zcr or flatness[i] < self.max_flatness
+            decisions[i] = loud and voiced
+            if not decisions[i]:
+                self.noise_floor_db += self.floor_adapt * (energy_db[i] - self.noise_floor_db)
+        return decisions
+
+    def _frames(self, samples):
+        n_frames = len(samples) // self.frame_length
+        return samples[:n_frames * self.frame_length].reshape(n_frames, self.frame_length)
+
+
+class UtteranceSegmenter:
+    """
+    Turns a stream of audio chunks into complete utterances.
+
+    An utterance opens after `onset_ms` of consecutive speech frames and
+    closes once `hangover_ms` of non-speech has followed it. `pre_roll_ms`
+    of audio before the onset is kept so soft word starts are not clipped.
+
+    Usage:
+        seg = UtteranceSegmenter(sample_rate=16000)
+        for chunk in chunks:
+            for utterance in seg.feed(chunk):
+                transcribe(utterance)
+    """
+
+    def __init__(self, sample_rate=16000, vad=None, onset_ms=90, hangover_ms=700,
+                 pre_roll_ms=300, max_duration=30.0):
+        self.sample_rate = sample_rate
+        self.vad = vad or VoiceActivityDetector(sample_rate=sample_rate)
+        frame_ms = self.vad.frame_ms
+        self.onset_frames = max(1, int(round(onset_ms / frame_ms)))
+        self.hangover_frames = max(1, int(round(hangover_ms / frame_ms)))
+        self.max_frames = int(max_duration * 1000 / frame_ms) if max_duration else None
+        self._pre_roll = deque(maxlen=max(self.onset_frames, int(round(pre_roll_ms / frame_ms))))
+        self._pending = np.zeros(0, dtype=np.int16)
+        self._utterance = []
+        self._speech_run = 0
+        self._silence_run = 0
+        self.in_speech = False
+
+    def feed(self, samples):
+        """
+        Feed int16 samples (array or bytes).
+
+        Returns:
+            List of completed utterances as int16 arrays (usually empty)
+        """
+        if isinstance(samples, (bytes, bytearray, memoryview)):
+            samples = np.frombuffer(samples, dtype=np.int16)
+        if len(self._pending):
+            samples = np.concatenate([self._pending, samples])
+
+        frame_length = self.vad.frame_length
+        n_frames = len(samples) // frame_length
+        self._pending = samples[n_frames * frame_length:].copy()
+        if n_frames == 0:
+            return []
+
+        frames = samples[:n_frames * frame_length].reshape(n_frames, frame_length)
+        decisions = self.vad.classify(to_float32(frames))
+
+        completed = []
+        for frame, is_speech in zip(frames, decisions):
+            if not self.in_speech:
+                self._pre_roll.append(frame)
+                self._speech_run = self._speech_run + 1 if is_speech else 0
+                if self._speech_run >= self.onset_frames:
+                    self.in_speech = True
+                    self._utterance = list(self._pre_roll)
+                    self._pre_roll.clear()
+                    self._silence_run = 0
+                continue
+
+            self._utterance.append(frame)
+            self._silence_run = 0 if is_speech else self._silence_run + 1
+            too_long = self.max_frames is not None and len(self._utterance) >= self.max_frames
+            if self._silence_run >= self.hangover_frames or too_long:
+                completed.append(self._close())
+
+        return completed
+
+    def current(self):
+        """The utterance captured so far, without closing it (or None)."""
+        if self.in_speech and self._utterance:
+            return np.concatenate(self._utterance)
+        return None
+
+    def flush(self):
+        """Close and return any utterance still in progress (or None)."""
+        if self.in_speech and self._utterance:
+            return self._close()
+        return None
+
+    def _close(self):
+        utterance = np.concatenate(self._utterance)
+        self._utterance = []
+        self._speech_run = 0
+        self._silence_run = 0
+        self.in_speech = False
+        return utterance
+
+
+class SpeechGate:
+    """
+    Decides whether a window of audio is worth sending to the recognizer.
+
+    The window is split into VAD frames and a speech probability is taken
+    as the highest fraction of speech frames over any `min_speech_ms` span,
+    so a single loud click does not open the gate but a short word does.
+    The detector's noise floor persists across windows, so the gate tracks
+    the room rather than re-deciding what "quiet" means every call.
+
+    Counters (`checked`, `gated`) show how many windows were skipped.
+    """
+
+    def __init__(self, sample_rate=16000, threshold=0.6, min_speech_ms=150, vad=None):
+        """
+        Args:
+            sample_rate: Input sample rate in Hz
+            threshold: Minimum speech probability for a window to pass
+            min_speech_ms: Span over which speech frames are averaged
+            vad: Optional VoiceActivityDetector to share a noise floor with
+        """
+        self.vad = vad or VoiceActivityDetector(sample_rate=sample_rate)
+        self.threshold = threshold
+        self.span_frames = max(1, int(round(min_speech_ms / self.vad.frame_ms)))
+        self.checked = 0
+        self.gated = 0
+        self.last_probability = 0.0
+
+    def speech_probability(self, samples):
+        """Speech probability (0-1) for a window of int16 or float32 audio."""
+        frames = self.vad._frames(to_float32(samples))
+        if len(frames) == 0:
+            return 0.0
+        decisions = self.vad.classify(frames).astype(np.float32)
+        span = min(self.span_frames, len(decisions))
+        sums = np.convolve(decisions, np.ones(span, dtype=np.float32), mode="valid")
+        return float(sums.max()) / span
+
+    def has_speech(self, samples):
+        """True if the window should be transcribed; updates the counters."""
+        self.last_probability = self.speech_probability(samples)
+        self.checked += 1
+        if self.last_probability < self.threshold:
+            self.gated += 1
+            return False
+        return True
+
+
+class RingBuffer:
+    """
+    Preallocated single-producer ring buffer addressed by absolute sample index.
+
+    The writer (an audio callback) copies samples in and only then advances
+    `write_pos`, so readers never take a lock: they read `write_pos`, copy
+    the range they want, and re-check `write_pos` afterwards to detect
+    whether the writer lapped them while copying (an overrun).
+    """
+
+    def __init__(self, capacity, dtype=np.int16):
+        self.capacity = int(capacity)
+        self.data = np.zeros(self.capacity, dtype=dtype)
+        self.write_pos = 0  # Total samples ever written (absolute index of the next sample)
+        self.max_write = 0  # Largest single write, i.e. how far an in-flight write can reach
+
+    def write(self, samples):
+        """Append samples, overwriting the oldest data once full."""
+        n = len(samples)
+        if n >= self.capacity:
+            samples = samples[-self.capacity:]
+            skipped = n - self.capacity
+            n = self.capacity
+        else:
+            skipped = 0
+        self.max_write = max(self.max_write, n)
+
+        start = (self.write_pos + skipped) % self.capacity
+        first = min(n, self.capacity - start)
+        self.data[start:start + first] = samples[:first]
+        if first < n:
+            self.data[:n - first] = samples[first:]
+
+        # Publish only after the copy so readers never see unwritten samples
+        self.write_pos += skipped + n
+
+    def oldest(self):
+        """Absolute index of the oldest sample still held."""
+        return max(0, self.write_pos - self.capacity)
+
+    def read(self, start, end):
+        """
+        Copy out samples [start, end) by absolute index.
+
+        Returns:
+            (data, start) where start may be later than requested if the
+            range was partly overwritten. `end` is clipped to what has been
+            written so far.
+        """
+        end = min(end, self.write_pos)
+        start = max(start, self.oldest())
+        if end <= start:
+            return self.data[:0].copy(), start
+
+        n = end - start
+        offset = start % self.capacity
+        first = min(n, self.capacity - offset)
+        out = np.empty(n, dtype=self.data.dtype)
+        out[:first] = self.data[offset:offset + first]
+        if first < n:
+            out[first:] = self.data[:n - first]
+
+        # The writer may have lapped us mid-copy (or be mid-write right now);
+        # drop anything that it could have overwritten
+        lapped = self.write_pos + self.max_write - self.capacity - start
+        if lapped > 0:
+            return out[lapped:], start + lapped
+        return out, start
+
+
+class AudioNormalizer:
+    """
+    Streaming DC removal and automatic gain control on float32 audio.
+
+    Works in 10 ms blocks, entirely in place:
+
+    - DC: a one-pole low-pass tracks the offset from block means and is
+      subtracted (i.e. a one-pole high-pass at ~`dc_cutoff_hz`)
+    - AGC: an RMS envelope with separate attack/release time constants
+      drives the gain toward `target_rms`, capped by `max_gain` and by a
+      peak envelope so loud speakers are turned down instead of clipped
+    - Gain changes are ramped across each block to avoid zipper noise
+
+    State carries over between calls, including a control block that is
+    split across two calls, so the trackers see the same control blocks as
+    they would for one long buffer. Feeding chunks whose lengths are
+    multiples of `block` samples gives exactly the same output; with other
+    lengths only the samples of a split block differ slightly, as they are
+    shaped from the part of the block seen so far. process() is thread-safe.
+    """
+
+    def __init__(self, sample_rate=16000, target_rms=0.1, max_gain=30.0, min_gain=0.25,
+                 attack_ms=10.0, release_ms=400.0, dc_cutoff_hz=20.0, peak_limit=0.98,
+                 silence_rms=3e-4, block_ms=10.0):
+        """
+        Args:
+            sample_rate: Input sample rate in Hz
+            target_rms: Desired speech RMS level (0.1 is about -20 dBFS)
+            max_gain: Upper bound on amplification (quiet mics like the C525)
+            min_gain: Lower bound on amplification (very hot mics)
+            attack_ms: Envelope rise time (how fast gain drops when speech gets louder)
+            release_ms: Envelope fall time (how fast gain recovers when speech gets quieter)
+            dc_cutoff_hz: Corner frequency of the DC-removal high-pass
+            peak_limit: Output peaks are kept below this level
+            silence_rms: Below this envelope level the gain is held instead of raised
+            block_ms: Control block size in milliseconds
+        """
+        self.sample_rate = sample_rate
+        self.block = max(1, int(sample_rate * block_ms / 1000))
+        block_seconds = float(self.block) / sample_rate
+        self.target_rms = target_rms
+        self.max_gain = max_gain
+        self.min_gain = min_gain
+        self.peak_limit = peak_limit
+        self.silence_rms = silence_rms
+        self._dc_coef = 1.0 - exp(-2.0 * pi * dc_cutoff_hz * block_seconds)
+        self._attack = 1.0 - exp(-block_seconds / (attack_ms / 1000.0))
+        self._release = 1.0 - exp(-block_seconds / (release_ms / 1000.0))
+
+        # Preallocated work buffers (grown on demand, never per call)
+        ramp = np.arange(1, self.block + 1, dtype=np.float32) / self.block
+        self._basis = np.stack([ramp, np.ones(self.block, dtype=np.float32)])
+        self._ramp = self._basis[0]
+        self._scratch = np.empty(self.block, dtype=np.float32)
+        self._buffer = np.empty(0, dtype=np.float32)
+        self._work2d = np.empty((0, self.block), dtype=np.float32)
+        # Per-block rows: mean, mean square, max, min, DC, gain step, gain (one extra column)
+        self._stats = np.empty((7, 1), dtype=np.float32)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Forget DC, envelope and gain state."""
+        self.dc = 0.0
+        self.rms_env = None
+        self.peak_env = 0.0
+        self.gain = 1.0
+        # Raw statistics of a control block split across process() calls
+        self._filled = 0
+        self._split_sum = 0.0
+        self._split_squares = 0.0
+        self._split_max = -np.inf
+        self._split_min = np.inf
+
+    def process(self, samples, sample_width=2, channels=1, out=None):
+        """
+        Normalize audio.
+
+        Args:
+            samples: int16 array, float32 array in [-1, 1], or raw PCM bytes
+            sample_width: Bytes per sample when `samples` is raw bytes
+            channels: Interleaved channel count (downmixed to mono)
+            out: Optional float32 array to write into. If omitted an internal
+                 buffer is reused, so the result is only valid until the next call.
+
+        Returns:
+            float32 mono array (a view of `out` or of the internal buffer)
+        """
+        with self._lock:
+            if isinstance(samples, np.ndarray) and samples.dtype.kind == "f":
+                frames = samples.reshape(-1, channels) if channels > 1 else samples.reshape(-1)
+                n = len(frames)
+                buf = self._output(n, out)
+                if channels > 1:
+                    downmix(frames, buf)
+                    buf *= 1.0 / channels
+                else:
+                    buf[...] = frames
+            else:
+                if isinstance(samples, np.ndarray):
+                    n = samples.size // channels
+                else:
+                    n = len(samples) // (sample_width * channels)
+                buf = pcm_to_float32(samples, sample_width, channels, out=self._output(n, out))
+
+            self._apply(buf)
+            np.clip(buf, -self.peak_limit, self.peak_limit, out=buf)
+            return buf
+
+    def _output(self, n, out):
+        if out is not None:
+            return out[:n]
+        if len(self._buffer) < n:
+            self._buffer = np.empty(max(n, 2 * len(self._buffer)), dtype=np.float32)
+        return self._buffer[:n]
+
+    def _apply(self, buf):
+        B = self.block
+        start = 0
+        if self._filled:
+            # Finish the control block the previous call left split
+            start = min(B - self._filled, len(buf))
+            self._split_block(buf[:start])
+        n_blocks = (len(buf) - start) // B
+        if n_blocks:
+            # Per-block statistics in one vectorized pass into reused buffers
+            blocks = buf[start:start + n_blocks * B].reshape(n_blocks, B)
+            work, stats = self._work(n_blocks)
+            means, squares, maxs, mins, dcs, steps = stats[:6, :n_blocks]
+            gains = stats[6]
+            np.add.reduce(blocks, axis=1, out=means)
+            means *= 1.0 / B
+            np.einsum("ij,ij->i", blocks, blocks, out=squares)
+            squares *= 1.0 / B
+            np.max(blocks, axis=1, out=maxs)
+            np.min(blocks, axis=1, out=mins)
+
+            # Cheap scalar recursion over blocks for the DC and gain trackers
+            # (memoryviews index to Python floats without a tolist() copy)
+            mean_at, square_at, max_at, min_at = (memoryview(row) for row in (means, squares, maxs, mins))
+            dc_at, gain_at = memoryview(dcs), memoryview(gains)
+            gain_at[0] = self.gain
+            for i in range(n_blocks):
+                gain_at[i + 1] = self._track_block(mean_at[i], square_at[i], max_at[i], min_at[i])
+                dc_at[i] = self.dc
+
+            # Apply DC removal and per-block gain ramps in place. Per-block
+            # values are spread along rows by assignment and einsum: broadcasting
+            # ufuncs would allocate NumPy iterator buffers on every call.
+            work[...] = dcs[:, None]
+            blocks -= work
+            np.subtract(gains[1:], gains[:-1], out=steps)
+            # Row i = steps[i] * ramp + gains[i]
+            np.einsum("ki,kj->ij", stats[5:, :n_blocks], self._basis, out=work)
+            blocks *= work
+
+        tail = buf[start + n_blocks * B:]
+        if len(tail):
+            self._split_block(tail)
+
+    def _work(self, n_blocks):
+        if len(self._work2d) < n_blocks:
+            capacity = max(n_blocks, 2 * len(self._work2d))
+            self._work2d = np.empty((capacity, self.block), dtype=np.float32)
+            self._stats = np.empty((7, capacity + 1), dtype=np.float32)
+        return self._work2d[:n_blocks], self._stats[:, :n_blocks + 1]
+
+    def _track_block(self, mean, square, peak_max, peak_min, track_dc=True):
+        """Advance the trackers by one block's raw statistics and return the new gain."""
+        if track_dc:
+            self.dc += self._dc_coef * (mean - self.dc)
+        dc = self.dc
+        # RMS and peak of (block - dc) derived from the raw statistics
+        rms = sqrt(max(square - 2.0 * dc * mean + dc * dc, 0.0))
+        peak = max(peak_max - dc, dc - peak_min)
+        return self._update_gain(rms, peak)
+
+    def _update_gain(self, rms, peak):
+        """Advance the envelopes by one block and return the new gain."""
+        if self.rms_env is None:
+            self.rms_env = rms
+        coef = self._attack if rms > self.rms_env else self._release
+        self.rms_env += coef * (rms - self.rms_env)
+        coef = self._attack if peak > self.peak_env else self._release
+        self.peak_env += coef * (peak - self.peak_env)
+
+        # Hold gain through silence so background noise is not pumped up
+        if self.rms_env >= self.silence_rms:
+            desired = self.target_rms / self.rms_env
+            desired = min(max(desired, self.min_gain), self.max_gain)
+            if self.peak_env > 0:
+                desired = min(desired, self.peak_limit / self.peak_env)
+        else:
+            desired = self.gain
+        self.gain = desired
+        return desired
+
+    def _split_block(self, seg):
+        """Process part of a control block that straddles process() calls."""
+        n = len(seg)
+        begin = self._filled
+        self._filled += n
+        self._split_sum += float(seg.sum())
+        self._split_squares += float(np.dot(seg, seg))
+        self._split_max = max(self._split_max, float(seg.max()))
+        self._split_min = min(self._split_min, float(seg.min()))
+
+        saved = (self.rms_env, self.peak_env, self.gain)
+        previous = self.gain
+        filled = self._filled
+        complete = filled == self.block
+        # Until the whole block has been seen, hold the DC estimate (a partial
+        # mean is too noisy) and aim the gain at a provisional target
+        desired = self._track_block(self._split_sum / filled, self._split_squares / filled,
+                                    self._split_max, self._split_min, track_dc=complete)
+        seg -= self.dc
+        if not complete:
+            self.rms_env, self.peak_env, self.gain = saved
+        else:
+            self._filled = 0
+            self._split_sum = self._split_squares = 0.0
+            self._split_max, self._split_min = -np.inf, np.inf
+
+        # This segment's part of the block's ramp from the previous gain
+        scratch = self._scratch[:n]
+        np.multiply(self._ramp[begin:filled], desired - previous, out=scratch)
+        scratch += previous
+        seg *= scratch
+
+
+class NoiseSuppressor:
+    """
+    Streaming STFT noise suppression (decision-directed Wiener filter).
+
+    Audio is analysed in `frame_ms` frames with 50% overlap under a
+    square-root Hann window, so overlap-add resynthesis is exact wherever
+    nothing is attenuated. A per-bin noise power estimate follows the
+    running spectrum: bins close to the estimate (no speech) pull it along
+    quickly, bins well above it only let it creep up, so steady fan and
+    HVAC noise is learned within a fraction of a second while speech does
+    not leak into it. Each bin is then scaled by a Wiener gain from its
+    a-priori SNR, floored at `gain_floor` so residual noise stays smooth
+    instead of turning into "musical" tones.
+
+    process() streams: output lags input by one hop (16 ms at the
+    defaults). denoise() filters a whole clip with the lag removed and
+    keeps the learned noise estimate for the next clip. Thread-safe.
+    """
+
+    def __init__(self, sample_rate=16000, frame_ms=32, gain_floor=0.1, smoothing=0.98,
+                 noise_adapt=0.1, speech_ratio_db=6.0, noise_rise_db=3.0):
+        """
+        Args:
+            sample_rate: Input sample rate in Hz
+            frame_ms: Analysis frame length (rounded to a power of two in samples)
+            gain_floor: Lowest gain applied to any bin (0.1 = -20 dB)
+            smoothing: Decision-directed weight of the previous frame's clean power
+            noise_adapt: How fast the noise estimate follows non-speech bins (0-1)
+            speech_ratio_db: Bins this far above the noise estimate are treated as speech
+            noise_rise_db: dB per second the estimate may rise under speech-like bins
+        """
+        self.sample_rate = sample_rate
+        self.frame_length = 2 ** int(round(np.log2(sample_rate * frame_ms / 1000.0)))
+        self.hop = self.frame_length // 2
+        self.gain_floor = gain_floor
+        self.smoothing = smoothing
+        self.noise_adapt = noise_adapt
+        self._speech_ratio = 10.0 ** (speech_ratio_db / 10.0)
+        self._rise = 10.0 ** (noise_rise_db * self.hop / sample_rate / 10.0)
+        self._window = np.sqrt(np.hanning(self.frame_length + 1)[:-1]).astype(np.float32)
+        self.noise_power = None
+        self._lock = threading.RLock()
+        self.reset()
+
+    @property
+    def latency(self):
+        """Seconds by which process() output lags its input."""
+        return float(self.hop) / self.sample_rate
+
+    def reset(self):
+        """Clear the overlap state between unrelated clips (the noise estimate is kept)."""
+        with self._lock:
+            self._input = np.zeros(self.hop, dtype=np.float32)
+            self._overlap = np.zeros(self.hop, dtype=np.float32)
+            self._pending = np.zeros(0, dtype=np.float32)
+            self._clean_power = None
+
+    def process(self, samples):
+        """
+        Filter the next chunk of a stream.
+
+        Args:
+            samples: int16 or float32 samples (array or bytes), any length
+
+        Returns:
+            float32 array of filtered audio, one hop behind the input
+            (a multiple of the hop size; leftover samples wait for the next call)
+        """
+        with self._lock:
+            x = to_float32(samples)
+            if len(self._pending):
+                x = np.concatenate([self._pending, x])
+            n_hops = len(x) // self.hop
+            self._pending = x[n_hops * self.hop:].copy()
+            if n_hops == 0:
+                return np.zeros(0, dtype=np.float32)
+
+            signal = np.concatenate([self._input, x[:n_hops * self.hop]])
+            self._input = signal[-self.hop:].copy()
+            frames = np.lib.stride_tricks.sliding_window_view(signal, self.frame_length)[::self.hop]
+
+            spectra = np.fft.rfft(frames * self._window, axis=1)
+            power = spectra.real ** 2 + spectra.imag ** 2
+            spectra *= self._gains(power)
+            out_frames = np.fft.irfft(spectra, n=self.frame_length, axis=1).astype(np.float32)
+            out_frames *= self._window
+
+            # 50% overlap-add: each hop is the first half of its frame plus
+            # the second half of the frame before it
+            out = out_frames[:, :self.hop].copy()
+            out[0] += self._overlap
+            out[1:] += out_frames[:-1, self.hop:]
+            self._overlap = out_frames[-1, self.hop:].copy()
+            return out.reshape(-1)
+
+    def denoise(self, samples):
+        """Filter a complete clip; the result is aligned with and as long as the input."""
+        x = to_float32(samples)
+        with self._lock:
+            self.reset()
+            out = self.process(np.concatenate([x, np.zeros(self.frame_length, dtype=np.float32)]))
+            self.reset()
+        return out[self.hop:self.hop + len(x)]
+
+    def _gains(self, power):
+        """Update the noise estimate frame by frame and return per-bin Wiener gains."""
+        gains = np.empty(power.shape, dtype=np.float32)
+        noise = power[0].copy() if self.noise_power is None else self.noise_power
+        clean = self._clean_power
+        for i, frame_power in enumerate(power):
+            speech = frame_power > noise * self._speech_ratio
+            noise = np.where(speech, noise * self._rise,
+                             noise + self.noise_adapt * (frame_power - noise))
+            noise = np.maximum(noise, 1e-12)
+
+            snr_post = np.maximum(frame_power / noise - 1.0, 0.0)
+            if clean is None:
+                snr_prior = snr_post
+            else:
+                snr_prior = self.smoothing * clean / noise + (1.0 - self.smoothing) * snr_post
+            gain = np.maximum(snr_prior / (1.0 + snr_prior), self.gain_floor)
+            clean = gain * gain * frame_power
+            gains[i] = gain
+
+        self.noise_power = noise
+        self._clean_power = clean
+        return gains
+
+
+class PlaybackReference:
+    """
+    What the speakers played recently, on the time.monotonic() clock.
+
+    The playback path add()s each chunk with the time it reaches the DAC;
+    an echo canceller reads back the span that lines up with a microphone
+    chunk. Chunks that arrive within `snap_ms` of where the previous one
+    ended are joined end to end, so callback jitter does not tear the
+    signal. Spans where nothing was playing read as zeros. Thread-safe.
+    """
+
+    def __init__(self, sample_rate=16000, keep_seconds=10.0, snap_ms=20):
+        """
+        Args:
+            sample_rate: Rate the reference is stored and read at
+            keep_seconds: How much played audio is retained
+            snap_ms: Timing error below which consecutive chunks are treated as contiguous
+        """
+        self.sample_rate = sample_rate
+        self.snap = int(sample_rate * snap_ms / 1000)
+        self._keep = int(sample_rate * keep_seconds)
+        self._epoch = time.monotonic()
+        self._segments = deque()  # (absolute start index, float32 samples)
+        self._end = None          # Absolute index just past the latest played sample
+        self._lock = threading.Lock()
+
+    def index_at(self, timestamp):
+        """Absolute reference index of a time.monotonic() timestamp."""
+        return int(round((timestamp - self._epoch) * self.sample_rate))
+
+    @property
+    def end_time(self):
+        """time.monotonic() at which the latest played audio ends (None if nothing played)."""
+        end = self._end
+        return None if end is None else self._epoch + float(end) / self.sample_rate
+
+    def add(self, samples, start_time):
+        """
+        Record audio handed to the speakers.
+
+        Args:
+            samples: int16 or float32 samples at `sample_rate`
+            start_time: time.monotonic() at which the first sample is heard
+        """
+        samples = np.array(to_float32(samples), dtype=np.float32)
+        if not len(samples):
+            return
+        with self._lock:
+            start = self.index_at(start_time)
+            if self._end is not None and abs(start - self._end) <= self.snap:
+                start = self._end
+            self._segments.append((start, samples))
+            self._end = max(self._end or 0, start + len(samples))
+            while self._segments and self._segments[0][0] + len(self._segments[0][1]) < self._end - self._keep:
+                self._segments.popleft()
+
+    def truncate(self, end_time):
+        """Forget audio scheduled after `end_time` (playback was cut off before it was heard)."""
+        with self._lock:
+            end = self.index_at(end_time)
+            if self._end is None or end >= self._end:
+                return
+            while self._segments and self._segments[-1][0] >= end:
+                self._segments.pop()
+            if self._segments:
+                seg_start, seg = self._segments[-1]
+                self._segments[-1] = (seg_start, seg[:max(0, end - seg_start)])
+                self._end = seg_start + len(self._segments[-1][1])
+            else:
+                self._end = end
+
+    def read(self, start, n):
+        """Played samples [start, start + n) by absolute index, zeros where nothing played."""
+        out = np.zeros(n, dtype=np.float32)
+        end = start + n
+        with self._lock:
+            for seg_start, seg in self._segments:
+                lo = max(start, seg_start)
+                hi = min(end, seg_start + len(seg))
+                if lo < hi:
+                    out[lo - start:hi - start] = seg[lo - seg_start:hi - seg_start]
+        return out
+
+
+_playback_reference = None
+
+
+def playback_reference(sample_rate=None):
+    """
+    The process-wide PlaybackReference shared by playback and capture.
+
+    Args:
+        sample_rate: Rate the caller needs; a reference at another rate is
+                     replaced (None = whatever exists, 16 kHz when new)
+    """
+    global _playback_reference
+    if _playback_reference is None or (sample_rate and sample_rate != _playback_reference.sample_rate):
+        _playback_reference = PlaybackReference(sample_rate=sample_rate or 16000)
+    return _playback_reference
+
+
+class EchoCanceller:
+    """
+    Acoustic echo canceller: partitioned-block frequency-domain NLMS.
+
+    The echo path from loudspeaker to microphone is modelled as an FIR
+    filter `tail_ms` long, split into partitions of one block each and
+    applied with overlap-save FFTs, so each block costs a fixed number of
+    FFTs of twice the block length however long the tail is. The estimated
+    echo is subtracted from the microphone signal and the residual drives a
+    normalized (per-bin) LMS update of every partition.
+
+    Once the filter is removing echo, a block whose echo reduction falls
+    well short of the running average is treated as the near-end talker
+    speaking over the playback (double talk) and does not adapt the
+    filter, so the user's voice is not learned as echo. Blocks without
+    reference signal pass through unchanged apart from any echo still
+    ringing in the tail. `residual_db` tracks how loud the echo left after
+    cancellation is, for detectors that must not mistake it for the user.
+
+    process() returns exactly as many samples as it is given, with no
+    added delay: a trailing partial block is filtered with the current
+    estimate and adapts once the rest of it arrives.
+    """
+
+    def __init__(self, sample_rate=16000, block_ms=16, tail_ms=256, step=0.8,
+                 double_talk_db=6.0):
+        """
+        Args:
+            sample_rate: Rate of both signals in Hz
+            block_ms: Block length (rounded to a power of two in samples)
+            tail_ms: Longest echo path the filter can model
+            step: NLMS step size (0-1; smaller adapts slower but is steadier)
+            double_talk_db: How far a block's echo reduction may fall below the
+                            running average before it counts as near-end speech
+        """
+        self.sample_rate = sample_rate
+        self.block = 2 ** int(round(np.log2(sample_rate * block_ms / 1000.0)))
+        self.partitions = max(1, int(np.ceil(sample_rate * tail_ms / 1000.0 / self.block)))
+        self.step = step
+        self.double_talk_db = double_talk_db
+        bins = self.block + 1
+        self._weights = np.zeros((self.partitions, bins), dtype=np.complex128)
+        # Regularization: input power of a -60 dBFS signal per bin
+        self._delta = 2.0 * self.block * 1e-6
+        self.erle_db = 0.0       # Smoothed echo return loss enhancement
+        self.residual_db = None  # Recent peak level of the echo left after cancellation
+        self.restart()
+
+    @property
+    def tail_seconds(self):
+        return float(self.partitions * self.block) / self.sample_rate
+
+    def restart(self):
+        """Forget the signal history between playback sessions (the echo path estimate is kept)."""
+        self._spectra = np.zeros((self.partitions, self.block + 1), dtype=np.complex128)
+        self._previous = np.zeros(self.block, dtype=np.float64)
+        self._pending_mic = np.zeros(0, dtype=np.float64)
+        self._pending_ref = np.zeros(0, dtype=np.float64)
+        self._double_talk_blocks = 0
+
+    def reset(self):
+        """Forget the echo path as well (e.g. after moving the speakers)."""
+        self._weights[:] = 0
+        self.erle_db = 0.0
+        self.residual_db = None
+        self.restart()
+
+    def process(self, mic, reference):
+        """
+        Remove the echo of `reference` from `mic`.
+
+        Args:
+            mic: int16 or float32 microphone samples
+            reference: float32 loudspeaker samples aligned with `mic`, same length
+
+        Returns:
+            float32 array, same length as `mic`
+        """
+        d_new = to_float32(mic).astype(np.float64)
+        x_new = np.asarray(reference, dtype=np.float64)
+        skip = len(self._pending_mic)
+        d = np.concatenate([self._pending_mic, d_new])
+        x = np.concatenate([self._pending_ref, x_new])
+        out = np.empty(len(d), dtype=np.float32)
+
+        B = self.block
+        n_blocks = len(d) // B
+        for i in range(n_blocks):
+            out[i * B:(i + 1) * B] = self._process_block(d[i * B:(i + 1) * B], x[i * B:(i + 1) * B])
+
+        # Trailing partial block: the filter is causal, so the echo estimate
+        # for the samples we have does not depend on the reference still to come
+        tail = n_blocks * B
+        self._pending_mic = d[tail:].copy()
+        self._pending_ref = x[tail:].copy()
+        if tail < len(d):
+            m = len(d) - tail
+            block = np.zeros(B)
+            block[:m] = x[tail:]
+            spectrum = np.fft.rfft(np.concatenate([self._previous, block]))
+            echo = np.einsum("pk,pk->k", self._weights[1:], self._spectra[:-1]) + self._weights[0] * spectrum
+            out[tail:] = d[tail:] - np.fft.irfft(echo, n=2 * B)[B:B + m]
+        return out[skip:]
+
+    def _process_block(self, d, x):
+        B = self.block
+        spectrum = np.fft.rfft(np.concatenate([self._previous, x]))
+        self._previous = x.copy()
+        self._spectra = np.roll(self._spectra, 1, axis=0)
+        self._spectra[0] = spectrum
+
+        echo = np.fft.irfft(np.einsum("pk,pk->k", self._weights, self._spectra), n=2 * B)[B:]
+        e = d - echo
+
+        if float(np.dot(x, x)) > self._delta:
+            error_power = float(np.dot(e, e))
+            erle = 10.0 * np.log10((float(np.dot(d, d)) + 1e-12) / (error_power + 1e-12))
+            if self.erle_db > 6.0 and erle < self.erle_db - self.double_talk_db:
+                # Echo reduction that stays poor for seconds means the echo
+                # path changed (speakers moved), not that someone is talking
+                self._double_talk_blocks += 1
+                if self._double_talk_blocks * B > 2 * self.sample_rate:
+                    self.erle_db = 0.0
+            else:
+                self._double_talk_blocks = 0
+                self.erle_db = 0.9 * self.erle_db + 0.1 * erle
+                # Peak-following: rises at once with louder echo, decays slowly
+                residual_db = 10.0 * np.log10(error_power / B + 1e-10)
+                if self.residual_db is None or residual_db > self.residual_db:
+                    self.residual_db = residual_db
+                else:
+                    self.residual_db = 0.95 * self.residual_db + 0.05 * residual_db
+                self._adapt(e)
+        return e
+
+    def _adapt(self, e):
+        B = self.block
+        error_spectrum = np.fft.rfft(np.concatenate([np.zeros(B), e]))
+        power = np.sum(self._spectra.real ** 2 + self._spectra.imag ** 2, axis=0) + self._delta
+        gradient = np.conj(self._spectra) * (error_spectrum * (self.step / power))
+        # Gradient constraint: keep each partition a causal B-tap filter
+        taps = np.fft.irfft(gradient, n=2 * B, axis=1)
+        taps[:, B:] = 0.0
+        self._weights += np.fft.rfft(taps, axis=1)
+
+
+_mel_cache = {}
+
+
+def mel_filterbank(sample_rate, n_fft, n_mels=40, fmin=20.0, fmax=None):
+    """
+    Triangular mel filterbank (HTK mel scale), cached per configuration.
+
+    Returns:
+        float32 array of shape (n_mels, n_fft // 2 + 1)
+    """
+    fmax = fmax or sample_rate / 2.0
+    key = (sample_rate, n_fft, n_mels, fmin, fmax)
+    if key not in _mel_cache:
+        def to_mel(f):
+            return 2595.0 * np.log10(1.0 + f / 700.0)
+
+        def to_hz(m):
+            return 700.0 * (10.0 ** (m / 2595.0) - 1.0)
+
+        edges = to_hz(np.linspace(to_mel(fmin), to_mel(fmax), n_mels + 2))
+        freqs = np.fft.rfftfreq(n_fft, 1.0 / sample_rate)
+        lower, centre, upper = edges[:-2, None], edges[1:-1, None], edges[2:, None]
+        rising = (freqs - lower) / (centre - lower)
+        falling = (upper - freqs) / (upper - centre)
+        _mel_cache[key] = np.maximum(0.0, np.minimum(rising, falling)).astype(np.float32)
+    return _mel_cache[key]
+
+
+class MfccExtractor:
+    """
+    Log-mel and MFCC features for keyword spotting.
+
+    All frames of a clip are analysed in one vectorized pass: strided
+    framing, one batched real FFT, a matrix product with the mel filterbank
+    and another with a precomputed DCT-II matrix.
+    """
+
+    def __init__(self, sample_rate=16000, frame_ms=25, hop_ms=10, n_mels=40, n_mfcc=13,
+                 preemphasis=0.97):
+        """
+        Args:
+            sample_rate: Input sample rate in Hz
+            frame_ms: Analysis frame length in milliseconds
+            hop_ms: Frame step in milliseconds
+            n_mels: Number of mel bands
+            n_mfcc: Number of cepstral coefficients (including c0)
+            preemphasis: First-order pre-emphasis coefficient (0 disables)
+        """
+        self.sample_rate = sample_rate
+        self.frame_length = int(sample_rate * frame_ms / 1000)
+        self.hop_length = int(sample_rate * hop_ms / 1000)
+        self.n_fft = 1 << (self.frame_length - 1).bit_length()
+        self.preemphasis = preemphasis
+
+        self._window = np.hamming(self.frame_length).astype(np.float32)
+        self._mel = mel_filterbank(sample_rate, self.n_fft, n_mels).T.copy()
+        k = np.arange(n_mels)
+        self._dct = (np.cos(pi / n_mels * (k[:, None] + 0.5) * np.arange(n_mfcc)[None, :])
+                     * sqrt(2.0 / n_mels)).astype(np.float32)
+
+    def log_mel(self, samples):
+        """
+        Log mel energies.
+
+        Args:
+            samples: int16 or float32 mono audio
+
+        Returns:
+            float32 array of shape (n_frames, n_mels)
+        """
+        samples = to_float32(samples)
+        if len(samples) < self.frame_length:
+            return np.zeros((0, self._mel.shape[1]), dtype=np.float32)
+        if self.preemphasis:
+            samples = np.append(samples[:1], samples[1:] - self.preemphasis * samples[:-1])
+        frames = np.lib.stride_tricks.sliding_window_view(samples, self.frame_length)[::self.hop_length]
+        power = np.abs(np.fft.rfft(frames * self._window, n=self.n_fft, axis=1)) ** 2
+        return np.log(power.astype(np.float32) @ self._mel + 1e-6)
+
+    def mfcc(self, samples):
+        """
+        MFCCs for a clip.
+
+        Returns:
+            float32 array of shape (n_frames, n_mfcc); column 0 is overall log energy
+        """
+        return self.log_mel(samples) @ self._dct
@@ -0,0 +1,565 @@
+#!/usr/bin/env python3
+"""
+Evie Benchmarks - Micro-benchmarks for the voice pipeline
+
+Measures the cost of individual pipeline stages on synthetic audio, so
+results are repeatable and need no microphone.
+
+Usage:
+    python evie-benchmark.py normalize                       # Normalization cost (16 kHz mono)
+    python evie-benchmark.py normalize --rate 48000 --channels 2
+    python evie-benchmark.py normalize --seconds 30 --repeat 20
+    python evie-benchmark.py models --sizes tiny base        # Serial vs parallel model loading
+    python evie-benchmark.py stt --clips clips/ --backends whisper faster-whisper
+    python evie-benchmark.py denoise --snr 5                 # Noise suppression cost and SNR gain
+    python evie-benchmark.py denoise --clips clips/ --models tiny base
+    python evie-benchmark.py listen --source clips/,gap=1.5   # End of speech to transcript, replayed clips
+    python evie-benchmark.py bus --readers 4                 # Shared-memory audio bus, 4 reader processes
+    python evie-benchmark.py bus --readers 8 --speed 0       # ...writing as fast as possible
+    python evie-benchmark.py tts --chars 500                 # Time to first audio, buffered vs streamed (network)
+    python evie-benchmark.py tts --calls 20                  # ...plus per-call cost with/without the TTS engine
+
+The stt and denoise benchmarks read WAV files from --clips; a .txt file with
+the same name next to a clip is used as its reference transcript for word
+error rate.
+"""
+
+import argparse
+import asyncio
+import io
+import re
+import sys
+import time
+import tracemalloc
+import wave
+from pathlib import Path
+
+import numpy as np
+
+SCRIPT_DIR = Path(__file__).parent
+
+
+def load_module(module_file):
+    """Load a Python module from a file with dashes in the name."""
+    import importlib.util
+    module_name = module_file.stem.replace("-", "_")
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, module_file)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+evie_audio = load_module(SCRIPT_DIR / "evie-audio.py")
+
+
+def synthetic_speech(seconds, rate=16000, channels=1, level=0.02, seed=0):
+    """
+    Speech-like int16 test signal: a voiced harmonic stack with syllable-rate
+    amplitude modulation, some background noise and a DC offset (like the C525).
+    """
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * rate)) / rate
+    pitch = 140 + 20 * np.sin(2 * np.pi * 0.5 * t)
+    phase = 2 * np.pi * np.cumsum(pitch) / rate
+    voiced = sum(np.sin(k * phase) / k for k in range(1, 8))
+    envelope = np.clip(np.sin(2 * np.pi * 3 * t), 0, None)
+    signal = level * (voiced * envelope + 0.05 * rng.standard_normal(len(t))) + 0.01
+    pcm = np.clip(signal * 32767, -32768, 32767).astype(np.int16)
+    if channels > 1:
+        pcm = np.repeat(pcm[:, None], channels, axis=1).reshape(-1)
+    return pcm
+
+
+def measure(fn, repeat):
+    """
+    Run fn() `repeat` times.
+
+    Returns:
+        (median seconds per call, peak bytes allocated during one call)
+    """
+    fn()  # Warm caches and grow any preallocated buffers
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return float(np.median(times)), peak
+
+
+def legacy_normalize_audio(wav_data, gain=10.0):
+    """The original normalize_audio: float64 copy, fixed gain, WAV round-trip."""
+    with io.BytesIO(wav_data) as wav_io:
+        with wave.open(wav_io, 'rb') as wav:
+            channels = wav.getnchannels()
+            sample_width = wav.getsampwidth()
+            framerate = wav.getframerate()
+            raw_data = wav.readframes(wav.getnframes())
+    samples = np.frombuffer(raw_data, dtype=np.int16).copy().astype(np.float64)
+    samples = samples - samples.mean()
+    samples = samples * gain
+    samples = np.clip(samples, -32768, 32767).astype(np.int16)
+    output = io.BytesIO()
+    with wave.open(output, 'wb') as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(sample_width)
+        wav.setframerate(framerate)
+        wav.writeframes(samples.tobytes())
+    return output.getvalue()
+
+
+def bench_normalize(args):
+    """Compare the legacy WAV normalizer with the in-place float32 AGC stage."""
+    pcm = synthetic_speech(args.seconds, args.rate, args.channels)
+    n_frames = len(pcm) // args.channels
+
+    wav_io = io.BytesIO()
+    with wave.open(wav_io, 'wb') as wav:
+        wav.setnchannels(args.channels)
+        wav.setsampwidth(2)
+        wav.setframerate(args.rate)
+        wav.writeframes(pcm.tobytes())
+    wav_data = wav_io.getvalue()
+
+    normalizer = evie_audio.AudioNormalizer(sample_rate=args.rate)
+    out = np.empty(n_frames, dtype=np.float32)
+
+    cases = [
+        ("legacy normalize_audio (WAV, float64)", lambda: legacy_normalize_audio(wav_data)),
+        ("AudioNormalizer (new output array)",
+         lambda: normalizer.process(pcm, channels=args.channels, out=np.empty(n_frames, np.float32))),
+        ("AudioNormalizer (preallocated)",
+         lambda: normalizer.process(pcm, channels=args.channels, out=out)),
+    ]
+
+    print(f"\nNormalization: {args.seconds:g}s of {args.rate} Hz audio, "
+          f"{args.channels} channel(s), median of {args.repeat}")
+    print("-" * 72)
+    print(f"  {'stage':<40} {'us/audio-s':>12} {'bytes alloc':>14}")
+    for name, fn in cases:
+        seconds, peak = measure(fn, args.repeat)
+        print(f"  {name:<40} {seconds * 1e6 / args.seconds:>12.1f} {peak:>14,}")
+    print("  (preallocated: only array views, plus NumPy's fixed ~32 KB cast buffer\n"
+          "   when downmixing integer channels; nothing scales with the audio length)")
+    print()
+
+
+def bench_models(args):
+    """Time serial against parallel (background) loading of Whisper models."""
+    evie_listen = load_module(SCRIPT_DIR / "evie-listen.py")
+
+    # Serial: what startup used to do
+    serial = evie_listen.WhisperModelManager(warmup=not args.no_warmup)
+    start = time.perf_counter()
+    for size in args.sizes:
+        serial.get(size)
+    serial_seconds = time.perf_counter() - start
+    del serial
+
+    parallel = evie_listen.WhisperModelManager(warmup=not args.no_warmup)
+    start = time.perf_counter()
+    parallel.preload(args.sizes)
+    first_ready = None
+    while first_ready is None:
+        first_ready = next((s for s in args.sizes if parallel.ready(s)), None)
+        time.sleep(0.01)
+    first_seconds = time.perf_counter() - start
+    for size in args.sizes:
+        parallel.get(size)
+    parallel_seconds = time.perf_counter() - start
+
+    print(f"\nModel loading: {', '.join(args.sizes)}")
+    print("-" * 72)
+    print(f"  serial load, all ready          {serial_seconds:8.2f}s")
+    print(f"  parallel load, first usable     {first_seconds:8.2f}s  ({first_ready})")
+    print(f"  parallel load, all ready        {parallel_seconds:8.2f}s")
+    print()
+    print(f"  {'model':<10} {'resident MB':>12} {'load s':>8} {'warm-up s':>10}")
+    for size, entry in parallel.report().items():
+        print(f"  {size:<10} {entry['resident_mb']:>12.0f} {entry['load_seconds']:>8.2f} "
+              f"{entry['warmup_seconds']:>10.2f}")
+    print()
+
+
+def load_clip(path, rate=16000):
+    """Read a WAV file as normalized float32 mono at `rate`, like live capture."""
+    with wave.open(str(path), 'rb') as wav:
+        channels = wav.getnchannels()
+        sample_width = wav.getsampwidth()
+        framerate = wav.getframerate()
+        raw = wav.readframes(wav.getnframes())
+    samples = evie_audio.AudioNormalizer(sample_rate=framerate).process(
+        raw, sample_width=sample_width, channels=channels,
+        out=np.empty(len(raw) // (sample_width * channels), dtype=np.float32))
+    return evie_audio.resample(samples, framerate, rate)
+
+
+def fan_noise(n, rate=16000, seed=1):
+    """Unit-RMS fan/HVAC-like noise: low-passed broadband rumble plus mains hum harmonics."""
+    rng = np.random.default_rng(seed)
+    white = rng.standard_normal(n)
+    # One-pole low-pass at ~400 Hz, done in the frequency domain to avoid a Python loop
+    freqs = np.fft.rfftfreq(n, 1.0 / rate)
+    rumble = np.fft.irfft(np.fft.rfft(white) / np.sqrt(1.0 + (freqs / 400.0) ** 2), n=n)
+    t = np.arange(n) / rate
+    hum = sum(np.sin(2 * np.pi * 100 * k * t + k) / k for k in range(1, 4))
+    noise = rumble / rumble.std() + 0.3 * hum
+    return (noise / noise.std()).astype(np.float32)
+
+
+def add_noise(signal, noise, snr_db):
+    """Mix `noise` into `signal` at the given signal-to-noise ratio."""
+    scale = np.sqrt(np.mean(signal ** 2) / np.mean(noise ** 2)) * 10.0 ** (-snr_db / 20.0)
+    return (signal + scale * noise[:len(signal)]).astype(np.float32)
+
+
+def snr_db(reference, signal):
+    """SNR of `signal` against the clean `reference`, in dB."""
+    error = signal - reference
+    return 10.0 * np.log10(np.sum(reference ** 2) / max(np.sum(error ** 2), 1e-12))
+
+
+def word_error_rate(reference, hypothesis):
+    """Word-level edit distance divided by the reference length (case and punctuation ignored)."""
+    def words(text):
+        return re.sub(r"[^\w\s']", " ", text.lower()).split()
+
+    ref, hyp = words(reference), words(hypothesis)
+    if not ref:
+        return 0.0 if not hyp else 1.0
+    row = list(range(len(hyp) + 1))
+    for i, r in enumerate(ref, 1):
+        previous, row[0] = row[0], i
+        for j, h in enumerate(hyp, 1):
+            previous, row[j] = row[j], min(row[j] + 1, row[j - 1] + 1, previous + (r != h))
+    return row[-1] / float(len(ref))
+
+
+def bench_stt(args):
+    """Latency and word error rate of each STT backend on the same clips."""
+    evie_stt = load_module(SCRIPT_DIR / "evie-stt.py")
+    paths = sorted(Path(args.clips).glob("*.wav"))
+    if not paths:
+        print(f"No .wav files in {args.clips}")
+        return
+    clips = [(p, load_clip(p)) for p in paths]
+    references = {p: p.with_suffix(".txt").read_text(encoding="utf-8").strip()
+                  for p, _ in clips if p.with_suffix(".txt").exists()}
+    audio_seconds = sum(len(c) for _, c in clips) / 16000.0
+
+    print(f"\nSTT backends: {len(clips)} clip(s), {audio_seconds:.1f}s of audio, "
+          f"model '{args.model}', median of {args.repeat}")
+    print("-" * 72)
+    print(f"  {'backend':<16} {'load s':>8} {'median ms':>10} {'RTF':>8} {'WER':>8}")
+
+    per_clip = {}
+    for name in args.backends:
+        backend = evie_stt.get_backend(name)
+        start = time.perf_counter()
+        model = backend.load(args.model)
+        load_seconds = time.perf_counter() - start
+        backend.transcribe(model, np.zeros(16000, dtype=np.float32))  # Warm-up
+
+        latencies, total, errors, ref_words = [], 0.0, 0.0, 0
+        for path, samples in clips:
+            times = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                text = backend.transcribe(model, samples)["text"].strip()
+                times.append(time.perf_counter() - start)
+            latency = float(np.median(times))
+            latencies.append(latency)
+            total += latency
+            wer = None
+            if path in references:
+                n = len(references[path].split())
+                wer = word_error_rate(references[path], text)
+                errors += wer * n
+                ref_words += n
+            per_clip.setdefault(path.name, []).append((name, latency, wer, text))
+
+        wer_text = f"{errors / ref_words:>8.1%}" if ref_words else f"{'-':>8}"
+        print(f"  {name:<16} {load_seconds:>8.2f} {np.median(latencies) * 1000:>10.0f} "
+              f"{total / audio_seconds:>8.3f} {wer_text}")
+
+    if args.verbose:
+        for clip, rows in per_clip.items():
+            print(f"\n  {clip}")
+            for name, latency, wer, text in rows:
+                wer_text = "" if wer is None else f" WER {wer:.0%}"
+                print(f"    {name:<16} {latency * 1000:>7.0f} ms{wer_text}  {text}")
+    print()
+
+
+def bench_denoise(args):
+    """CPU cost of streaming noise suppression, the SNR it recovers, and optionally WER on clips."""
+    rate = 16000
+    clean = evie_audio.to_float32(synthetic_speech(args.seconds, rate, level=0.1))
+    clean -= clean.mean()
+    noisy = add_noise(clean, fan_noise(len(clean), rate), args.snr)
+    suppressor = evie_audio.NoiseSuppressor(sample_rate=rate)
+
+    def stream():
+        suppressor.reset()
+        for start in range(0, len(noisy), args.chunk):
+            suppressor.process(noisy[start:start + args.chunk])
+
+    seconds, peak = measure(stream, args.repeat)
+    denoised = suppressor.denoise(noisy)
+    settled = rate // 2  # Skip the first half second while the noise estimate converges
+
+    print(f"\nNoise suppression: {args.seconds:g}s of speech in fan noise at {args.snr:g} dB SNR, "
+          f"{args.chunk}-sample chunks, median of {args.repeat}")
+    print("-" * 72)
+    print(f"  CPU per audio-second      {seconds * 1e3 / args.seconds:8.2f} ms "
+          f"({args.seconds / seconds:.0f}x real time)")
+    print(f"  Added latency             {suppressor.latency * 1000:8.1f} ms")
+    print(f"  Peak allocation per run   {peak:8,} bytes")
+    print(f"  SNR in -> out             {snr_db(clean[settled:], noisy[settled:]):8.1f} -> "
+          f"{snr_db(clean[settled:], denoised[settled:]):.1f} dB")
+
+    if args.clips:
+        evie_stt = load_module(SCRIPT_DIR / "evie-stt.py")
+        paths = sorted(Path(args.clips).glob("*.wav"))
+        clips = [(p, load_clip(p)) for p in paths if p.with_suffix(".txt").exists()]
+        if not clips:
+            print(f"\nNo .wav clips with .txt references in {args.clips}")
+            return
+        noise = fan_noise(max(len(c) for _, c in clips), rate)
+        variants = []
+        for path, clip in clips:
+            noisy_clip = add_noise(clip, noise, args.snr)
+            variants.append((path, noisy_clip,
+                             evie_audio.NoiseSuppressor(sample_rate=rate).denoise(noisy_clip)))
+
+        backend = evie_stt.get_backend(args.backend)
+        print(f"\n  {len(clips)} clip(s) with fan noise at {args.snr:g} dB SNR, backend '{args.backend}'")
+        print(f"  {'model':<10} {'input':<10} {'WER':>8} {'median ms':>10}")
+        for size in args.models:
+            model = backend.load(size)
+            for label, index in (("noisy", 1), ("denoised", 2)):
+                errors, words, latencies = 0.0, 0, []
+                for variant in variants:
+                    reference = variant[0].with_suffix(".txt").read_text(encoding="utf-8").strip()
+                    start = time.perf_counter()
+                    text = backend.transcribe(model, variant[index])["text"]
+                    latencies.append(time.perf_counter() - start)
+                    n = len(reference.split())
+                    errors += word_error_rate(reference, text) * n
+                    words += n
+                print(f"  {size:<10} {label:<10} {errors / max(words, 1):>8.1%} "
+                      f"{np.median(latencies) * 1000:>10.0f}")
+    print()
+
+
+def bench_listen(args):
+    """End-of-speech to transcript latency through the live listening path, on replayed audio."""
+    evie_listen = load_module(SCRIPT_DIR / "evie-listen.py")
+    stream = evie_listen.open_audio_source(args.source + ",hold")
+    if not isinstance(stream, evie_listen.ReplayStream):
+        print("The listen benchmark needs recordings or test signals, not the microphone")
+        return
+    rate = stream.sample_rate
+    hangover = evie_listen.VAD_HANGOVER
+    # Load the model first; replay only starts once the reader below exists
+    evie_listen.transcribe_samples(np.zeros(rate, dtype=np.float32), args.model)
+
+    print(f"\nListening to '{args.source}' at {stream.speed:g}x, model '{args.model}', "
+          f"hangover {hangover:g}s")
+    print("-" * 72)
+    print(f"  {'#':>3} {'speech s':>9} {'to text ms':>11} {'decode ms':>10}  text")
+    stream.start()
+    reader = stream.reader()
+    vad = evie_listen.stream_vad(stream)
+    latencies = []
+    while True:
+        pcm = evie_listen.record_utterance(reader.chunks(), rate, timeout=0.5, verbose=False, vad=vad)
+        if pcm is None:
+            # The source is done once the reader is into the trailing silence
+            if stream.finished.is_set() and stream.position - reader.position < stream.tail * rate:
+                break
+            continue
+        speech_end = stream.time_at(reader.position - int(hangover * rate))
+        start = time.perf_counter()
+        text = evie_listen.transcribe_pcm(pcm, rate, args.model)
+        decode = time.perf_counter() - start
+        latency = time.monotonic() - speech_end
+        latencies.append(latency)
+        print(f"  {len(latencies):>3} {len(pcm) / rate:>9.2f} {latency * 1000:>11.0f} "
+              f"{decode * 1000:>10.0f}  {text or ''}")
+    stream.stop()
+
+    if latencies:
+        print(f"\n  {len(latencies)} utterance(s): median {np.median(latencies) * 1000:.0f} ms, "
+              f"p90 {np.percentile(latencies, 90) * 1000:.0f} ms from end of speech to text "
+              f"(includes the {hangover:g}s hangover at {stream.speed:g}x)")
+    else:
+        print("  No speech detected")
+    print()
+
+
+def bench_bus(args):
+    """Shared-memory audio bus: writer rate, per-reader throughput, latency and integrity."""
+    evie_bus = load_module(SCRIPT_DIR / "evie-bus.py")
+    pace = "as fast as possible" if not args.speed else f"{args.speed:g}x real time"
+    print(f"\nAudio bus: {args.seconds:g}s of 16 kHz audio in {args.chunk}-sample chunks, {pace}, "
+          f"{args.readers} reader process(es)")
+    print("-" * 72)
+    for readers in ([args.readers] if not args.sweep else range(1, args.readers + 1)):
+        result = evie_bus.benchmark(readers=readers, seconds=args.seconds, speed=args.speed,
+                                    chunk=args.chunk)
+        write_rate = result["samples"] / result["write_seconds"]
+        print(f"  {readers} reader(s): writer {write_rate / 1e6:7.2f} M samples/s "
+              f"({write_rate * 2 / 2 ** 20:.1f} MB/s)")
+        for i, reader in enumerate(result["readers"]):
+            latencies = np.array(reader["latencies"]) * 1000
+            p50, p99 = (np.percentile(latencies, [50, 99]) if len(latencies) else (float("nan"),) * 2)
+            print(f"    reader {i}: {reader['samples'] / reader['seconds'] / 1e6:7.2f} M samples/s, "
+                  f"latency p50 {p50:5.2f} ms p99 {p99:5.2f} ms, "
+                  f"{reader['overruns']} overrun(s), {reader['corrupt']} corrupt read(s)")
+    print()
+
+
+ANSWER_TEXT = (
+    "You have three meetings tomorrow. The first is the budget review at nine, in the small "
+    "conference room, and Sarah has asked for the revised figures beforehand. At half eleven "
+    "there is a call with the Manchester office about the launch timeline, which may overrun. "
+    "After lunch you are meeting the new design agency; I have put their proposal in your inbox. "
+    "Your evening is free, although you did say you wanted to finish the quarterly report. "
+)
+
+
+def bench_tts(args):
+    """
+    Edge TTS time to first audio (whole-phrase synthesis vs streamed
+    decoding) and per-call cost with and without the resident TTSEngine.
+    Needs network.
+    """
+    speak_module = load_module(SCRIPT_DIR / "evie-speak-edge.py")
+    text = (ANSWER_TEXT * (args.chars // len(ANSWER_TEXT) + 1))[:args.chars]
+    print(f"\nEdge TTS: {len(text)}-character answer, {args.repeat} run(s) per mode, cache bypassed")
+    print("-" * 72)
+    buffered, first, total = [], [], []
+    for _ in range(args.repeat):
+        request = speak_module.speech_request(text, natural=False)
+        started = time.perf_counter()
+        speak_module.synthesize_audio(request, use_cache=False)
+        buffered.append(time.perf_counter() - started)
+
+        first_audio = []
+
+        def on_audio(pcm):
+            if not first_audio:
+                first_audio.append(time.perf_counter())
+
+        started = time.perf_counter()
+        speak_module.stream_speech(request, on_audio)
+        total.append(time.perf_counter() - started)
+        first.append(first_audio[0] - started if first_audio else float("nan"))
+    print(f"  whole phrase, then play:  first audio after {np.median(buffered) * 1000:6.0f} ms (median)")
+    print(f"  streamed:                 first audio after {np.median(first) * 1000:6.0f} ms (median), "
+          f"synthesis complete after {np.median(total) * 1000:.0f} ms")
+
+    print(f"\nPer-call cost: asyncio.run() per phrase vs the resident TTS engine ({args.calls} calls each)")
+    print("-" * 72)
+
+    async def idle():
+        return None
+
+    engine = speak_module.TTSEngine().start()
+    dispatch = {}
+    started = time.perf_counter()
+    for _ in range(args.calls * 10):
+        asyncio.run(idle())
+    dispatch["asyncio.run"] = (time.perf_counter() - started) / (args.calls * 10)
+    started = time.perf_counter()
+    for _ in range(args.calls * 10):
+        engine.submit(idle()).result()
+    dispatch["engine"] = (time.perf_counter() - started) / (args.calls * 10)
+    engine.shutdown()
+
+    request = speak_module.speech_request("Yes?", natural=False)
+    calls = {}
+    for label, use_engine in (("asyncio.run", False), ("engine", True)):
+        speak_module.USE_TTS_ENGINE = use_engine
+        seconds = []
+        for _ in range(args.calls):
+            started = time.perf_counter()
+            speak_module.run_edge_stream(request, lambda chunk: None)
+            seconds.append(time.perf_counter() - started)
+        calls[label] = np.median(seconds)
+    for label in ("asyncio.run", "engine"):
+        print(f"  {label:12s} event loop overhead {dispatch[label] * 1e6:7.0f} us per call, "
+              f"short phrase {calls[label] * 1000:6.0f} ms (median)")
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evie voice pipeline benchmarks")
+    sub = parser.add_subparsers(dest="benchmark", required=True)
+
+    p = sub.add_parser("normalize", help="Audio normalization cost and allocations")
+    p.add_argument("--seconds", type=float, default=10.0, help="Audio length (default: 10)")
+    p.add_argument("--rate", type=int, default=16000, help="Sample rate (default: 16000)")
+    p.add_argument("--channels", type=int, default=1, help="Channel count (default: 1)")
+    p.add_argument("--repeat", type=int, default=10, help="Timed runs (default: 10)")
+    p.set_defaults(func=bench_normalize)
+
+    p = sub.add_parser("models", help="Whisper model load times and resident sizes")
+    p.add_argument("--sizes", nargs="+", default=["tiny", "base"], help="Model sizes (default: tiny base)")
+    p.add_argument("--no-warmup", action="store_true", help="Skip the warm-up decode after loading")
+    p.set_defaults(func=bench_models)
+
+    p = sub.add_parser("stt", help="Side-by-side STT backend latency and word error rate")
+    p.add_argument("--clips", required=True, help="Directory of .wav clips (+ optional .txt references)")
+    p.add_argument("--backends", nargs="+", default=["whisper", "faster-whisper"],
+                   help="Backends to compare (default: whisper faster-whisper)")
+    p.add_argument("--model", default="base", help="Model size (default: base)")
+    p.add_argument("--repeat", type=int, default=3, help="Timed runs per clip (default: 3)")
+    p.add_argument("--verbose", "-v", action="store_true", help="Show per-clip results")
+    p.set_defaults(func=bench_stt)
+
+    p = sub.add_parser("denoise", help="Noise suppression CPU cost, SNR gain and WER by model")
+    p.add_argument("--seconds", type=float, default=10.0, help="Synthetic audio length (default: 10)")
+    p.add_argument("--snr", type=float, default=5.0, help="Fan noise level in dB SNR (default: 5)")
+    p.add_argument("--chunk", type=int, default=1024, help="Streaming chunk size (default: 1024)")
+    p.add_argument("--repeat", type=int, default=5, help="Timed runs (default: 5)")
+    p.add_argument("--clips", default=None, help="Directory of .wav clips with .txt references for WER")
+    p.add_argument("--models", nargs="+", default=["tiny", "base"], help="Model sizes (default: tiny base)")
+    p.add_argument("--backend", default="whisper", help="STT backend (default: whisper)")
+    p.set_defaults(func=bench_denoise)
+
+    p = sub.add_parser("listen", help="End-of-speech to transcript latency on replayed audio")
+    p.add_argument("--source", required=True,
+                   help="Audio source spec from evie-listen.py, e.g. 'clips/,gap=1.5' or 'hey.wav,speed=2'")
+    p.add_argument("--model", default="base", help="Whisper model size, or 'cascade' (default: base)")
+    p.set_defaults(func=bench_listen)
+
+    p = sub.add_parser("bus", help="Shared-memory audio bus throughput and latency with N readers")
+    p.add_argument("--readers", type=int, default=4, help="Reader processes (default: 4)")
+    p.add_argument("--sweep", action="store_true", help="Run with 1, 2, ... --readers readers")
+    p.add_argument("--seconds", type=float, default=10.0, help="Audio to publish (default: 10)")
+    p.add_argument("--speed", type=float, default=1.0,
+                   help="Writer pace in multiples of real time, 0 = unthrottled (default: 1)")
+    p.add_argument("--chunk", type=int, default=512, help="Samples per write (default: 512)")
+    p.set_defaults(func=bench_bus)
+
+    p = sub.add_parser("tts", help="Edge TTS time to first audio and per-call engine overhead (needs network)")
+    p.add_argument("--chars", type=int, default=500, help="Answer length in characters (default: 500)")
+    p.add_argument("--repeat", type=int, default=3, help="Runs per mode (default: 3)")
+    p.add_argument("--calls", type=int, default=10, help="Short phrases per per-call comparison (default: 10)")
+    p.set_defaults(func=bench_tts)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
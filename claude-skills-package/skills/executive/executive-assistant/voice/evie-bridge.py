@@ -9,10 +9,15 @@ Usage:
     python evie-bridge.py                    # Start voice bridge
     python evie-bridge.py --wake-word        # Require "Hey Claude" to activate
     python evie-bridge.py --no-confirm       # Skip confirmation sounds
+    python evie-bridge.py --vad              # Stop recording when you stop talking
+    python evie-bridge.py --cascade          # Fast model first, base only when unsure
+    python evie-bridge.py --no-barge-in      # Don't stop answers when you talk over them
+    python evie-bridge.py --source clips/    # Replay recordings instead of the mic (headless runs)
 """
 
 import subprocess
 import sys
+import concurrent.futures
 import os
 import json
 import tempfile
@@ -29,6 +34,21 @@ DEFAULT_WAKE_WORD = "hey claude"
 # Microphone settings (from working tests)
 DEFAULT_MIC_INDEX = 18  # Logitech C525 HD WebCam
 
+# Capture mode: False = fixed-duration recording, True = stop when the speaker goes quiet (VAD)
+USE_VAD = False
+
+# Phrases that end the session
+EXIT_WORDS = ["goodbye", "stop listening", "exit", "quit"]
+
+# Speech model: "base", or "cascade" to decode with tiny and re-decode with base only when unsure
+STT_MODEL = "base"
+
+# Talking over a spoken answer stops it and becomes the next query
+BARGE_IN = True
+
+# Acknowledgements ("Let me think about that.") that could not start within this many seconds are skipped
+ACK_MAX_AGE = 2.0
+
 # Import Evie's voice modules
 sys.path.insert(0, str(SCRIPT_DIR))
 
@@ -45,22 +65,79 @@ def load_module(module_file):
 listen_module = load_module(SCRIPT_DIR / "evie-listen.py")
 speak_module = load_module(SCRIPT_DIR / "evie-speak-edge.py")
 
-def speak(text, style="default"):
-    """Have Evie speak text."""
+def speak(text, style="default", barge_in=False):
+    """
+    Have Evie speak text.
+
+    barge_in is for answers: they are spoken sentence by sentence, each
+    synthesized while the previous one plays (speak_sentences), and with
+    BARGE_IN on, talking over Evie stops her and what was said is
+    transcribed and returned, so it can be the next query.
+
+    Returns:
+        Text the user spoke over the playback, or None
+    """
     print(f"\n[Evie] {text}\n")
     try:
-        speak_module.speak(text, style=style, play=True)
+        if not barge_in:
+            speak_module.speak(text, style=style, play=True)
+            return None
+        if not BARGE_IN:
+            speak_module.speak_sentences(text, style=style)
+            return None
+        result = listen_module.speak_with_barge_in(
+            lambda stop: speak_module.speak_sentences(text, style=style, stop_event=stop),
+            mic_index=DEFAULT_MIC_INDEX,
+            verbose=False
+        )
+        if result.interrupted:
+            print(f"[Interrupted after {result.onset_to_stop * 1000:.0f} ms]")
+        if result.pcm is not None:
+            return listen_module.transcribe_pcm(result.pcm, result.sample_rate, STT_MODEL, gate=True)
     except Exception as e:
         print(f"[Voice Error] {e}")
+    return None
+
+def acknowledge(text, style="default"):
+    """
+    Say a short acknowledgement without waiting for it.
+
+    It goes on the speech queue at low priority, so it plays while Claude
+    is working; if it cannot start within ACK_MAX_AGE it is skipped, and a
+    newer acknowledgement replaces one still waiting.
+
+    Returns:
+        Future that resolves once it has been spoken (or skipped)
+    """
+    print(f"\n[Evie] {text}\n")
+    return speak_module.say(text, style=style, priority=speak_module.PRIORITY_LOW,
+                            max_age=ACK_MAX_AGE, coalesce="ack")
 
-def listen(duration=8, mic_index=DEFAULT_MIC_INDEX, model="base"):
-    """Listen for user speech."""
+def listen(duration=8, mic_index=DEFAULT_MIC_INDEX, model=None):
+    """
+    Listen for user speech.
+
+    With USE_VAD, `duration` is how long to wait for speech to start and
+    recording stops as soon as the speaker goes quiet.
+
+    Reads the same persistent microphone stream as wake-word detection,
+    so the device is never opened twice.
+    """
+    model = model or STT_MODEL
     try:
+        stream = listen_module.get_microphone_stream(mic_index)
+        if USE_VAD:
+            return listen_module.listen_vad(
+                timeout=duration,
+                model_size=model,
+                verbose=False,
+                stream=stream
+            )
         return listen_module.listen_fixed(
             duration=duration,
-            mic_index=mic_index,
             model_size=model,
-            verbose=False
+            verbose=False,
+            stream=stream
         )
     except Exception as e:
         print(f"[Listen Error] {e}")
@@ -123,18 +200,34 @@ def run_bridge(wake_word=None, confirm_sounds=True):
     speak("Hello love. I'm connected directly to Claude. What would you like to know?", style="greeting")
 
     waiting_for_wake = bool(wake_word)
+    interrupted_text = None  # What the user said over the last answer
 
     while True:
         try:
             # Listen for speech
-            if waiting_for_wake:
+            if interrupted_text:
+                text, interrupted_text = interrupted_text, None
+            elif waiting_for_wake:
                 print(f"\n[Listening for '{wake_word}'...]")
-                duration = 4  # Shorter for wake word detection
+                # A query said in the same breath as the wake word is captured
+                # straight away; only a bare wake word gets the "Yes?" prompt
+                heard = listen_module.listen_wake_command(
+                    [wake_word] + EXIT_WORDS,
+                    mic_index=DEFAULT_MIC_INDEX,
+                    model_size=STT_MODEL
+                )
+                if heard.wake_word in EXIT_WORDS:
+                    speak("Alright love, signing off. Take care.", style="encouragement")
+                    break
+                if not heard.command:
+                    if confirm_sounds:
+                        speak("Yes?", style="greeting")
+                    waiting_for_wake = False
+                    continue
+                text = heard.command
             else:
                 print("\n[Listening...]")
-                duration = 8  # Longer for full queries
-
-            text = listen(duration=duration, mic_index=DEFAULT_MIC_INDEX)
+                text = listen(duration=8, mic_index=DEFAULT_MIC_INDEX)
 
             if not text:
                 continue
@@ -143,27 +236,22 @@ def run_bridge(wake_word=None, confirm_sounds=True):
             print(f"[You said] {text}")
 
             # Check for exit commands
-            if any(word in text_lower for word in ["goodbye", "stop listening", "exit", "quit"]):
+            if any(word in text_lower for word in EXIT_WORDS):
                 speak("Alright love, signing off. Take care.", style="encouragement")
                 break
 
-            # If waiting for wake word
-            if waiting_for_wake:
-                if wake_word.lower() in text_lower:
-                    if confirm_sounds:
-                        speak("Yes?", style="greeting")
-                    waiting_for_wake = False
-                continue
-
-            # Process the command
-            if confirm_sounds:
-                speak("Let me think about that.", style="default")
+            # Process the command (the acknowledgement plays while Claude works)
+            ack = acknowledge("Let me think about that.") if confirm_sounds else None
 
             # Send to Claude
             print("[Sending to Claude...]")
             response = send_to_claude(text)
             print(f"[Claude's response]\n{response}\n")
 
+            # Never talk over the acknowledgement
+            if ack is not None:
+                concurrent.futures.wait([ack])
+
             # Speak the response
             # Limit to first 500 chars for reasonable speech length
             if len(response) > 500:
@@ -171,7 +259,7 @@ def run_bridge(wake_word=None, confirm_sounds=True):
             else:
                 spoken_response = response
 
-            speak(spoken_response, style="default")
+            interrupted_text = speak(spoken_response, style="default", barge_in=True)
 
             # If using wake word, go back to waiting
             if wake_word:
@@ -186,6 +274,9 @@ def run_bridge(wake_word=None, confirm_sounds=True):
             speak("Sorry, I had a hiccup. Let's try that again.", style="alert")
             continue
 
+    for line in speak_module.format_session_stats(listen_module.get_barge_in_stats()):
+        print(line)
+
 def main():
     import argparse
 
@@ -196,9 +287,26 @@ def main():
                        help="Skip confirmation sounds")
     parser.add_argument("--mic-index", "-m", type=int, default=DEFAULT_MIC_INDEX,
                        help="Microphone device index")
+    parser.add_argument("--vad", action="store_true",
+                       help="Stop recording when you stop talking instead of fixed-length windows")
+    parser.add_argument("--cascade", action="store_true",
+                       help="Transcribe with the fast model first, re-check with base only when unsure")
+    parser.add_argument("--no-barge-in", action="store_true",
+                       help="Always let answers finish instead of stopping when you talk over them")
+    parser.add_argument("--source", default=None, metavar="SPEC",
+                       help="Listen to recordings or test signals instead of the mic, e.g. 'clips/,gap=1' "
+                            "(see evie-listen.py open_audio_source)")
 
     args = parser.parse_args()
 
+    global USE_VAD, STT_MODEL, BARGE_IN
+    USE_VAD = args.vad
+    BARGE_IN = not args.no_barge_in
+    if args.source:
+        listen_module.AUDIO_SOURCE = args.source
+    if args.cascade:
+        STT_MODEL = listen_module.CASCADE
+
     run_bridge(
         wake_word=args.wake_word,
         confirm_sounds=not args.no_confirm
@@ -0,0 +1,611 @@
+#!/usr/bin/env python3
+"""
+Evie Audio Bus - One microphone shared by several processes
+
+A capture device can only be opened once, so one capture process owns it
+(an evie-listen.py MicrophoneStream, with its noise tracking and echo
+cancellation) and writes every chunk into a ring buffer in shared memory.
+Any number of other processes attach to the bus by name and read it with
+their own cursors: wake detection, command transcription and session
+recording no longer share one interpreter's GIL.
+
+Readers get the same interface as an in-process MicrophoneStream
+(position, read, index_at/time_at, latest, reader, noise), so the
+evie-listen.py functions that take a `stream` accept an AudioBus or its
+readers unchanged. BusReader.read_view() returns views straight into
+shared memory for zero-copy consumers, with overrun detection after use.
+
+Usage:
+    python evie-bus.py capture --mic 18              # Own the mic, publish as "evie-mic"
+    python evie-bus.py monitor                       # Levels and lag from another process
+    python evie-bus.py record session.wav            # Record the bus to a WAV file
+
+    bus = load_module(SCRIPT_DIR / "evie-bus.py")
+    stream = bus.AudioBus.attach()                   # In any process
+    text = evie_listen.listen_vad(stream=stream)
+
+Benchmark N readers with `python evie-benchmark.py bus --readers 4`.
+"""
+
+import argparse
+import importlib
+import multiprocessing
+import sys
+import time
+import wave
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from pathlib import Path
+
+import numpy as np
+
+SCRIPT_DIR = Path(__file__).parent
+
+# Spawned benchmark readers import this file by its own name ("evie-bus");
+# register it under the name load_module() uses so pickled functions resolve
+if __name__ == "evie-bus":
+    sys.modules.setdefault("evie_bus", sys.modules[__name__])
+
+# Name the capture process publishes under unless told otherwise
+DEFAULT_BUS = "evie-mic"
+BUS_SECONDS = 60.0  # Ring length; a reader further behind than this overruns
+
+# Shared header: int64 slots, then float64 slots, then the int16 ring
+_MAGIC = 0x45564945425553  # "EVIEBUS"
+_INT_SLOTS = 16
+_FLOAT_SLOTS = 8
+_HEADER_BYTES = 8 * (_INT_SLOTS + _FLOAT_SLOTS)
+# int64 slots
+_H_MAGIC, _H_RATE, _H_CAPACITY, _H_CHUNK, _H_WRITE_POS, _H_MAX_WRITE, _H_SEQ, _H_CLOSED, _H_ANCHOR_INDEX = range(9)
+# float64 slots
+_F_ANCHOR_TIME, _F_NOISE_FLOOR = range(2)
+
+
+def load_module(module_file):
+    """Load a Python module from a file with dashes in the name."""
+    import importlib.util
+    module_name = module_file.stem.replace("-", "_")
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, module_file)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+evie_audio = load_module(SCRIPT_DIR / "evie-audio.py")
+
+
+def _inherited_resource_tracker():
+    """True if this process was started by multiprocessing and shares its parent's resource tracker."""
+    if sys.platform == "win32":
+        return False
+    from multiprocessing import resource_tracker
+    return getattr(resource_tracker._resource_tracker, "_fd", None) is not None
+
+
+# Checked at import, before this process could have started a tracker of its own
+_SHARED_TRACKER = _inherited_resource_tracker()
+
+
+def _open_shared(name):
+    """Attach to existing shared memory without letting this process's exit unlink it."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Before Python 3.13 every attaching process registers the segment
+        # with its resource tracker, which would destroy it on exit. Children
+        # of the creating process share its tracker, where the registration
+        # is the creator's own and must stay.
+        shm = shared_memory.SharedMemory(name=name)
+        if sys.platform != "win32" and not _SHARED_TRACKER:
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+
+class SharedRingBuffer(evie_audio.RingBuffer):
+    """
+    evie_audio.RingBuffer whose samples and counters live in shared memory.
+
+    Writes and reads are the inherited lock-free ones; only `write_pos` and
+    `max_write` move into the bus header so every process sees them. Each
+    write also publishes a (time.monotonic(), write_pos) anchor, which is
+    comparable across processes because the monotonic clock is system-wide.
+    """
+
+    def __init__(self, bus, data):
+        self._bus = bus
+        self._header = bus._header
+        self.capacity = len(data)
+        self.data = data
+
+    @property
+    def write_pos(self):
+        return int(self._header[_H_WRITE_POS])
+
+    @write_pos.setter
+    def write_pos(self, value):
+        # Aligned 8-byte stores are single writes, so readers never see half a counter
+        self._header[_H_WRITE_POS] = value
+
+    @property
+    def max_write(self):
+        return int(self._header[_H_MAX_WRITE])
+
+    @max_write.setter
+    def max_write(self, value):
+        self._header[_H_MAX_WRITE] = value
+
+    def write(self, samples):
+        super().write(samples)
+        self._bus._publish_anchor(time.monotonic(), self.write_pos)
+
+
+class SharedNoiseFloor:
+    """Read-only view of the capture process's noise floor (duck-types NoiseFloorTracker)."""
+
+    def __init__(self, floats):
+        self._floats = floats
+
+    @property
+    def floor_db(self):
+        value = float(self._floats[_F_NOISE_FLOOR])
+        return None if np.isnan(value) else value
+
+
+class AudioBus:
+    """
+    A shared-memory audio ring: created by the capture process, attached by readers.
+
+    Mirrors MicrophoneStream's reading interface, so readers can hand it to
+    stream_vad(), listen_vad(), SlidingWakeDetector and friends.
+    """
+
+    def __init__(self, shm, owner=False):
+        self.name = shm.name.lstrip("/")
+        self.owner = owner
+        self._shm = shm
+        self._header = np.ndarray((_INT_SLOTS,), dtype=np.int64, buffer=shm.buf)
+        self._floats = np.ndarray((_FLOAT_SLOTS,), dtype=np.float64, buffer=shm.buf, offset=8 * _INT_SLOTS)
+        if int(self._header[_H_MAGIC]) != _MAGIC:
+            raise ValueError(f"Shared memory '{self.name}' is not an Evie audio bus")
+        data = np.ndarray((int(self._header[_H_CAPACITY]),), dtype=np.int16,
+                          buffer=shm.buf, offset=_HEADER_BYTES)
+        self.ring = SharedRingBuffer(self, data)
+        self.noise = SharedNoiseFloor(self._floats)
+        self.echo = None  # Echo cancellation runs in the capture process
+
+    @classmethod
+    def create(cls, name=DEFAULT_BUS, sample_rate=16000, capacity=None, chunk=512):
+        """
+        Create a bus (capture process only).
+
+        Args:
+            name: Shared memory name readers attach to
+            sample_rate: Rate of the published audio
+            capacity: Ring length in samples (default: BUS_SECONDS of audio)
+            chunk: Typical write size, used by readers as their polling step
+        """
+        capacity = int(capacity or BUS_SECONDS * sample_rate)
+        shm = shared_memory.SharedMemory(name=name, create=True, size=_HEADER_BYTES + 2 * capacity)
+        header = np.ndarray((_INT_SLOTS,), dtype=np.int64, buffer=shm.buf)
+        header[:] = 0
+        header[_H_RATE] = sample_rate
+        header[_H_CAPACITY] = capacity
+        header[_H_CHUNK] = chunk
+        floats = np.ndarray((_FLOAT_SLOTS,), dtype=np.float64, buffer=shm.buf, offset=8 * _INT_SLOTS)
+        floats[:] = 0.0
+        floats[_F_ANCHOR_TIME] = time.monotonic()
+        floats[_F_NOISE_FLOOR] = np.nan
+        header[_H_MAGIC] = _MAGIC  # Last, so readers never attach to a half-initialized bus
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name=DEFAULT_BUS, timeout=None):
+        """
+        Attach to a bus created by another process.
+
+        Args:
+            name: Bus name
+            timeout: Seconds to wait for the capture process to create it (None = fail at once)
+
+        Raises:
+            FileNotFoundError: no such bus (after `timeout`)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                return cls(_open_shared(name))
+            except FileNotFoundError:
+                if deadline is None or time.monotonic() >= deadline:
+                    raise
+                time.sleep(0.1)
+
+    def close(self):
+        """Detach; the owner also marks the bus closed and removes it."""
+        if self.owner:
+            self._header[_H_CLOSED] = 1
+        self.ring = self._header = self._floats = None
+        self._shm.close()
+        if self.owner:
+            self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def sample_rate(self):
+        return int(self._header[_H_RATE])
+
+    @property
+    def chunk(self):
+        return int(self._header[_H_CHUNK])
+
+    @property
+    def closed(self):
+        """True once the capture process has shut the bus down."""
+        return bool(self._header[_H_CLOSED])
+
+    @property
+    def position(self):
+        """Absolute index of the next sample to be written."""
+        return self.ring.write_pos
+
+    @property
+    def noise_floor_db(self):
+        return self.noise.floor_db
+
+    def publish_noise_floor(self, floor_db):
+        """Share the capture process's current noise floor with readers."""
+        self._floats[_F_NOISE_FLOOR] = np.nan if floor_db is None else floor_db
+
+    def _publish_anchor(self, timestamp, index):
+        # Seqlock: an odd sequence number means an update is in progress
+        self._header[_H_SEQ] += 1
+        self._floats[_F_ANCHOR_TIME] = timestamp
+        self._header[_H_ANCHOR_INDEX] = index
+        self._header[_H_SEQ] += 1
+
+    def anchor(self):
+        """Consistent (time.monotonic(), absolute index) of the latest write."""
+        while True:
+            seq = int(self._header[_H_SEQ])
+            if seq % 2 == 0:
+                timestamp = float(self._floats[_F_ANCHOR_TIME])
+                index = int(self._header[_H_ANCHOR_INDEX])
+                if int(self._header[_H_SEQ]) == seq:
+                    return timestamp, index
+
+    def index_at(self, timestamp):
+        """Absolute sample index written at a time.monotonic() timestamp."""
+        anchor_time, anchor_index = self.anchor()
+        return anchor_index + int(round((timestamp - anchor_time) * self.sample_rate))
+
+    def time_at(self, index):
+        """time.monotonic() timestamp at which an absolute sample index was written."""
+        anchor_time, anchor_index = self.anchor()
+        return anchor_time + float(index - anchor_index) / self.sample_rate
+
+    def read(self, start, end):
+        """Copy out samples [start, end) by absolute index (see RingBuffer.read)."""
+        return self.ring.read(start, end)
+
+    def read_time(self, start_time, end_time):
+        """Copy out the audio written between two time.monotonic() timestamps."""
+        data, _ = self.ring.read(self.index_at(start_time), self.index_at(end_time))
+        return data
+
+    def latest(self, seconds):
+        """The most recent `seconds` of audio."""
+        end = self.ring.write_pos
+        data, _ = self.ring.read(end - int(seconds * self.sample_rate), end)
+        return data
+
+    def echo_cancelled_since(self, timestamp):
+        """Playback in a reader process never reaches the capture process's echo canceller."""
+        return False
+
+    def reader(self, start=None):
+        """Create an independent gapless cursor (default: starting now)."""
+        return BusReader(self, self.position if start is None else start)
+
+
+class BusReader:
+    """
+    Sequential cursor over an AudioBus (same interface as evie-listen's StreamReader).
+
+    read() copies; read_view() hands out views of the shared ring itself.
+    Either way a reader that falls more than the ring's length behind skips
+    to the oldest audio still held and counts an overrun.
+    """
+
+    def __init__(self, bus, position):
+        self.stream = bus
+        self.position = position
+        self.overruns = 0
+        self._view_start = None
+
+    @property
+    def sample_rate(self):
+        return self.stream.sample_rate
+
+    def _wait(self, target, timeout):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        poll = float(self.stream.chunk) / self.stream.sample_rate / 2
+        while self.stream.position < target and not self.stream.closed:
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            time.sleep(poll)
+
+    def read(self, n, timeout=None):
+        """
+        Return the next `n` samples (a copy), blocking until they have been written.
+
+        Returns fewer samples only if `timeout` expires or the bus closes first.
+        """
+        target = self.position + n
+        self._wait(target, timeout)
+        data, start = self.stream.read(self.position, target)
+        if start > self.position:
+            self.overruns += 1
+        self.position = start + len(data)
+        return data
+
+    def read_view(self, n, timeout=None):
+        """
+        Return the next `n` samples as views into shared memory, without copying.
+
+        The views stay valid until the writer laps them; call valid()
+        once done with them to find out whether it did.
+
+        Returns:
+            Tuple of one or two int16 arrays (two when the range wraps the ring)
+        """
+        target = self.position + n
+        self._wait(target, timeout)
+        ring = self.stream.ring
+        end = min(target, ring.write_pos)
+        start = max(self.position, ring.oldest())
+        if start > self.position:
+            self.overruns += 1
+        self.position = max(start, end)
+        self._view_start = start
+        if end <= start:
+            return (ring.data[:0],)
+
+        offset = start % ring.capacity
+        first = min(end - start, ring.capacity - offset)
+        if first == end - start:
+            return (ring.data[offset:offset + first],)
+        return (ring.data[offset:], ring.data[:end - start - first])
+
+    def valid(self):
+        """
+        Whether the views from the last read_view() were intact while in use.
+
+        False (and an overrun) if the writer may have overwritten them.
+        """
+        ring = self.stream.ring
+        if self._view_start is None:
+            return True
+        if ring.write_pos + ring.max_write - ring.capacity > self._view_start:
+            self.overruns += 1
+            return False
+        return True
+
+    def chunks(self):
+        """Yield written audio chunk by chunk until the bus closes."""
+        while not self.stream.closed:
+            yield self.read(self.stream.chunk)
+
+    def seek(self, position):
+        """Move the cursor to an absolute sample index."""
+        self.position = position
+
+
+def _test_pattern(start, end):
+    """Sample values the benchmark writer puts at absolute indexes [start, end)."""
+    return (np.arange(start, end) % 65536 - 32768).astype(np.int16)
+
+
+def _bench_reader(name, n_samples, step, ready):
+    """
+    Benchmark reader process: consume the bus zero-copy and check every sample.
+
+    Returns:
+        dict with samples read, seconds, overruns, corrupt reads and latencies
+        (seconds from the newest write to this reader holding it)
+    """
+    bus = AudioBus.attach(name, timeout=10.0)
+    reader = bus.reader(0)
+    corrupt = 0
+    latencies = []
+    ready.wait()
+    started = time.perf_counter()
+    try:
+        while reader.position < n_samples and not bus.closed:
+            start = reader.position
+            views = reader.read_view(min(step, n_samples - start), timeout=1.0)
+            received = time.monotonic()
+            anchor_time, anchor_index = bus.anchor()
+            if anchor_index == reader.position:
+                latencies.append(received - anchor_time)
+            offset = reader.position - sum(len(v) for v in views)
+            for view in views:
+                if not np.array_equal(view, _test_pattern(offset, offset + len(view))):
+                    corrupt += 1
+                offset += len(view)
+            if not reader.valid():
+                corrupt += 1
+        return {
+            "samples": reader.position,
+            "seconds": time.perf_counter() - started,
+            "overruns": reader.overruns,
+            "corrupt": corrupt,
+            "latencies": latencies,
+        }
+    finally:
+        bus.close()
+
+
+def benchmark(readers=4, seconds=10.0, speed=1.0, sample_rate=16000, chunk=512, capacity_seconds=BUS_SECONDS):
+    """
+    Throughput and latency of one writer and `readers` reader processes.
+
+    The writer (this process) publishes a known sample pattern `chunk`
+    samples at a time, paced at `speed` x real time (0 = as fast as
+    possible). Each reader process attaches, reads zero-copy and verifies
+    every sample, so torn or overwritten reads show up as corruption.
+
+    Returns:
+        dict with the writer's rate and one result dict per reader (see _bench_reader)
+    """
+    name = f"evie-bench-{multiprocessing.current_process().pid}"
+    n_samples = int(seconds * sample_rate)
+    # Spawn, like real readers: forked children would share this process's
+    # resource tracker, and their attach-time unregister would cancel ours
+    context = multiprocessing.get_context("spawn")
+    # Fresh reader interpreters must import this file before they can
+    # unpickle _bench_reader (see the alias at the top of the module)
+    if str(SCRIPT_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPT_DIR))
+    pool_options = {"initializer": importlib.import_module, "initargs": (Path(__file__).stem,)}
+
+    bus = AudioBus.create(name, sample_rate=sample_rate, capacity=int(capacity_seconds * sample_rate),
+                          chunk=chunk)
+    try:
+        with context.Manager() as manager, \
+                ProcessPoolExecutor(max_workers=readers, mp_context=context, **pool_options) as pool:
+            ready = manager.Barrier(readers + 1)
+            futures = [pool.submit(_bench_reader, name, n_samples, chunk, ready) for _ in range(readers)]
+            ready.wait()
+
+            started = time.perf_counter()
+            for start in range(0, n_samples, chunk):
+                if speed:
+                    delay = started + start / (sample_rate * speed) - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                bus.ring.write(_test_pattern(start, min(start + chunk, n_samples)))
+            write_seconds = time.perf_counter() - started
+            results = [future.result() for future in futures]
+    finally:
+        bus.close()
+
+    return {
+        "samples": n_samples,
+        "write_seconds": write_seconds,
+        "readers": results,
+    }
+
+
+def run_capture(name=DEFAULT_BUS, mic_index=None, seconds=BUS_SECONDS, echo_cancel=None, verbose=True):
+    """
+    Own the microphone and publish it on a bus until interrupted.
+
+    Args:
+        name: Bus name readers attach to
+        mic_index: Microphone device index (None = default)
+        seconds: Ring length
+        echo_cancel: Passed to MicrophoneStream (None = its default)
+        verbose: Print status messages
+    """
+    evie_listen = load_module(SCRIPT_DIR / "evie-listen.py")
+    buses = []
+
+    def shared_ring(capacity, sample_rate):
+        buses.append(AudioBus.create(name, sample_rate=sample_rate, capacity=capacity, chunk=stream.chunk))
+        return buses[0].ring
+
+    stream = evie_listen.MicrophoneStream(mic_index, buffer_seconds=seconds,
+                                          echo_cancel=echo_cancel, ring_factory=shared_ring)
+    stream.start()
+    bus = buses[0]
+    if verbose:
+        print(f"[Evie] Publishing microphone on bus '{name}' at {stream.sample_rate} Hz (Ctrl+C to stop).")
+    try:
+        while True:
+            time.sleep(0.25)
+            bus.publish_noise_floor(stream.noise_floor_db)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stream.stop()
+        bus.close()
+
+
+def monitor(name=DEFAULT_BUS, interval=0.5):
+    """Print the level of the bus audio and this reader's lag behind the writer."""
+    bus = AudioBus.attach(name, timeout=10.0)
+    reader = bus.reader()
+    step = int(interval * bus.sample_rate)
+    try:
+        while not bus.closed:
+            views = reader.read_view(step)
+            energy = sum(float(np.dot(v.astype(np.float32), v.astype(np.float32))) for v in views)
+            intact = reader.valid()
+            level_db = 10.0 * np.log10(energy / max(1, step) / 32768.0 ** 2 + 1e-10)
+            lag_ms = 1000.0 * (time.monotonic() - bus.time_at(reader.position))
+            floor = bus.noise_floor_db
+            print(f"level {level_db:6.1f} dB  floor {floor if floor is None else round(floor, 1)} dB  "
+                  f"lag {lag_ms:5.1f} ms  overruns {reader.overruns}{'' if intact else '  (overwritten)'}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        bus.close()
+
+
+def record(path, name=DEFAULT_BUS, seconds=None):
+    """Write the bus audio to a 16-bit mono WAV file (until Ctrl+C or `seconds`)."""
+    bus = AudioBus.attach(name, timeout=10.0)
+    reader = bus.reader()
+    end = None if seconds is None else reader.position + int(seconds * bus.sample_rate)
+    print(f"[Evie] Recording bus '{name}' to {path} (Ctrl+C to stop)...")
+    try:
+        with wave.open(str(path), "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(bus.sample_rate)
+            while not bus.closed and (end is None or reader.position < end):
+                n = bus.chunk if end is None else min(bus.chunk, end - reader.position)
+                wav.writeframes(reader.read(n).tobytes())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if reader.overruns:
+            print(f"[Evie] Warning: fell behind the bus {reader.overruns} time(s); audio is missing.")
+        bus.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evie shared-memory audio bus")
+    parser.add_argument("--name", default=DEFAULT_BUS, help=f"Bus name (default: {DEFAULT_BUS})")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("capture", help="Own the microphone and publish it on the bus")
+    p.add_argument("--mic", "-m", type=int, default=None, help="Microphone index")
+    p.add_argument("--seconds", type=float, default=BUS_SECONDS, help="Ring buffer length")
+    p.add_argument("--no-aec", action="store_true", help="Don't cancel Evie's playback from the capture")
+    p.set_defaults(func=lambda args: run_capture(args.name, args.mic, args.seconds,
+                                                 echo_cancel=False if args.no_aec else None))
+
+    p = sub.add_parser("monitor", help="Print levels and reader lag from another process")
+    p.add_argument("--interval", type=float, default=0.5, help="Seconds per line")
+    p.set_defaults(func=lambda args: monitor(args.name, args.interval))
+
+    p = sub.add_parser("record", help="Record the bus to a WAV file")
+    p.add_argument("output", type=Path)
+    p.add_argument("--seconds", type=float, default=None, help="Stop after this long")
+    p.set_defaults(func=lambda args: record(args.output, args.name, args.seconds))
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
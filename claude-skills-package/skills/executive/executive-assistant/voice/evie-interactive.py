@@ -37,6 +37,9 @@ from datetime import datetime
 SCRIPT_DIR = Path(__file__).parent
 sys.path.insert(0, str(SCRIPT_DIR))
 
+# Acknowledgements ("Let me check your calendar love.") that could not start within this many seconds are skipped
+ACK_MAX_AGE = 2.0
+
 # Import Evie's voice modules
 from importlib import import_module
 
@@ -125,15 +128,29 @@ class EvieAssistant:
         return self._vision_module
 
     def speak(self, text, style="default"):
-        """Have Evie speak."""
+        """Have Evie speak (after anything already queued) and wait until she has finished."""
         print(f"\n[Evie] {text}\n")
         try:
-            self.speaker.speak(text, style=style, play=True)
+            self.speaker.say(text, style=style).result()
         except Exception as e:
             print(f"[Voice Error] {e}")
 
+    def acknowledge(self, text, style="default"):
+        """
+        Say a short acknowledgement without waiting, so it plays while the
+        work it announces is already under way.
+
+        It is queued at low priority and skipped if it cannot start within
+        ACK_MAX_AGE seconds.
+        """
+        print(f"\n[Evie] {text}\n")
+        return self.speaker.say(text, style=style, priority=self.speaker.PRIORITY_LOW,
+                                max_age=ACK_MAX_AGE, coalesce="ack")
+
     def listen(self, timeout=10):
-        """Listen for user input."""
+        """Listen for user input (once Evie has stopped talking)."""
+        if self._speak_module is not None:
+            self.speaker.get_speech_queue().wait_idle()
         return self.listener.listen_once(timeout=timeout, phrase_limit=15)
 
     def parse_intent(self, text):
@@ -191,7 +208,7 @@ class EvieAssistant:
 
     def handle_calendar(self):
         """Check calendar and report."""
-        self.speak("Let me check your calendar love.", style="default")
+        self.acknowledge("Let me check your calendar love.")
 
         # This would integrate with Google Calendar MCP
         # For now, provide guidance
@@ -200,7 +217,7 @@ class EvieAssistant:
 
     def handle_email(self):
         """Check email and report."""
-        self.speak("Checking your inbox darling.", style="default")
+        self.acknowledge("Checking your inbox darling.")
 
         # This would integrate with Gmail MCP
         return """To check email, I'll use the Gmail MCP.
@@ -209,7 +226,7 @@ class EvieAssistant:
     def handle_screenshot(self):
         """Capture and describe screen."""
         if self.vision:
-            self.speak("Taking a look at your screen.", style="default")
+            self.acknowledge("Taking a look at your screen.")
             img = self.vision.see_screen(save=True)
             if img is not None:
                 self.speak("Got it. I can see what you're working on.", style="default")
@@ -232,7 +249,7 @@ class EvieAssistant:
 
     def handle_skill(self, skill_name, query):
         """Invoke another skill."""
-        self.speak(f"Right, let me pull up the {skill_name.replace('-', ' ')} skill.", style="default")
+        self.acknowledge(f"Right, let me pull up the {skill_name.replace('-', ' ')} skill.")
 
         # Return guidance for invoking the skill
         return f"""Skill requested: {skill_name}
@@ -254,7 +271,7 @@ class EvieAssistant:
 
     def handle_briefing(self):
         """Deliver morning briefing."""
-        self.speak("Right, let me pull together your briefing.", style="greeting")
+        self.acknowledge("Right, let me pull together your briefing.", style="greeting")
 
         # This would aggregate calendar, email, tasks
         return """Morning briefing requested.
@@ -262,7 +279,7 @@ class EvieAssistant:
 
     def handle_weather(self):
         """Get weather forecast."""
-        self.speak("Let me check the weather for you love.", style="default")
+        self.acknowledge("Let me check the weather for you love.")
 
         # Use web search for weather
         return """Weather lookup requested.
@@ -273,7 +290,7 @@ class EvieAssistant:
 
     def handle_events(self):
         """Get major news and events."""
-        self.speak("Right, let me see what's happening in the world.", style="default")
+        self.acknowledge("Right, let me see what's happening in the world.")
 
         # Use web search for news
         return """Major events lookup requested.
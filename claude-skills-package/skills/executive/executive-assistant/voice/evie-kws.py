@@ -0,0 +1,424 @@
+#!/usr/bin/env python3
+"""
+Evie Keyword Spotter - Template-matching wake-word detection
+
+A lightweight stage in front of Whisper: MFCC features of the live audio
+are matched against a few enrolled recordings of each wake phrase with
+subsequence dynamic time warping (DTW). Only when the spotter fires does
+the listener pay for a Whisper decode to confirm the phrase, so
+always-on listening costs a few milliseconds of NumPy per hop instead of
+a continuous ASR model.
+
+Usage:
+    python evie-kws.py enroll                        # Record 3 samples of each default phrase
+    python evie-kws.py enroll "hey evie" --samples 5 # Record one phrase
+    python evie-kws.py list                          # Show enrolled phrases and thresholds
+    python evie-kws.py remove "yo evie"              # Delete a phrase's templates
+    python evie-kws.py test                          # Live: print spotter hits and scores
+
+Templates are stored as 16 kHz int16 clips in ~/.claude/evie-kws/, one
+.npz file per phrase, so features can be recomputed if the front end
+changes.
+"""
+
+import argparse
+import re
+import sys
+import time
+from collections import namedtuple
+from pathlib import Path
+
+import numpy as np
+
+SCRIPT_DIR = Path(__file__).parent
+KWS_DIR = Path.home() / ".claude" / "evie-kws"
+KWS_SAMPLE_RATE = 16000
+
+# Used when a phrase has a single template, so there is nothing to calibrate against
+DEFAULT_THRESHOLD = 0.3
+# Calibrated thresholds never go below this: a false hit only costs one
+# Whisper decode, a miss loses the wake word
+MIN_THRESHOLD = 0.1
+
+
+def load_module(module_file):
+    """Load a Python module from a file with dashes in the name."""
+    import importlib.util
+    module_name = module_file.stem.replace("-", "_")
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, module_file)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+evie_audio = load_module(SCRIPT_DIR / "evie-audio.py")
+
+
+def default_phrases():
+    """
+    Phrases `enroll` records with no arguments: everything evie-startup.py
+    listens for (its WAKE_WORDS plus EXIT_PHRASES), so every phrase that
+    wakes or stops Evie without the spotter still does with it.
+    """
+    evie_startup = load_module(SCRIPT_DIR / "evie-startup.py")
+    return list(dict.fromkeys(evie_startup.WAKE_WORDS + evie_startup.EXIT_PHRASES))
+
+
+def normalize_phrase(phrase):
+    """Lower-case, single-spaced form used to compare enrolled and wake phrases."""
+    return " ".join(phrase.lower().split())
+
+
+KeywordHit = namedtuple("KeywordHit", "phrase score end")
+KeywordHit.__doc__ = """
+A spotter match.
+
+Fields:
+    phrase: Enrolled phrase that matched
+    score: Length-normalized DTW cost (lower is closer; compare to the phrase threshold)
+    end: Seconds into the scored clip where the match ends
+"""
+
+
+def phrase_filename(phrase):
+    """File name used to store a phrase's templates."""
+    return re.sub(r"[^a-z0-9]+", "-", phrase.lower()).strip("-") + ".npz"
+
+
+class KeywordSpotter:
+    """
+    Spots enrolled phrases in audio by subsequence DTW over MFCCs.
+
+    Each frame is reduced to unit-length c1..c12 (c0, the overall level,
+    is dropped so the match does not depend on how loudly the phrase was
+    said), and the local cost is cosine distance. The phrase may start
+    and end anywhere in the scored clip.
+
+    All templates of all phrases are stacked and aligned against the clip
+    in a single pass: one matrix product gives every local cost, and the
+    DTW recursion runs column by column with NumPy over all template rows
+    at once. The step pattern (1,1), (1,2), (2,1) only looks at earlier
+    columns, which is what allows a whole column to be computed in one
+    vector operation, and it bounds warping to between half and double
+    the enrolled speaking rate.
+
+    Usage:
+        spotter = KeywordSpotter.load()
+        hit = spotter.detect(samples)     # float32 16 kHz
+        if hit:
+            print(hit.phrase, hit.score)
+    """
+
+    def __init__(self, sample_rate=KWS_SAMPLE_RATE, sensitivity=1.0):
+        """
+        Args:
+            sample_rate: Rate of the audio passed to add_template() and detect()
+            sensitivity: Multiplier on every threshold (>1 fires more easily)
+        """
+        self.sample_rate = sample_rate
+        self.sensitivity = sensitivity
+        self.extractor = evie_audio.MfccExtractor(sample_rate=sample_rate)
+        self.clips = {}        # phrase -> list of int16 template clips
+        self.thresholds = {}   # phrase -> DTW cost at or below which the phrase fires
+        self._stack = None
+
+    @property
+    def phrases(self):
+        return list(self.clips)
+
+    def missing(self, phrases):
+        """The given phrases that have no enrolled templates."""
+        enrolled = {normalize_phrase(phrase) for phrase in self.clips}
+        return [phrase for phrase in phrases if normalize_phrase(phrase) not in enrolled]
+
+    def features(self, samples):
+        """Per-frame unit-length c1..c12 for float32 or int16 audio."""
+        mfcc = self.extractor.mfcc(samples)[:, 1:]
+        norms = np.linalg.norm(mfcc, axis=1, keepdims=True)
+        return mfcc / np.maximum(norms, 1e-6)
+
+    def trim(self, samples, floor_db=35.0):
+        """Cut leading and trailing frames more than `floor_db` below the loudest frame."""
+        samples = evie_audio.to_float32(samples)
+        level = self.extractor.log_mel(samples).mean(axis=1)
+        if len(level) == 0:
+            return samples
+        loud = np.flatnonzero(level > level.max() - floor_db * np.log(10) / 10)
+        hop = self.extractor.hop_length
+        start = loud[0] * hop
+        end = loud[-1] * hop + self.extractor.frame_length
+        return samples[start:end]
+
+    def add_template(self, phrase, samples):
+        """
+        Enroll one recording of a phrase.
+
+        Args:
+            phrase: The phrase spoken
+            samples: float32 or int16 audio at `sample_rate`; silence around it is trimmed
+        """
+        clip = np.clip(self.trim(samples) * 32767.0, -32768, 32767).astype(np.int16)
+        self.clips.setdefault(phrase, []).append(clip)
+        self._stack = None
+
+    def remove(self, phrase):
+        self.clips.pop(phrase, None)
+        self.thresholds.pop(phrase, None)
+        self._stack = None
+
+    def calibrate(self, margin=1.5):
+        """
+        Set each phrase's threshold from its own templates.
+
+        Every template is scored against the other templates of the same
+        phrase; the worst of those matches, times `margin`, becomes the
+        threshold (at least MIN_THRESHOLD). Phrases with a single template
+        get DEFAULT_THRESHOLD.
+        """
+        for phrase, clips in self.clips.items():
+            if len(clips) < 2:
+                self.thresholds[phrase] = DEFAULT_THRESHOLD
+                continue
+            worst = 0.0
+            for i, clip in enumerate(clips):
+                others = KeywordSpotter(self.sample_rate)
+                others.clips[phrase] = clips[:i] + clips[i + 1:]
+                worst = max(worst, others.scores(clip)[phrase][0])
+            self.thresholds[phrase] = max(worst * margin, MIN_THRESHOLD)
+
+    def scores(self, samples):
+        """
+        Best match of every phrase in a clip.
+
+        Returns:
+            {phrase: (score, end_seconds)}; score is inf if the clip is too short
+        """
+        query = self.features(samples)
+        self._build_stack()
+        phrases, stack, separator, starts, ends, lengths, owner = self._stack
+        if len(query) == 0 or len(stack) == 0:
+            return {phrase: (np.inf, 0.0) for phrase in phrases}
+
+        cost = 1.0 - stack @ query.T
+        cost[separator] = np.inf
+
+        rows = len(stack)
+        prev1 = np.full(rows, np.inf, dtype=np.float32)   # Column j-1
+        prev2 = np.full(rows, np.inf, dtype=np.float32)   # Column j-2
+        step = np.empty(rows, dtype=np.float32)
+        best = np.full(len(ends), np.inf, dtype=np.float32)
+        best_end = np.zeros(len(ends), dtype=np.int64)
+
+        for j in range(len(query)):
+            # D[i, j] = c[i, j] + min(D[i-1, j-1], D[i-2, j-1], D[i-1, j-2])
+            step[0] = np.inf
+            step[1:] = np.minimum(prev1[:-1], prev2[:-1])
+            step[2:] = np.minimum(step[2:], prev1[:-2])
+            column = cost[:, j] + step
+            column[starts] = cost[starts, j]          # A match may begin at any frame
+            finished = column[ends] / lengths
+            improved = finished < best
+            best[improved] = finished[improved]
+            best_end[improved] = j
+            prev2, prev1 = prev1, column
+
+        hop_seconds = self.extractor.hop_length / float(self.sample_rate)
+        result = {}
+        for phrase_index, phrase in enumerate(phrases):
+            mine = np.flatnonzero(owner == phrase_index)
+            k = mine[np.argmin(best[mine])]
+            result[phrase] = (float(best[k]), (int(best_end[k]) + 1) * hop_seconds)
+        return result
+
+    def detect(self, samples):
+        """
+        Return the best-matching phrase whose score clears its threshold.
+
+        Returns:
+            KeywordHit or None
+        """
+        hit, best_ratio = None, 1.0
+        for phrase, (score, end) in self.scores(samples).items():
+            # Compare phrases by how far under their own threshold they are
+            ratio = score / (self.thresholds.get(phrase, DEFAULT_THRESHOLD) * self.sensitivity)
+            if ratio <= best_ratio:
+                hit, best_ratio = KeywordHit(phrase, score, end), ratio
+        return hit
+
+    def _build_stack(self):
+        """Stack every template's features, each preceded by two separator rows."""
+        if self._stack is not None:
+            return
+        phrases = self.phrases
+        blocks, starts, ends, lengths, owner = [], [], [], [], []
+        row = 0
+        for phrase_index, phrase in enumerate(phrases):
+            for clip in self.clips[phrase]:
+                feats = self.features(clip)
+                if len(feats) == 0:
+                    continue
+                blocks.append(np.zeros((2, feats.shape[1]), dtype=np.float32))
+                blocks.append(feats.astype(np.float32))
+                starts.append(row + 2)
+                ends.append(row + 1 + len(feats))
+                lengths.append(len(feats))
+                owner.append(phrase_index)
+                row += 2 + len(feats)
+        stack = np.concatenate(blocks) if blocks else np.zeros((0, 12), dtype=np.float32)
+        separator = np.ones(len(stack), dtype=bool)
+        for start, end in zip(starts, ends):
+            separator[start:end + 1] = False
+        self._stack = (phrases, stack, separator,
+                       np.array(starts, dtype=np.int64), np.array(ends, dtype=np.int64),
+                       np.array(lengths, dtype=np.float32), np.array(owner, dtype=np.int64))
+
+    def save(self, directory=KWS_DIR):
+        """Write one .npz of template clips per phrase."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        for phrase, clips in self.clips.items():
+            arrays = {f"clip{i}": clip for i, clip in enumerate(clips)}
+            np.savez(directory / phrase_filename(phrase), phrase=np.array(phrase),
+                     sample_rate=np.array(self.sample_rate), **arrays)
+
+    @classmethod
+    def load(cls, directory=KWS_DIR, sensitivity=1.0):
+        """
+        Load every enrolled phrase from `directory` and calibrate thresholds.
+
+        Returns:
+            KeywordSpotter (with no phrases if nothing has been enrolled)
+        """
+        spotter = cls(sensitivity=sensitivity)
+        directory = Path(directory)
+        if directory.is_dir():
+            for path in sorted(directory.glob("*.npz")):
+                with np.load(path) as data:
+                    phrase = str(data["phrase"])
+                    rate = int(data["sample_rate"])
+                    names = sorted((k for k in data.files if k.startswith("clip")),
+                                   key=lambda k: int(k[4:]))
+                    for name in names:
+                        clip = data[name]
+                        if rate != spotter.sample_rate:
+                            clip = evie_audio.resample(evie_audio.to_float32(clip), rate,
+                                                       spotter.sample_rate)
+                        spotter.add_template(phrase, clip)
+        spotter.calibrate()
+        return spotter
+
+
+def record_clip(stream, reader, timeout=10.0):
+    """Record one short utterance from the stream as float32 16 kHz audio (or None)."""
+    evie_listen = load_module(SCRIPT_DIR / "evie-listen.py")
+    pcm = evie_listen.record_utterance(
+        reader.chunks(), stream.sample_rate,
+        timeout=timeout,
+        hangover=0.5,
+        max_duration=4.0,
+        verbose=False,
+        vad=evie_listen.stream_vad(stream),
+    )
+    if pcm is None:
+        return None
+    return evie_listen.pcm_to_samples(pcm, stream.sample_rate)
+
+
+def enroll(args):
+    """Record samples of each phrase from the microphone and save them."""
+    evie_listen = load_module(SCRIPT_DIR / "evie-listen.py")
+    phrases = args.phrases or default_phrases()
+    spotter = KeywordSpotter.load(args.dir)
+    stream = evie_listen.get_microphone_stream(args.mic)
+    time.sleep(0.5)  # Let the noise floor settle
+
+    for phrase in phrases:
+        if args.replace:
+            spotter.remove(phrase)
+        print(f"\n[Evie] Enrolling '{phrase}' - say it {args.samples} times, pausing between.")
+        recorded = 0
+        while recorded < args.samples:
+            print(f"[Evie] ({recorded + 1}/{args.samples}) Say: {phrase}")
+            reader = stream.reader()
+            samples = record_clip(stream, reader)
+            if samples is None:
+                print("[Evie] Didn't hear anything, try again.")
+                continue
+            seconds = len(samples) / float(KWS_SAMPLE_RATE)
+            spotter.add_template(phrase, samples)
+            recorded += 1
+            print(f"[Evie] Got it ({seconds:.1f}s).")
+
+    spotter.save(args.dir)
+    spotter.calibrate()
+    print()
+    show(spotter)
+
+
+def show(spotter):
+    """Print enrolled phrases and thresholds."""
+    if not spotter.phrases:
+        print("[Evie] No phrases enrolled. Run: python evie-kws.py enroll")
+        return
+    for phrase in spotter.phrases:
+        print(f"  {phrase:<24} {len(spotter.clips[phrase])} template(s)   "
+              f"threshold {spotter.thresholds[phrase]:.3f}")
+
+
+def live_test(args):
+    """Score the latest audio every half second and print the results."""
+    evie_listen = load_module(SCRIPT_DIR / "evie-listen.py")
+    spotter = KeywordSpotter.load(args.dir, sensitivity=args.sensitivity)
+    if not spotter.phrases:
+        show(spotter)
+        return
+    stream = evie_listen.get_microphone_stream(args.mic)
+    print("[Evie] Listening for enrolled phrases (Ctrl+C to stop)...")
+    try:
+        while True:
+            time.sleep(0.5)
+            samples = evie_listen.pcm_to_samples(stream.latest(2.5), stream.sample_rate)
+            started = time.perf_counter()
+            hit = spotter.detect(samples)
+            elapsed = (time.perf_counter() - started) * 1000
+            if hit:
+                print(f"[Evie] Heard '{hit.phrase}' (score {hit.score:.3f}, {elapsed:.1f} ms)")
+    except KeyboardInterrupt:
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evie keyword spotter")
+    parser.add_argument("--dir", type=Path, default=KWS_DIR,
+                        help=f"Template directory (default: {KWS_DIR})")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("enroll", help="Record samples of wake phrases")
+    p.add_argument("phrases", nargs="*", help="Phrases to enroll (default: all wake and exit phrases)")
+    p.add_argument("--samples", "-n", type=int, default=3, help="Recordings per phrase (default: 3)")
+    p.add_argument("--mic", "-m", type=int, default=None, help="Microphone index")
+    p.add_argument("--replace", action="store_true", help="Discard existing templates for these phrases")
+    p.set_defaults(func=enroll)
+
+    p = sub.add_parser("list", help="Show enrolled phrases")
+    p.set_defaults(func=lambda args: show(KeywordSpotter.load(args.dir)))
+
+    p = sub.add_parser("remove", help="Delete a phrase's templates")
+    p.add_argument("phrase")
+    p.set_defaults(func=lambda args: (Path(args.dir) / phrase_filename(args.phrase)).unlink(missing_ok=True))
+
+    p = sub.add_parser("test", help="Print spotter hits from the live microphone")
+    p.add_argument("--mic", "-m", type=int, default=None, help="Microphone index")
+    p.add_argument("--sensitivity", type=float, default=1.0,
+                   help="Threshold multiplier, >1 fires more easily (default: 1.0)")
+    p.set_defaults(func=live_test)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
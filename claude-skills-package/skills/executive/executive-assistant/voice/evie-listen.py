@@ -5,15 +5,25 @@ Captures audio from microphone and transcribes using Whisper
 
 Usage:
     python evie-listen.py                    # Listen once, return text
+    python evie-listen.py --vad              # Listen once, stop when you stop talking
+    python evie-listen.py --stream           # ...printing live partial text while you talk
     python evie-listen.py --continuous       # Keep listening until "goodbye Evie"
+    python evie-listen.py -c --workers 2     # ...transcribing on two model copies at once
     python evie-listen.py --wake-word        # Wait for "Hey Evie" to activate
     python evie-listen.py --timeout 10       # Listen for 10 seconds max
+    python evie-listen.py --stt-backend faster-whisper  # int8 CTranslate2 engine
+    python evie-listen.py --model cascade    # tiny first, re-decode with base only when unsure
+    python evie-listen.py --denoise --model tiny  # Suppress fan noise so tiny copes
+    python evie-listen.py --batch voicemails/ -o voicemails.jsonl  # Transcribe recordings
+    python evie-listen.py --vad --source clips/hey.wav    # Listen to a recording instead of the mic
 """
 
 import subprocess
 import sys
 import argparse
 import os
+import _thread
+from pathlib import Path
 
 # Ensure ffmpeg is in PATH for Whisper (Windows fix)
 if sys.platform == "win32":
@@ -26,7 +36,6 @@ def ensure_deps():
     deps = [
         ("speech_recognition", "SpeechRecognition"),
         ("pyaudio", "pyaudio"),
-        ("whisper", "openai-whisper"),
     ]
     for module, package in deps:
         try:
@@ -38,59 +47,198 @@ def ensure_deps():
 ensure_deps()
 
 import speech_recognition as sr
-import whisper
-import tempfile
 import warnings
 import wave
 import numpy as np
 import io
+import importlib
+import json
+import multiprocessing
+import re
+import queue
+import threading
+import time
+from collections import OrderedDict, deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
 
 # Suppress whisper FP16 warning on CPU
 warnings.filterwarnings("ignore", message="FP16 is not supported on CPU")
 
+SCRIPT_DIR = Path(__file__).parent
 
-def normalize_audio(wav_data, gain=10.0):
+# Spawned batch workers import this file by its own name ("evie-listen");
+# register it under the name load_module() uses so pickled functions resolve
+if __name__ == "evie-listen":
+    sys.modules.setdefault("evie_listen", sys.modules[__name__])
+
+
+def load_module(module_file):
+    """
+    Load a Python module from a file with dashes in the name.
+
+    Modules are cached in sys.modules so every script in this process
+    shares one copy (and one set of module-level state).
+    """
+    import importlib.util
+    module_name = module_file.stem.replace("-", "_")
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, module_file)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+evie_audio = load_module(SCRIPT_DIR / "evie-audio.py")
+evie_stt = load_module(SCRIPT_DIR / "evie-stt.py")
+
+# Whisper consumes 16 kHz mono float32; capture at this rate when the mic supports it
+WHISPER_SAMPLE_RATE = 16000
+
+# VAD capture defaults
+VAD_HANGOVER = 0.7       # Seconds of silence that end an utterance
+VAD_MAX_DURATION = 30.0  # Hard cap on a single utterance
+
+# Whisper models, smallest first (used to rank fallbacks)
+WHISPER_MODEL_SIZES = ["tiny", "base", "small", "medium", "large"]
+# Resident model memory cap in MB; least recently used models are unloaded
+# beyond it (unset = no cap)
+MODEL_MEMORY_BUDGET_MB = float(os.environ.get("EVIE_MODEL_BUDGET_MB", 0)) or None
+# Speech-to-text engine (see evie-stt.py): "whisper" or "faster-whisper" (int8)
+STT_BACKEND = os.environ.get("EVIE_STT_BACKEND", "whisper")
+
+# Cascade decoding: pass model_size=CASCADE to decode with the first model
+# and only re-decode with the next when the result looks unreliable
+CASCADE = "cascade"
+CASCADE_MODELS = ["tiny", "base"]
+
+# Whisper's own decoding-failure thresholds (same defaults as model.transcribe)
+LOGPROB_THRESHOLD = -1.0           # Mean token log-probability below this is a poor decode
+COMPRESSION_RATIO_THRESHOLD = 2.4  # Text that compresses this well is a repetition loop
+NO_SPEECH_THRESHOLD = 0.6          # Probability above which Whisper thinks there was no speech
+
+# Spectral noise suppression before normalization (EVIE_DENOISE=1 or --denoise);
+# steady fan noise is what otherwise forces `base` over `tiny` for commands
+NOISE_SUPPRESSION = os.environ.get("EVIE_DENOISE", "") not in ("", "0")
+
+# Acoustic echo cancellation of Evie's own voice while she speaks in-process
+# (EVIE_AEC=0 disables it). The speaker reference is read ECHO_LEAD seconds
+# ahead of the mic so timing error in either direction stays inside the
+# canceller's ECHO_TAIL_MS filter
+ECHO_CANCELLATION = os.environ.get("EVIE_AEC", "1") != "0"
+ECHO_TAIL_MS = 256
+ECHO_LEAD = 0.05
+
+# Barge-in (speak_with_barge_in): continuous speech needed to stop playback,
+# and how far above Evie's residual echo a frame must be to count as the user
+BARGE_IN_ONSET_MS = 60
+BARGE_IN_ECHO_MARGIN_DB = 6.0
+
+# Where listening reads audio from: unset = the microphone, otherwise a
+# recording/synthetic source spec for headless runs and repeatable
+# benchmarks (EVIE_AUDIO_SOURCE or --source; see open_audio_source)
+AUDIO_SOURCE = os.environ.get("EVIE_AUDIO_SOURCE") or None
+
+# Recorded audio picked up by batch mode (anything but WAV is decoded with ffmpeg)
+AUDIO_EXTENSIONS = (".wav", ".mp3", ".m4a", ".ogg", ".opus", ".flac", ".webm", ".mp4")
+
+
+_normalizers = {}
+
+def get_normalizer(sample_rate=WHISPER_SAMPLE_RATE):
+    """
+    Shared AudioNormalizer per sample rate.
+
+    One instance per process keeps its DC and gain state between calls, so
+    each utterance starts from the level the previous one settled on.
+    """
+    if sample_rate not in _normalizers:
+        _normalizers[sample_rate] = evie_audio.AudioNormalizer(sample_rate=sample_rate)
+    return _normalizers[sample_rate]
+
+
+_noise_suppressors = {}
+
+def get_noise_suppressor(sample_rate=WHISPER_SAMPLE_RATE):
+    """Shared NoiseSuppressor per sample rate (its noise estimate carries over between clips)."""
+    if sample_rate not in _noise_suppressors:
+        _noise_suppressors[sample_rate] = evie_audio.NoiseSuppressor(sample_rate=sample_rate)
+    return _noise_suppressors[sample_rate]
+
+
+def normalize_samples(samples, sample_rate=WHISPER_SAMPLE_RATE, gain=None,
+                      sample_width=2, channels=1, out=None):
+    """
+    Normalize PCM for transcription: remove DC offset and bring speech to a usable level.
+
+    By default an automatic gain control sets the level (the Logitech C525
+    mic at index 18 needs ~10-20x; louder mics get less and are never
+    clipped). Passing `gain` restores the old fixed-gain behaviour.
+
+    Works on float32 in place; the only allocation is the output array
+    when `out` is not supplied.
+
+    Args:
+        samples: int16 array, float32 array, or raw PCM bytes
+        sample_rate: Rate of the samples (selects the shared normalizer)
+        gain: Fixed amplification factor, or None for automatic gain control
+        sample_width: Bytes per sample when `samples` is raw bytes
+        channels: Interleaved channel count (downmixed to mono)
+        out: Optional preallocated float32 output array
+
+    Returns:
+        float32 mono array in [-1, 1]
+    """
+    if isinstance(samples, np.ndarray):
+        n = samples.size // channels
+    else:
+        n = len(samples) // (sample_width * channels)
+    if out is None:
+        out = np.empty(n, dtype=np.float32)
+
+    if gain is None:
+        return get_normalizer(sample_rate).process(samples, sample_width, channels, out=out)
+
+    x = evie_audio.pcm_to_float32(samples, sample_width, channels, out=out)
+    x -= x.mean()
+    x *= gain
+    np.clip(x, -1.0, 1.0, out=x)
+    return x
+
+
+def normalize_audio(wav_data, gain=None):
     """
-    Normalize audio: remove DC offset and amplify for better transcription.
+    Normalize WAV audio: remove DC offset and bring speech to a usable level.
 
-    The Logitech C525 mic (index 18) captures speech at very low levels,
-    so we amplify by default gain of 10x to reach usable levels for Whisper.
+    Any sample width and channel count is accepted; the result is always
+    16-bit mono (multi-channel input is downmixed).
 
     Args:
         wav_data: Raw WAV bytes from audio.get_wav_data()
-        gain: Amplification factor (default 10.0 for low-level mic)
+        gain: Fixed amplification factor, or None for automatic gain control
 
     Returns:
-        Corrected WAV bytes with DC offset removed and audio amplified
+        Corrected 16-bit mono WAV bytes
     """
-    # Read the WAV data
     with io.BytesIO(wav_data) as wav_io:
         with wave.open(wav_io, 'rb') as wav:
             channels = wav.getnchannels()
             sample_width = wav.getsampwidth()
             framerate = wav.getframerate()
-            n_frames = wav.getnframes()
-            raw_data = wav.readframes(n_frames)
-
-    # Convert to numpy array
-    samples = np.frombuffer(raw_data, dtype=np.int16).copy().astype(np.float64)
-
-    # Remove DC offset (center around zero)
-    samples = samples - samples.mean()
+            raw_data = wav.readframes(wav.getnframes())
 
-    # Amplify the audio (C525 mic has very low output levels)
-    samples = samples * gain
+    samples = normalize_samples(raw_data, framerate, gain=gain,
+                                sample_width=sample_width, channels=channels)
+    samples *= 32767.0
 
-    # Clip to valid range and convert back to int16
-    samples = np.clip(samples, -32768, 32767).astype(np.int16)
-
-    # Write back to WAV format
     output = io.BytesIO()
     with wave.open(output, 'wb') as wav:
-        wav.setnchannels(channels)
-        wav.setsampwidth(sample_width)
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
         wav.setframerate(framerate)
-        wav.writeframes(samples.tobytes())
+        wav.writeframes(samples.astype(np.int16).tobytes())
 
     return output.getvalue()
 
@@ -100,19 +248,300 @@ def remove_dc_offset(wav_data):
     """Backwards compatible alias for normalize_audio."""
     return normalize_audio(wav_data, gain=10.0)
 
-# Global whisper models (loaded once)
-_whisper_models = {}
-_ambient_calibrated = False
+
+def audio_to_samples(audio, gain=None):
+    """
+    Convert captured audio to the float32 16 kHz mono array Whisper expects.
+
+    No WAV encoding, temp files or ffmpeg: the raw PCM is viewed as int16,
+    normalized once and resampled in-process if the mic ran at another rate.
+
+    Args:
+        audio: speech_recognition.AudioData
+        gain: Fixed gain, or None for automatic gain control
+
+    Returns:
+        float32 NumPy array at WHISPER_SAMPLE_RATE
+    """
+    raw = audio.get_raw_data() if audio.sample_width == 2 else audio.get_raw_data(convert_width=2)
+    return pcm_to_samples(np.frombuffer(raw, dtype=np.int16), audio.sample_rate, gain=gain)
+
+
+def pcm_to_samples(pcm, sample_rate, gain=None, denoise=None):
+    """
+    Convert int16 mono PCM at any rate to the float32 16 kHz array Whisper expects.
+
+    Args:
+        pcm: int16 NumPy array
+        sample_rate: Rate the PCM was captured at
+        gain: Fixed gain, or None for automatic gain control
+        denoise: Suppress steady background noise before the gain stage
+                 (None = NOISE_SUPPRESSION), so the AGC does not amplify it
+
+    Returns:
+        float32 NumPy array at WHISPER_SAMPLE_RATE
+    """
+    if NOISE_SUPPRESSION if denoise is None else denoise:
+        pcm = get_noise_suppressor(sample_rate).denoise(pcm)
+    samples = normalize_samples(pcm, sample_rate, gain=gain)
+    if sample_rate != WHISPER_SAMPLE_RATE:
+        samples = evie_audio.resample(samples, sample_rate, WHISPER_SAMPLE_RATE)
+    return samples
+
+def model_rank(model_size):
+    """Position of a model size in WHISPER_MODEL_SIZES ("base.en" ranks as "base")."""
+    base = model_size.split(".")[0].split("-")[0]
+    return WHISPER_MODEL_SIZES.index(base) if base in WHISPER_MODEL_SIZES else len(WHISPER_MODEL_SIZES)
+
+
+class WhisperModelManager:
+    """
+    Loads, caches and unloads Whisper models under a memory budget.
+
+    - preload() loads several sizes in parallel background threads, each
+      followed by a short warm-up decode so the first real request does
+      not pay for lazy initialisation
+    - Models are kept in least-recently-used order; loading one that takes
+      the total over `budget_mb` unloads the least recently used others
+    - get_ready() returns the requested model, or while it is still
+      loading, the largest model that is already usable
+
+    - load_private() loads an extra, uncached copy for exclusive use (a
+      second transcription worker); copies count toward the budget until
+      release_private(), and one that cannot fit is refused
+
+    Per-model resident size and load/warm-up/evict timings are kept in
+    `stats` (see report()). Models are loaded and run through an STT
+    backend from evie-stt.py.
+    """
+
+    def __init__(self, budget_mb=None, warmup=True, backend=None):
+        """
+        Args:
+            budget_mb: Resident memory cap in MB for all models (None = no cap)
+            warmup: Run a one-second silent decode after each load
+            backend: evie-stt backend (default: STT_BACKEND)
+        """
+        self.backend = backend or evie_stt.get_backend(STT_BACKEND)
+        self.budget_mb = budget_mb
+        self.warmup = warmup
+        self._models = OrderedDict()   # size -> model, least recently used first
+        self._loading = {}             # size -> threading.Event set when the load ends
+        self._private = {}             # id(model) -> (size, MB) of copies from load_private()
+        self._model_mb = {}            # size -> MB of one copy, once known
+        self._lock = threading.RLock()
+        self.stats = {}
+
+    def preload(self, sizes):
+        """Start loading each size in its own background thread (returns immediately)."""
+        for size in sizes:
+            self._start_load(size)
+        return self
+
+    def get(self, model_size):
+        """Return a model, loading it (or waiting for its background load) if needed."""
+        while True:
+            with self._lock:
+                if model_size in self._models:
+                    self._touch(model_size)
+                    return self._models[model_size]
+                event = self._loading.get(model_size)
+            if event is None:
+                # Load in this thread (outside the lock, so other models stay usable)
+                event = self._start_load(model_size, background=False)
+            event.wait()
+            with self._lock:
+                if model_size not in self._models and model_size not in self._loading:
+                    failed = self.stats.get(model_size, {}).get("error")
+                    if failed:
+                        raise RuntimeError(f"Whisper model '{model_size}' failed to load: {failed}")
+
+    def get_ready(self, model_size):
+        """
+        The requested model if loaded, otherwise the largest loaded model.
+
+        If no model is loaded yet, waits for the requested one. A requested
+        model that is neither loaded nor loading is started in the background.
+
+        Returns:
+            (model_size actually used, model)
+        """
+        with self._lock:
+            if model_size in self._models:
+                self._touch(model_size)
+                return model_size, self._models[model_size]
+            if self._models:
+                self._start_load(model_size)
+                fallback = max(self._models, key=model_rank)
+                self._touch(fallback)
+                return fallback, self._models[fallback]
+        return model_size, self.get(model_size)
+
+    def ready(self, model_size):
+        return model_size in self._models
+
+    def evict(self, model_size):
+        """Unload a model (it is freed once in-flight decodes finish with it)."""
+        with self._lock:
+            if self._models.pop(model_size, None) is not None:
+                entry = self.stats[model_size]
+                entry["evictions"] += 1
+                entry["resident_mb"] = 0.0
+                entry["last_evicted"] = time.monotonic()
+                print(f"[Evie] Unloaded speech model '{model_size}'.")
+
+    def load_private(self, model_size):
+        """
+        Load an extra copy of a model for one caller's exclusive use.
+
+        The copy is not cached or shared, but it counts toward the memory
+        budget: least recently used cached models (other than the cached
+        copy of the same size) are unloaded to make room for it.
+
+        Returns:
+            The model, or None if it does not fit in the budget
+        """
+        known_mb = self._model_mb.get(model_size)
+        if known_mb is not None and not self._fits(known_mb, keep=model_size):
+            return None
+        print(f"[Evie] Loading an extra copy of speech model '{model_size}'...")
+        model = self.backend.load(model_size)
+        mb = self.backend.memory_mb(model, model_size)
+        with self._lock:
+            self._model_mb[model_size] = mb
+            self._private[id(model)] = (model_size, mb)
+            if not self._enforce_budget(keep=model_size):
+                del self._private[id(model)]
+                return None
+        return model
+
+    def release_private(self, model):
+        """Stop counting a load_private() copy (drop your references to free it)."""
+        with self._lock:
+            self._private.pop(id(model), None)
+
+    def resident_mb(self):
+        with self._lock:
+            return (sum(self.stats[size]["resident_mb"] for size in self._models)
+                    + sum(mb for _, mb in self._private.values()))
+
+    def report(self):
+        """
+        Per-model statistics.
+
+        Returns:
+            {size: {loaded, resident_mb, load_seconds, warmup_seconds, loads, evictions,
+                    private_copies}}
+        """
+        with self._lock:
+            copies = [size for size, _ in self._private.values()]
+            return {size: dict(entry, loaded=size in self._models, private_copies=copies.count(size))
+                    for size, entry in self.stats.items()}
+
+    def _touch(self, model_size):
+        self._models.move_to_end(model_size)
+        self.stats[model_size]["last_used"] = time.monotonic()
+
+    def _start_load(self, model_size, background=True):
+        """Begin loading unless already loaded or loading; returns the completion event."""
+        with self._lock:
+            if model_size in self._loading:
+                return self._loading[model_size]
+            event = threading.Event()
+            if model_size in self._models:
+                event.set()
+                return event
+            self._loading[model_size] = event
+        if background:
+            threading.Thread(target=self._load, args=(model_size, event), daemon=True).start()
+        else:
+            self._load(model_size, event)
+        return event
+
+    def _load(self, model_size, event):
+        entry = None
+        try:
+            print(f"[Evie] Loading speech recognition model ({model_size})...")
+            started = time.perf_counter()
+            model = self.backend.load(model_size)
+            load_seconds = time.perf_counter() - started
+
+            warmup_seconds = 0.0
+            if self.warmup:
+                started = time.perf_counter()
+                self.backend.transcribe(model, np.zeros(WHISPER_SAMPLE_RATE, dtype=np.float32))
+                warmup_seconds = time.perf_counter() - started
+
+            with self._lock:
+                entry = self.stats.setdefault(model_size, {"loads": 0, "evictions": 0})
+                entry.update(load_seconds=load_seconds, warmup_seconds=warmup_seconds,
+                             resident_mb=self.backend.memory_mb(model, model_size), error=None)
+                entry["loads"] += 1
+                self._model_mb[model_size] = entry["resident_mb"]
+                self._models[model_size] = model
+                self._touch(model_size)
+                if not self._enforce_budget(keep=model_size):
+                    print(f"[Evie] Model '{model_size}' does not fit in the {self.budget_mb:.0f} MB budget "
+                          f"alongside the models in use.")
+            print(f"[Evie] Model '{model_size}' ready ({load_seconds:.1f}s load, "
+                  f"{warmup_seconds:.1f}s warm-up, {entry['resident_mb']:.0f} MB).")
+        except Exception as e:
+            with self._lock:
+                self.stats.setdefault(model_size, {"loads": 0, "evictions": 0})["error"] = str(e)
+            print(f"[Evie] Failed to load model '{model_size}': {e}")
+        finally:
+            with self._lock:
+                self._loading.pop(model_size, None)
+            event.set()
+
+    def _enforce_budget(self, keep):
+        """Unload least recently used cached models (never `keep`); False if still over budget."""
+        if self.budget_mb is None:
+            return True
+        while self.resident_mb() > self.budget_mb:
+            victims = [size for size in self._models if size != keep]
+            if not victims:
+                return False
+            self.evict(victims[0])
+        return True
+
+    def _fits(self, extra_mb, keep):
+        """Whether extra_mb more could fit once every evictable cached model is unloaded."""
+        if self.budget_mb is None:
+            return True
+        with self._lock:
+            unevictable = sum(mb for _, mb in self._private.values())
+            if keep in self._models:
+                unevictable += self.stats[keep]["resident_mb"]
+        return unevictable + extra_mb <= self.budget_mb
+
+
+_model_manager = WhisperModelManager(budget_mb=MODEL_MEMORY_BUDGET_MB)
+_model_locks = {}
 _recognizer = None
 
+def get_model_manager():
+    """The process-wide WhisperModelManager."""
+    return _model_manager
+
+def set_stt_backend(name, **kwargs):
+    """
+    Switch the speech-to-text engine (see evie-stt.py).
+
+    Models loaded by the previous backend are dropped; the memory budget is kept.
+    """
+    global _model_manager
+    _model_manager = WhisperModelManager(budget_mb=_model_manager.budget_mb,
+                                         backend=evie_stt.get_backend(name, **kwargs))
+    return _model_manager
+
 def get_whisper_model(model_size="base"):
     """Load whisper model (cached). Supports multiple model sizes."""
-    global _whisper_models
-    if model_size not in _whisper_models:
-        print(f"[Evie] Loading speech recognition model ({model_size})...")
-        _whisper_models[model_size] = whisper.load_model(model_size)
-        print(f"[Evie] Model '{model_size}' ready.")
-    return _whisper_models[model_size]
+    return _model_manager.get(model_size)
+
+def resolve_models(model_size):
+    """Real model sizes behind a model_size argument (CASCADE expands to CASCADE_MODELS)."""
+    return list(CASCADE_MODELS) if model_size == CASCADE else [model_size]
 
 def get_recognizer():
     """Get cached recognizer instance with optimized settings."""
@@ -121,11 +550,546 @@ def get_recognizer():
         _recognizer = sr.Recognizer()
         # Increase pause threshold to avoid cutting off mid-sentence
         _recognizer.pause_threshold = 1.5  # Wait 1.5 sec silence before stopping (default 0.8)
-        _recognizer.non_speaking_duration = 0.8  # Minimum silence before stop
-        _recognizer.dynamic_energy_threshold = True  # Auto-adjust to ambient
-        _recognizer.energy_threshold = 400  # Starting threshold, higher = less sensitive
     return _recognizer
 
+_native_rate_support = {}
+
+def supports_native_rate(mic_index=None):
+    """Check (once per device) whether the mic can capture at 16 kHz directly."""
+    if mic_index not in _native_rate_support:
+        supported = False
+        try:
+            import pyaudio
+            pa = pyaudio.PyAudio()
+            try:
+                if mic_index is None:
+                    device = pa.get_default_input_device_info()["index"]
+                else:
+                    device = mic_index
+                supported = pa.is_format_supported(
+                    WHISPER_SAMPLE_RATE,
+                    input_device=device,
+                    input_channels=1,
+                    input_format=pyaudio.paInt16,
+                )
+            finally:
+                pa.terminate()
+        except (ValueError, OSError, IOError):
+            supported = False
+        _native_rate_support[mic_index] = supported
+    return _native_rate_support[mic_index]
+
+def open_microphone(mic_index=None):
+    """
+    Create an sr.Microphone, capturing at 16 kHz when the device supports it.
+
+    Capturing at Whisper's native rate means no resampling at all; devices
+    that only offer 44.1/48 kHz fall back to their default rate and get
+    resampled in-process by audio_to_samples.
+    """
+    mic_kwargs = {"device_index": mic_index} if mic_index is not None else {}
+    if supports_native_rate(mic_index):
+        mic_kwargs["sample_rate"] = WHISPER_SAMPLE_RATE
+    return sr.Microphone(**mic_kwargs)
+
+
+class MicrophoneStream:
+    """
+    Long-lived microphone capture into a preallocated ring buffer.
+
+    The device is opened once and stays open; PyAudio's callback thread
+    writes every chunk into an evie_audio.RingBuffer, so no audio is lost
+    between listen calls or while Whisper is busy. Consumers address audio
+    by absolute sample index or by time.monotonic() timestamp.
+
+    The callback also feeds an evie_audio.NoiseFloorTracker, so the
+    background noise level is known at all times without a calibration
+    pause; VADs made with stream_vad() and the shared silence gate take
+    their speech threshold from it.
+
+    While Evie is talking through evie-speak-edge.py's in-process player,
+    the callback subtracts her voice with an evie_audio.EchoCanceller fed
+    from the shared evie_audio.PlaybackReference before anything is
+    stored, so every consumer (wake scanning included) hears the room
+    without her. Outside playback the canceller is skipped entirely.
+
+    Usage:
+        stream = get_microphone_stream(18)
+        reader = stream.reader()          # Gapless cursor starting "now"
+        pcm = reader.read(16000 * 3)      # Next 3 seconds, blocks until captured
+        last = stream.latest(2.0)         # Most recent 2 seconds
+        stream.noise_floor_db             # Current background level in dB
+    """
+
+    def __init__(self, mic_index=None, buffer_seconds=60.0, chunk=512, echo_cancel=None,
+                 ring_factory=None):
+        """
+        Args:
+            mic_index: Microphone device index (None = default)
+            buffer_seconds: Ring buffer length
+            chunk: Frames per PyAudio callback (32 ms at 16 kHz; also how late
+                   barge-in can notice speech)
+            echo_cancel: Remove Evie's own playback from the capture (None = ECHO_CANCELLATION)
+            ring_factory: Optional callable(capacity, sample_rate) returning the ring
+                          to capture into, e.g. evie-bus.py's shared-memory ring
+                          (default: a private evie_audio.RingBuffer)
+        """
+        self.mic_index = mic_index
+        self.chunk = chunk
+        self.buffer_seconds = buffer_seconds
+        self.echo_cancel = ECHO_CANCELLATION if echo_cancel is None else echo_cancel
+        self.ring_factory = ring_factory
+        self.sample_rate = None
+        self.ring = None
+        self.noise = None
+        self.echo = None
+        self.reference = None
+        self._echo_offset = None   # Reference index minus ring index while cancelling
+        self._input_latency = 0.0
+        self._pa = None
+        self._stream = None
+        # (monotonic time, absolute sample index) of the latest callback;
+        # replaced as one tuple so readers always see a consistent pair
+        self._anchor = (0.0, 0)
+
+    def start(self):
+        """Open the device and start capturing (idempotent)."""
+        if self._stream is not None:
+            return self
+        import pyaudio
+
+        self._pa = pyaudio.PyAudio()
+        if supports_native_rate(self.mic_index):
+            self.sample_rate = WHISPER_SAMPLE_RATE
+        else:
+            info = (self._pa.get_default_input_device_info() if self.mic_index is None
+                    else self._pa.get_device_info_by_index(self.mic_index))
+            self.sample_rate = int(info["defaultSampleRate"])
+
+        self._init_capture()
+        self._stream = self._pa.open(
+            format=pyaudio.paInt16,
+            channels=1,
+            rate=self.sample_rate,
+            input=True,
+            input_device_index=self.mic_index,
+            frames_per_buffer=self.chunk,
+            stream_callback=self._callback,
+            start=False,
+        )
+        self._input_latency = self._stream.get_input_latency()
+        self._stream.start_stream()
+        return self
+
+    def stop(self):
+        """Stop capturing and release the device."""
+        if self._stream is not None:
+            self._stream.stop_stream()
+            self._stream.close()
+            self._stream = None
+        if self._pa is not None:
+            self._pa.terminate()
+            self._pa = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _init_capture(self):
+        """Create the ring, noise tracker and echo canceller once sample_rate is known."""
+        capacity = int(self.buffer_seconds * self.sample_rate)
+        if self.ring_factory is not None:
+            self.ring = self.ring_factory(capacity, self.sample_rate)
+        else:
+            self.ring = evie_audio.RingBuffer(capacity)
+        self.noise = evie_audio.NoiseFloorTracker(sample_rate=self.sample_rate)
+        if self.echo_cancel:
+            self.reference = evie_audio.playback_reference(self.sample_rate)
+            self.echo = evie_audio.EchoCanceller(sample_rate=self.sample_rate, tail_ms=ECHO_TAIL_MS)
+        self._anchor = (time.monotonic(), 0)
+
+    def _callback(self, in_data, frame_count, time_info, status):
+        import pyaudio
+        self._capture(np.frombuffer(in_data, dtype=np.int16))
+        return (None, pyaudio.paContinue)
+
+    def _capture(self, samples):
+        """Store one captured int16 chunk (echo-cancelled first when Evie is talking)."""
+        if self.echo is not None:
+            samples = self._cancel_echo(samples)
+        self.ring.write(samples)
+        self._anchor = (time.monotonic(), self.ring.write_pos)
+        self.noise.update(samples)
+
+    def _cancel_echo(self, samples):
+        """Subtract recent playback from a captured chunk (no-op when nothing played lately)."""
+        n = len(samples)
+        end_time = self.reference.end_time
+        start_time = time.monotonic() - self._input_latency - float(n) / self.sample_rate
+        if end_time is None or end_time + self.echo.tail_seconds < start_time + ECHO_LEAD:
+            self._echo_offset = None
+            return samples
+
+        # Keep the mic-to-reference mapping fixed while it holds, so callback
+        # timing jitter does not shift the reference under the adaptive filter
+        offset = self.reference.index_at(start_time + ECHO_LEAD) - self.ring.write_pos
+        if self._echo_offset is None:
+            self.echo.restart()
+            self._echo_offset = offset
+        elif abs(offset - self._echo_offset) > self.reference.snap:
+            self._echo_offset = offset
+
+        ref = self.reference.read(self.ring.write_pos + self._echo_offset, n)
+        cleaned = self.echo.process(samples, ref)
+        np.clip(cleaned, -1.0, 1.0, out=cleaned)
+        return (cleaned * 32767.0).astype(np.int16)
+
+    @property
+    def position(self):
+        """Absolute index of the next sample to be captured."""
+        return self.ring.write_pos
+
+    @property
+    def noise_floor_db(self):
+        """Current background noise estimate in dB (None before capture starts)."""
+        return self.noise.floor_db if self.noise is not None else None
+
+    def echo_cancelled_since(self, timestamp):
+        """
+        Whether playback since a time.monotonic() timestamp went through the echo canceller.
+
+        False when echo cancellation is off or Evie spoke through an
+        external player, whose audio the stream cannot subtract.
+        """
+        if self.echo is None:
+            return False
+        end_time = self.reference.end_time
+        return end_time is not None and end_time > timestamp
+
+    def index_at(self, timestamp):
+        """Absolute sample index captured at a time.monotonic() timestamp."""
+        anchor_time, anchor_index = self._anchor
+        return anchor_index + int(round((timestamp - anchor_time) * self.sample_rate))
+
+    def time_at(self, index):
+        """time.monotonic() timestamp at which an absolute sample index was captured."""
+        anchor_time, anchor_index = self._anchor
+        return anchor_time + float(index - anchor_index) / self.sample_rate
+
+    def read(self, start, end):
+        """Copy out samples [start, end) by absolute index (see RingBuffer.read)."""
+        return self.ring.read(start, end)
+
+    def read_time(self, start_time, end_time):
+        """Copy out the audio captured between two time.monotonic() timestamps."""
+        data, _ = self.ring.read(self.index_at(start_time), self.index_at(end_time))
+        return data
+
+    def latest(self, seconds):
+        """The most recent `seconds` of audio."""
+        end = self.ring.write_pos
+        data, _ = self.ring.read(end - int(seconds * self.sample_rate), end)
+        return data
+
+    def reader(self, start=None):
+        """Create an independent gapless cursor (default: starting now)."""
+        return StreamReader(self, self.position if start is None else start)
+
+
+class StreamReader:
+    """
+    Sequential cursor over a MicrophoneStream.
+
+    Each reader keeps its own position, so wake-word scanning and command
+    capture can consume the same audio without reopening the device. If a
+    reader falls more than the ring buffer's length behind, it skips ahead
+    to the oldest audio still held and counts an overrun.
+    """
+
+    def __init__(self, stream, position):
+        self.stream = stream
+        self.position = position
+        self.overruns = 0
+
+    @property
+    def sample_rate(self):
+        return self.stream.sample_rate
+
+    def read(self, n, timeout=None):
+        """
+        Return the next `n` samples, blocking until they have been captured.
+
+        Returns fewer samples only if `timeout` expires first.
+        """
+        target = self.position + n
+        deadline = None if timeout is None else time.monotonic() + timeout
+        poll = float(self.stream.chunk) / self.stream.sample_rate / 2
+        while self.stream.position < target:
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            time.sleep(poll)
+
+        data, start = self.stream.read(self.position, target)
+        if start > self.position:
+            self.overruns += 1
+        self.position = start + len(data)
+        return data
+
+    def chunks(self):
+        """Yield captured audio chunk by chunk, forever."""
+        while True:
+            yield self.read(self.stream.chunk)
+
+    def seek(self, position):
+        """Move the cursor to an absolute sample index."""
+        self.position = position
+
+
+class ReplayStream(MicrophoneStream):
+    """
+    MicrophoneStream fed from recordings or synthetic audio instead of a device.
+
+    A feeder thread writes the items chunk by chunk at `speed` x real time
+    through the same capture path as the microphone (ring buffer, noise
+    tracking), so every listen function, the wake detector and the
+    transcription pipeline run unchanged on machines without audio
+    hardware, and give the same result on every run.
+
+    Playback starts when the first reader is created, so nothing is
+    consumed while models load. After the last item (plus `tail` seconds
+    of silence, so a final utterance can end) `finished` is set and the
+    stream keeps producing silence; with end_session it also ends the
+    session the way Ctrl+C does, which every frontend already handles.
+
+    Usage:
+        stream = ReplayStream(["clips/hey-evie.wav", evie_audio.silence(1.0)], speed=4).start()
+        text = listen_vad(stream=stream)
+    """
+
+    def __init__(self, items, sample_rate=WHISPER_SAMPLE_RATE, speed=1.0, loop=False, gap=0.0,
+                 tail=3.0, end_session=False, buffer_seconds=60.0, chunk=512):
+        """
+        Args:
+            items: Audio file paths and/or float32 or int16 arrays at sample_rate, played in order
+            sample_rate: Rate files are decoded to and replayed at
+            speed: Pace in multiples of real time (4 = four seconds of audio per second)
+            loop: Start over after the last item instead of finishing
+            gap: Seconds of silence between items
+            tail: Seconds of silence after the last item before the source counts as finished
+            end_session: Interrupt the main thread (like Ctrl+C) once finished
+            buffer_seconds: Ring buffer length
+            chunk: Samples per write
+        """
+        if speed <= 0:
+            raise ValueError("Replay speed must be positive")
+        super().__init__(None, buffer_seconds=buffer_seconds, chunk=chunk, echo_cancel=False)
+        self.items = list(items)
+        self.sample_rate = sample_rate
+        self.speed = speed
+        self.loop = loop
+        self.gap = gap
+        self.tail = tail
+        self.end_session = end_session
+        self.finished = threading.Event()
+        self._listening = threading.Event()
+        self._stopping = threading.Event()
+        self._thread = None
+        self._started = 0.0
+        self._written = 0
+
+    def start(self):
+        """Prepare the ring and start the feeder (idempotent; audio flows once someone reads)."""
+        if self._thread is not None:
+            return self
+        self._init_capture()
+        self._thread = threading.Thread(target=self._feed, daemon=True, name="evie-replay")
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop the feeder."""
+        self._stopping.set()
+        self._listening.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    def reader(self, start=None):
+        """Create an independent gapless cursor; the first one starts playback."""
+        reader = super().reader(start)
+        self._listening.set()
+        return reader
+
+    def index_at(self, timestamp):
+        """Absolute sample index played at a time.monotonic() timestamp (replay clock)."""
+        anchor_time, anchor_index = self._anchor
+        return anchor_index + int(round((timestamp - anchor_time) * self.sample_rate * self.speed))
+
+    def time_at(self, index):
+        """time.monotonic() timestamp at which an absolute sample index was played."""
+        anchor_time, anchor_index = self._anchor
+        return anchor_time + float(index - anchor_index) / (self.sample_rate * self.speed)
+
+    def _clips(self):
+        """The items as int16 arrays with gaps between them, forever when looping."""
+        gap = np.zeros(int(self.gap * self.sample_rate), dtype=np.int16)
+        first = True
+        while True:
+            for item in self.items:
+                if not first and len(gap):
+                    yield gap
+                first = False
+                if isinstance(item, (str, Path)):
+                    yield read_pcm_file(item, self.sample_rate)
+                elif item.dtype == np.int16:
+                    yield item
+                else:
+                    yield (np.clip(item, -1.0, 1.0) * 32767).astype(np.int16)
+            if not self.loop:
+                return
+
+    def _write_paced(self, pcm):
+        """Capture pcm chunk by chunk on schedule; False once stopped."""
+        rate = self.sample_rate * self.speed
+        for start in range(0, len(pcm), self.chunk):
+            piece = pcm[start:start + self.chunk]
+            # Like a device, a chunk is available once all of it has been "captured"
+            delay = self._started + (self._written + len(piece)) / rate - time.perf_counter()
+            if (delay > 0 and self._stopping.wait(delay)) or self._stopping.is_set():
+                return False
+            self._capture(piece)
+            self._written += len(piece)
+        return True
+
+    def _feed(self):
+        self._listening.wait()
+        self._started = time.perf_counter()
+        for pcm in self._clips():
+            if not self._write_paced(pcm):
+                return
+        if not self._write_paced(np.zeros(int(self.tail * self.sample_rate), dtype=np.int16)):
+            return
+        self.finished.set()
+        if self.end_session:
+            _thread.interrupt_main()
+        quiet = np.zeros(self.chunk, dtype=np.int16)
+        while self._write_paced(quiet):
+            pass
+
+
+def open_audio_source(spec, mic_index=None, buffer_seconds=60.0):
+    """
+    Create (without starting) the stream an AUDIO_SOURCE spec describes.
+
+    A spec is a comma-separated list of items and options:
+
+        mic, mic:18             The live microphone (default index: mic_index)
+        PATH                    An audio file, or every audio file under a directory
+        silence:SECONDS         Digital silence
+        noise:SECONDS[:DB]      White noise (default -50 dBFS RMS, same noise every run)
+        tone:HZ:SECONDS[:DB]    Sine tone (default -20 dBFS RMS)
+        speed=X                 Replay at X times real time (default 1)
+        gap=SECONDS             Silence between items (default 0)
+        loop                    Start over after the last item
+        hold                    Keep listening to silence at the end instead of ending the session
+
+    Examples: "clips/,gap=1,speed=4" or "noise:3:-45,hey-evie.wav,silence:2"
+
+    Returns:
+        MicrophoneStream for "mic", otherwise a ReplayStream
+
+    Raises:
+        ValueError: Unknown item or option, missing file, or nothing to play
+    """
+    items = []
+    options = {"speed": 1.0, "gap": 0.0, "loop": False, "hold": False}
+    use_mic = False
+    for part in (p.strip() for p in spec.split(",")):
+        if not part:
+            continue
+        name, _, value = part.partition("=")
+        if value and name in ("speed", "gap"):
+            options[name] = float(value)
+        elif part in ("loop", "hold"):
+            options[part] = True
+        elif part == "mic" or part.startswith("mic:"):
+            use_mic = True
+            if part.startswith("mic:"):
+                mic_index = int(part[4:])
+        elif Path(part).exists():
+            # Checked before "kind:args" so Windows drive letters are paths
+            found = find_audio_files([part])
+            if not found:
+                raise ValueError(f"No audio files under {part}")
+            items.extend(found)
+        else:
+            kind, *args = part.split(":")
+            try:
+                args = [float(a) for a in args]
+            except ValueError:
+                args = None
+            if kind == "silence" and args and len(args) == 1:
+                items.append(evie_audio.silence(args[0], WHISPER_SAMPLE_RATE))
+            elif kind == "noise" and args and len(args) in (1, 2):
+                items.append(evie_audio.noise(args[0], WHISPER_SAMPLE_RATE, *args[1:], seed=len(items)))
+            elif kind == "tone" and args and len(args) in (2, 3):
+                items.append(evie_audio.tone(args[0], args[1], WHISPER_SAMPLE_RATE, *args[2:]))
+            else:
+                raise ValueError(f"Unknown audio source item '{part}' (file not found?)")
+
+    if use_mic:
+        if items:
+            raise ValueError("The microphone cannot be combined with replayed audio")
+        return MicrophoneStream(mic_index, buffer_seconds=buffer_seconds)
+    if not items:
+        raise ValueError(f"Audio source '{spec}' has nothing to play")
+    return ReplayStream(items, speed=options["speed"], loop=options["loop"], gap=options["gap"],
+                        end_session=not options["hold"], buffer_seconds=buffer_seconds)
+
+
+_microphone_streams = {}
+
+def get_microphone_stream(mic_index=None, buffer_seconds=60.0):
+    """
+    Get (starting on first use) the shared persistent stream for a mic.
+
+    With AUDIO_SOURCE set, every caller gets that source's stream instead,
+    whichever mic_index it asks for.
+    """
+    key = AUDIO_SOURCE or mic_index
+    if key not in _microphone_streams:
+        if AUDIO_SOURCE:
+            stream = open_audio_source(AUDIO_SOURCE, mic_index, buffer_seconds=buffer_seconds).start()
+        else:
+            stream = MicrophoneStream(mic_index, buffer_seconds=buffer_seconds).start()
+        # The shared silence gate follows the live room noise from now on
+        get_speech_gate(stream.sample_rate, noise_floor=stream.noise)
+        _microphone_streams[key] = stream
+    return _microphone_streams[key]
+
+
+def _as_reader(stream):
+    """
+    Accept a stream (read from now) or an existing reader.
+
+    Streams are a MicrophoneStream or anything with the same interface,
+    such as an evie-bus.py AudioBus fed by another process.
+    """
+    return stream.reader() if hasattr(stream, "reader") else stream
+
+
+def stream_vad(stream):
+    """
+    VoiceActivityDetector whose speech threshold follows a stream's noise tracker.
+
+    Args:
+        stream: MicrophoneStream or StreamReader
+    """
+    stream = getattr(stream, "stream", stream)
+    return evie_audio.VoiceActivityDetector(sample_rate=stream.sample_rate, noise_floor=stream.noise)
+
 def list_microphones():
     """List available microphones."""
     print("\nAvailable Microphones:")
@@ -134,58 +1098,337 @@ def list_microphones():
         print(f"  [{i}] {name}")
     print()
 
-def listen_fixed(duration=3, mic_index=None, model_size="base", verbose=True, warmup=0.3):
+def listen_fixed(duration=3, mic_index=None, model_size="base", verbose=True, stream=None,
+                 gate=True, denoise=None):
     """
     Record audio for a fixed duration and transcribe with Whisper.
 
     This is more reliable than listen() which can have speech detection issues.
     Use this for wake word detection (short duration) and commands (longer duration).
 
+    Recording starts immediately: the shared microphone stream is already
+    running and tracks the room's noise floor continuously, so there is no
+    per-call ambient calibration pause.
+
     Args:
         duration: Seconds to record (default: 3 for wake words, use 8-10 for commands)
         mic_index: Specific microphone index (None = default)
         model_size: Whisper model size ("tiny", "base", "small")
         verbose: Print status messages
-        warmup: Seconds to let mic stabilize before recording (default: 0.3)
+        stream: Optional MicrophoneStream or StreamReader to read from (default:
+                the shared stream for mic_index; a StreamReader continues
+                exactly where its previous read stopped)
+        gate: Skip Whisper entirely when the window contains no speech
+        denoise: Suppress steady background noise first (None = NOISE_SUPPRESSION)
 
     Returns:
         Transcribed text or empty string if nothing detected
     """
-    recognizer = get_recognizer()
-    mic_kwargs = {"device_index": mic_index} if mic_index is not None else {}
-
     try:
-        with sr.Microphone(**mic_kwargs) as source:
-            # Brief warmup to let mic stabilize (helps with DC offset issues)
-            if warmup > 0:
-                recognizer.adjust_for_ambient_noise(source, duration=warmup)
+        reader = _as_reader(stream if stream is not None else get_microphone_stream(mic_index))
+        if verbose:
+            print(f"[Evie] Recording for {duration}s...")
+        pcm = reader.read(int(duration * reader.sample_rate))
+        return transcribe_pcm(pcm, reader.sample_rate, model_size, gate=gate, denoise=denoise)
+    except Exception as e:
+        if verbose:
+            print(f"[Evie] Error: {e}")
+        return ""
 
-            if verbose:
-                print(f"[Evie] Recording for {duration}s...")
 
-            # Use record() with fixed duration - this is reliable
-            audio = recognizer.record(source, duration=duration)
+def transcribe_audio(audio, model_size="base", gate=False):
+    """
+    Transcribe captured audio with Whisper, filtering silence hallucinations.
 
-            # Transcribe with Whisper
-            model = get_whisper_model(model_size)
+    Args:
+        audio: speech_recognition.AudioData
+        model_size: Whisper model size ("tiny", "base", "small")
+        gate: Skip Whisper entirely when the audio contains no speech
 
-            # Remove DC offset from audio (fixes mic bias issues that confuse Whisper)
-            wav_data = remove_dc_offset(audio.get_wav_data())
+    Returns:
+        Transcribed text or empty string if nothing detected
+    """
+    raw = audio.get_raw_data() if audio.sample_width == 2 else audio.get_raw_data(convert_width=2)
+    return transcribe_pcm(np.frombuffer(raw, dtype=np.int16), audio.sample_rate, model_size, gate=gate)
 
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-                f.write(wav_data)
-                temp_path = f.name
 
-            try:
-                # Force English language to avoid DC offset causing wrong language detection
-                result = model.transcribe(temp_path, fp16=False, language='en')
-                text = result["text"].strip()
-                # Filter out Whisper hallucinations on silence
-                if text and not is_whisper_hallucination(text):
-                    return text
-                return ""
-            finally:
-                os.unlink(temp_path)
+_speech_gates = {}
+
+def get_speech_gate(sample_rate=WHISPER_SAMPLE_RATE, noise_floor=None):
+    """
+    Shared SpeechGate per sample rate (its noise floor persists between windows).
+
+    Args:
+        sample_rate: Rate of the audio the gate will check
+        noise_floor: Optional NoiseFloorTracker the gate should take its threshold from
+    """
+    if sample_rate not in _speech_gates:
+        _speech_gates[sample_rate] = evie_audio.SpeechGate(sample_rate=sample_rate)
+    gate = _speech_gates[sample_rate]
+    if noise_floor is not None:
+        gate.vad.noise_floor = noise_floor
+    return gate
+
+
+def get_gate_stats():
+    """
+    Silence gate counters for this process.
+
+    Returns:
+        dict with windows checked, windows gated (Whisper skipped) and the gated fraction
+    """
+    checked = sum(g.checked for g in _speech_gates.values())
+    gated = sum(g.gated for g in _speech_gates.values())
+    return {
+        "checked": checked,
+        "gated": gated,
+        "gated_fraction": float(gated) / checked if checked else 0.0,
+    }
+
+
+def transcribe_pcm(pcm, sample_rate, model_size="base", gate=False, denoise=None):
+    """
+    Transcribe int16 mono PCM, filtering silence hallucinations.
+
+    Args:
+        pcm: int16 NumPy array
+        sample_rate: Rate the PCM was captured at
+        model_size: Whisper model size ("tiny", "base", "small")
+        gate: Skip Whisper entirely when the audio contains no speech
+        denoise: Apply noise suppression (None = NOISE_SUPPRESSION)
+
+    Returns:
+        Transcribed text or empty string if nothing detected
+    """
+    # Silent windows never reach Whisper (which would only hallucinate on them)
+    if gate and not get_speech_gate(sample_rate).has_speech(pcm):
+        return ""
+
+    result = transcribe_result(pcm_to_samples(pcm, sample_rate, denoise=denoise), model_size)
+    text = result["text"].strip()
+    # Filter out Whisper hallucinations on silence
+    if text and not is_whisper_hallucination(text, result):
+        return text
+    return ""
+
+
+def transcribe_samples(samples, model_size="base"):
+    """
+    Transcribe a float32 16 kHz mono array directly (no files, no ffmpeg).
+
+    Args:
+        samples: float32 NumPy array at WHISPER_SAMPLE_RATE
+        model_size: Whisper model size ("tiny", "base", "small")
+
+    Returns:
+        Raw transcribed text (stripped, unfiltered)
+    """
+    return transcribe_result(samples, model_size)["text"].strip()
+
+
+def transcribe_result(samples, model_size="base", **options):
+    """
+    Run Whisper on a float32 16 kHz array and return its full result dict
+    (text, segments with timings and decoding statistics).
+
+    While the requested model is still loading in the background, the
+    largest model that is already loaded is used instead; the result's
+    "model_size" entry says which one ran. model_size=CASCADE runs
+    transcribe_cascade().
+
+    Extra keyword arguments are passed through to model.transcribe().
+    """
+    if model_size == CASCADE:
+        return transcribe_cascade(samples, **options)
+    model_size, model = _model_manager.get_ready(model_size)
+    # Whisper installs decoder hooks per call, so one model decodes one clip at a time
+    with _model_locks.setdefault(model_size, threading.Lock()):
+        result = run_whisper(model, samples, **options)
+    result["model_size"] = model_size
+    return result
+
+
+def segment_is_silence(segment):
+    """Whisper's own no-speech rule: confident there was no speech and a poor decode."""
+    return (segment.get("no_speech_prob", 0.0) > NO_SPEECH_THRESHOLD
+            and segment.get("avg_logprob", 0.0) < LOGPROB_THRESHOLD)
+
+
+def result_is_reliable(result):
+    """
+    Judge a decode from Whisper's per-segment statistics.
+
+    A result is reliable when its speech segments have a duration-weighted
+    mean avg_logprob of at least LOGPROB_THRESHOLD and none of them
+    compresses better than COMPRESSION_RATIO_THRESHOLD (a repetition loop).
+    A result Whisper itself judges to be silence is reliable too: a larger
+    model would not find words there either.
+    """
+    segments = [seg for seg in result.get("segments", []) if not segment_is_silence(seg)]
+    if not segments:
+        return True
+    if max(seg.get("compression_ratio", 0.0) for seg in segments) > COMPRESSION_RATIO_THRESHOLD:
+        return False
+    weights = np.array([max(seg["end"] - seg["start"], 0.01) for seg in segments])
+    logprobs = np.array([seg.get("avg_logprob", 0.0) for seg in segments])
+    return float(np.dot(weights, logprobs) / weights.sum()) >= LOGPROB_THRESHOLD
+
+
+_cascade_stats = {"decodes": 0, "escalated": 0, "seconds": deque(maxlen=1000)}
+
+def transcribe_cascade(samples, models=None, loaded=None, **options):
+    """
+    Decode with the fastest model first and escalate only when needed.
+
+    Each model in `models` (default CASCADE_MODELS, smallest first) runs in
+    turn until one produces a result that result_is_reliable() accepts;
+    the last model's result is used regardless. Clear, short commands
+    therefore cost a tiny-model decode, and only hard audio pays for the
+    larger model.
+
+    `loaded` ({size: model}, e.g. a transcription worker's private copies)
+    decodes with those models instead of the shared cached ones.
+
+    Returns:
+        The accepted result dict, with "model_size" set to the model that
+        produced it and "cascade" listing each attempt as
+        {"model_size", "seconds", "reliable"}
+    """
+    models = list(models or CASCADE_MODELS)
+    attempts = []
+    started = time.perf_counter()
+    for i, size in enumerate(models):
+        step_started = time.perf_counter()
+        if loaded is not None:
+            result = run_whisper(loaded[size], samples, **options)
+            result["model_size"] = size
+        else:
+            result = transcribe_result(samples, size, **options)
+        reliable = result_is_reliable(result)
+        attempts.append({"model_size": result["model_size"],
+                         "seconds": time.perf_counter() - step_started,
+                         "reliable": reliable})
+        if reliable or i == len(models) - 1:
+            break
+        if loaded is None and not _model_manager.ready(models[i + 1]):
+            # Escalating now would only fall back to a model we already ran;
+            # make sure the larger one is on its way for next time
+            _model_manager.preload([models[i + 1]])
+            break
+
+    _cascade_stats["decodes"] += 1
+    _cascade_stats["escalated"] += len(attempts) > 1
+    _cascade_stats["seconds"].append(time.perf_counter() - started)
+    result["cascade"] = attempts
+    return result
+
+
+def get_cascade_stats():
+    """
+    Cascade counters for this process.
+
+    Returns:
+        dict with decodes, how many escalated to a larger model, and median seconds per decode
+    """
+    seconds = _cascade_stats["seconds"]
+    return {
+        "decodes": _cascade_stats["decodes"],
+        "escalated": _cascade_stats["escalated"],
+        "median_seconds": float(np.median(seconds)) if seconds else 0.0,
+    }
+
+
+def run_whisper(model, samples, **options):
+    """Transcribe with the current STT backend (caller handles locking)."""
+    return _model_manager.backend.transcribe(model, samples, **options)
+
+
+def record_utterance(chunks, sample_rate, timeout=None, hangover=VAD_HANGOVER,
+                     max_duration=VAD_MAX_DURATION, verbose=True, vad=None):
+    """
+    Record a single utterance from a chunk stream using voice activity detection.
+
+    Capture starts on speech onset and stops `hangover` seconds after the
+    speaker goes quiet, so the returned audio is just the spoken span
+    (plus a short pre-roll) rather than a fixed-length window.
+
+    Args:
+        chunks: Iterator of int16 audio chunks (arrays or raw bytes)
+        sample_rate: Sample rate of the chunks
+        timeout: Max seconds to wait for speech to start (None = wait forever)
+        hangover: Seconds of silence that end the utterance
+        max_duration: Hard cap on utterance length in seconds
+        verbose: Print status messages
+        vad: VoiceActivityDetector to use, e.g. stream_vad() for a live stream
+             (default: a fresh detector that learns the floor from these chunks)
+
+    Returns:
+        int16 NumPy array for the utterance, or None if no speech started before timeout
+    """
+    vad = vad or evie_audio.VoiceActivityDetector(sample_rate=sample_rate)
+    segmenter = evie_audio.UtteranceSegmenter(
+        sample_rate=sample_rate,
+        vad=vad,
+        hangover_ms=hangover * 1000,
+        max_duration=max_duration,
+    )
+
+    if verbose:
+        print("[Evie] Listening (speak when ready)...")
+
+    waited = 0.0
+    for chunk in chunks:
+        if isinstance(chunk, bytes):
+            chunk = np.frombuffer(chunk, dtype=np.int16)
+        utterances = segmenter.feed(chunk)
+        if utterances:
+            return utterances[0]
+        if not segmenter.in_speech:
+            waited += float(len(chunk)) / sample_rate
+            if timeout is not None and waited >= timeout:
+                return None
+    return segmenter.flush()
+
+
+def listen_vad(mic_index=None, model_size="base", verbose=True, timeout=None,
+               hangover=VAD_HANGOVER, max_duration=VAD_MAX_DURATION, stream=None, denoise=None):
+    """
+    Record one utterance using voice activity detection and transcribe it.
+
+    Drop-in alternative to listen_fixed(): instead of always recording
+    `duration` seconds, capture begins when speech starts and ends after
+    `hangover` seconds of silence. Turn latency becomes
+    speech length + hangover + transcribe. The speech threshold comes from
+    the stream's continuously tracked noise floor, so capture starts at once.
+
+    Args:
+        mic_index: Specific microphone index (None = default)
+        model_size: Whisper model size ("tiny", "base", "small")
+        verbose: Print status messages
+        timeout: Max seconds to wait for speech to start (None = wait forever)
+        hangover: Seconds of silence that end the utterance (default: 0.7)
+        max_duration: Hard cap on utterance length in seconds (default: 30)
+        stream: Optional MicrophoneStream or StreamReader to read from
+                (default: the shared stream for mic_index)
+        denoise: Suppress steady background noise first (None = NOISE_SUPPRESSION)
+
+    Returns:
+        Transcribed text or empty string if nothing detected
+    """
+    try:
+        reader = _as_reader(stream if stream is not None else get_microphone_stream(mic_index))
+        rate = reader.sample_rate
+        pcm = record_utterance(
+            reader.chunks(), rate,
+            timeout=timeout,
+            hangover=hangover,
+            max_duration=max_duration,
+            verbose=verbose,
+            vad=stream_vad(reader),
+        )
+        if pcm is None:
+            return ""
+        return transcribe_pcm(pcm, rate, model_size, denoise=denoise)
 
     except Exception as e:
         if verbose:
@@ -193,47 +1436,923 @@ def listen_fixed(duration=3, mic_index=None, model_size="base", verbose=True, wa
         return ""
 
 
-def is_whisper_hallucination(text):
+PartialTranscript = namedtuple("PartialTranscript",
+                               "text stable_text stable final audio_seconds decode_seconds")
+PartialTranscript.__doc__ = """
+One hypothesis yielded by transcribe_streaming().
+
+Fields:
+    text: Current best transcription of the utterance so far
+    stable_text: Leading words that two consecutive decodes agreed on; these
+                 will not change in later partials
+    stable: True when the whole hypothesis matched the previous decode
+    final: True for the last result of the utterance (decoded after the
+           speaker went quiet and hallucination-filtered)
+    audio_seconds: Length of the audio the hypothesis was decoded from
+    decode_seconds: Seconds Whisper spent producing this hypothesis
+"""
+
+
+def _agreed_prefix(previous, current):
+    """Number of leading words two hypotheses agree on (ignoring case and punctuation)."""
+    n = 0
+    for a, b in zip(previous, current):
+        if normalize_phrase_text(a) != normalize_phrase_text(b):
+            break
+        n += 1
+    return n
+
+
+def transcribe_streaming(stream=None, mic_index=None, model_size="base", interval=0.5,
+                         timeout=None, hangover=VAD_HANGOVER, max_duration=VAD_MAX_DURATION,
+                         final_model=None, vad=None, verbose=False):
+    """
+    Transcribe one utterance while it is being spoken.
+
+    Once speech starts, the growing utterance is re-decoded every `interval`
+    seconds of audio and each hypothesis is yielded as a PartialTranscript,
+    so callers can show live text or start parsing intent before the speaker
+    has finished. Words become stable when two consecutive decodes agree on
+    them (stable words are never retracted). When `hangover` seconds of
+    silence end the utterance, the full audio is decoded once more and a
+    final PartialTranscript is yielded.
+
+    If a decode takes longer than `interval`, the next one waits for at
+    least as much new audio as the decode took, so partial decoding can
+    never fall further and further behind the microphone.
+
+    Args:
+        stream: MicrophoneStream or StreamReader to read from (default: the
+                shared stream for mic_index)
+        mic_index: Microphone index when no stream is given
+        model_size: Whisper model size for partial hypotheses
+        interval: Seconds of new audio between partial decodes
+        timeout: Max seconds to wait for speech to start (None = wait forever)
+        hangover: Seconds of silence that end the utterance
+        max_duration: Hard cap on utterance length in seconds
+        final_model: Model size for the final decode (default: model_size)
+        vad: Optional VoiceActivityDetector (default: stream_vad() of the stream)
+        verbose: Print partial hypotheses as they arrive
+
+    Yields:
+        PartialTranscript for each partial decode, then one with final=True.
+        Nothing is yielded if no speech started before timeout.
+    """
+    reader = _as_reader(stream if stream is not None else get_microphone_stream(mic_index))
+    rate = reader.sample_rate
+    segmenter = evie_audio.UtteranceSegmenter(
+        sample_rate=rate,
+        vad=vad or stream_vad(reader),
+        hangover_ms=hangover * 1000,
+        max_duration=max_duration,
+    )
+
+    step = max(1, int(interval * rate))
+    next_decode = step
+    previous_words = []
+    stable_words = []
+    waited = 0.0
+    pcm = None
+
+    for chunk in reader.chunks():
+        utterances = segmenter.feed(chunk)
+        if utterances:
+            pcm = utterances[0]
+            break
+        if not segmenter.in_speech:
+            waited += float(len(chunk)) / rate
+            if timeout is not None and waited >= timeout:
+                return
+            continue
+
+        audio = segmenter.current()
+        if audio is None or len(audio) < next_decode:
+            continue
+
+        started = time.monotonic()
+        result = transcribe_result(pcm_to_samples(audio, rate), model_size,
+                                   condition_on_previous_text=False)
+        decode_seconds = time.monotonic() - started
+        next_decode = len(audio) + max(step, int(decode_seconds * rate))
+
+        words = result["text"].split()
+        agreed = _agreed_prefix(previous_words, words)
+        if agreed > len(stable_words):
+            stable_words = words[:agreed]
+        stable = bool(words) and agreed == len(words) == len(previous_words)
+        previous_words = words
+
+        partial = PartialTranscript(
+            text=" ".join(words),
+            stable_text=" ".join(stable_words),
+            stable=stable,
+            final=False,
+            audio_seconds=len(audio) / float(rate),
+            decode_seconds=decode_seconds,
+        )
+        if verbose and partial.text:
+            print(f"[Evie] ... {partial.text}")
+        yield partial
+
+    if pcm is None:
+        pcm = segmenter.flush()
+        if pcm is None:
+            return
+
+    started = time.monotonic()
+    result = transcribe_result(pcm_to_samples(pcm, rate), final_model or model_size)
+    decode_seconds = time.monotonic() - started
+    text = result["text"].strip()
+    if is_whisper_hallucination(text, result):
+        text = ""
+
+    yield PartialTranscript(
+        text=text,
+        stable_text=text,
+        stable=True,
+        final=True,
+        audio_seconds=len(pcm) / float(rate),
+        decode_seconds=decode_seconds,
+    )
+
+
+def listen_streaming(mic_index=None, model_size="base", timeout=None, interval=0.5,
+                     on_partial=None, stream=None, verbose=True):
+    """
+    Listen for one utterance with live partial transcription.
+
+    Args:
+        mic_index: Microphone index (None = default)
+        model_size: Whisper model size
+        timeout: Max seconds to wait for speech to start
+        interval: Seconds of new audio between partial decodes
+        on_partial: Optional callback(PartialTranscript) for each partial hypothesis
+        stream: Optional MicrophoneStream or StreamReader to read from
+        verbose: Print status messages and partials
+
+    Returns:
+        Final transcribed text, or "" if nothing was said
+    """
+    if verbose:
+        print("[Evie] Listening (speak when ready)...")
+    text = ""
+    for partial in transcribe_streaming(stream=stream, mic_index=mic_index,
+                                        model_size=model_size, interval=interval,
+                                        timeout=timeout, verbose=verbose):
+        if partial.final:
+            text = partial.text
+        elif on_partial:
+            on_partial(partial)
+    return text
+
+
+BargeIn = namedtuple("BargeIn", "interrupted pcm sample_rate onset_to_stop")
+BargeIn.__doc__ = """
+Outcome of speak_with_barge_in().
+
+Fields:
+    interrupted: True if the user's speech cut playback short
+    pcm: int16 utterance the user spoke over (or right at the end of) playback, or None
+    sample_rate: Rate of `pcm`
+    onset_to_stop: Seconds from the user's speech onset to playback stopping (None if not interrupted)
+"""
+
+_barge_in_stats = {"played": 0, "interrupted": 0, "onset_to_stop": deque(maxlen=1000)}
+
+
+def speak_with_barge_in(say, stream=None, mic_index=None, onset_ms=BARGE_IN_ONSET_MS,
+                        hangover=VAD_HANGOVER, max_duration=VAD_MAX_DURATION, verbose=True):
+    """
+    Play speech while listening for the user talking over it.
+
+    `say(stop_event)` runs in a background thread (typically
+    evie-speak-edge's speak(..., stop_event=stop_event)). Meanwhile the
+    live stream is checked one VAD frame at a time; `onset_ms` of
+    continuous speech sets the event, which stops in-process playback
+    within a few milliseconds, and capture carries on until the user
+    finishes so nothing they said is lost.
+
+    Barge-in only listens while the stream is cancelling Evie's own voice
+    (see MicrophoneStream): the frame threshold is raised to
+    BARGE_IN_ECHO_MARGIN_DB above the canceller's residual echo, so what
+    is left of her voice never interrupts her. Without echo cancellation
+    (disabled, or an external player) playback simply runs to the end.
+
+    Args:
+        say: callable(stop_event) that plays audio and returns early once the event is set
+        stream: Optional MicrophoneStream (default: the shared stream for mic_index)
+        mic_index: Microphone index (None = default)
+        onset_ms: Continuous speech required before playback is stopped
+        hangover: Seconds of silence that end the captured utterance
+        max_duration: Hard cap on the captured utterance in seconds
+        verbose: Print status messages
+
+    Returns:
+        BargeIn
+    """
+    stream = stream if stream is not None else get_microphone_stream(mic_index)
+    stream = getattr(stream, "stream", stream)
+    reader = stream.reader()
+    rate = stream.sample_rate
+    vad = stream_vad(stream)
+    segmenter = evie_audio.UtteranceSegmenter(
+        sample_rate=rate,
+        vad=vad,
+        onset_ms=onset_ms,
+        hangover_ms=hangover * 1000,
+        max_duration=max_duration,
+    )
+    min_energy_db = vad.min_energy_db
+
+    stop = threading.Event()
+    player = threading.Thread(target=say, args=(stop,), daemon=True)
+    started = time.monotonic()
+    player.start()
+
+    onset_to_stop = None
+    utterance = None
+    # Whole VAD frames, so an onset is confirmed exactly at the end of a read
+    while player.is_alive():
+        frame = reader.read(vad.frame_length, timeout=0.1)
+        if not stream.echo_cancelled_since(started) or stream.echo.residual_db is None:
+            continue
+        vad.min_energy_db = max(min_energy_db, stream.echo.residual_db + BARGE_IN_ECHO_MARGIN_DB)
+        utterances = segmenter.feed(frame)
+        if utterances or segmenter.in_speech:
+            utterance = utterances[0] if utterances else None
+            onset_index = reader.position - segmenter.onset_frames * vad.frame_length
+            stop.set()
+            player.join()
+            onset_to_stop = time.monotonic() - stream.time_at(onset_index)
+            break
+    player.join()
+    vad.min_energy_db = min_energy_db
+
+    _barge_in_stats["played"] += 1
+    if onset_to_stop is not None:
+        _barge_in_stats["interrupted"] += 1
+        _barge_in_stats["onset_to_stop"].append(onset_to_stop)
+        if verbose:
+            print(f"[Evie] Interrupted {onset_to_stop * 1000:.0f} ms after you started speaking.")
+
+    # Finish capturing whatever the user started saying during playback
+    if utterance is None and segmenter.in_speech:
+        while utterance is None:
+            utterances = segmenter.feed(reader.read(vad.frame_length))
+            utterance = utterances[0] if utterances else None
+    return BargeIn(onset_to_stop is not None, utterance, rate, onset_to_stop)
+
+
+def get_barge_in_stats():
+    """
+    Barge-in counters for this process.
+
+    Returns:
+        dict with utterances played, how many the user interrupted, and the
+        median and worst seconds from speech onset to playback stopping
+    """
+    delays = _barge_in_stats["onset_to_stop"]
+    return {
+        "played": _barge_in_stats["played"],
+        "interrupted": _barge_in_stats["interrupted"],
+        "median_onset_to_stop": float(np.median(delays)) if delays else 0.0,
+        "max_onset_to_stop": float(max(delays)) if delays else 0.0,
+    }
+
+
+Transcript = namedtuple("Transcript", "text start_index end_index timestamp latency decode_seconds")
+Transcript.__doc__ = """
+One segment transcribed by TranscriptionPipeline.
+
+Fields:
+    text: Filtered transcription ("" for silence, hallucinations or a speech timeout)
+    start_index, end_index: Absolute stream sample range of the segment
+    timestamp: time.monotonic() at which the segment started
+    latency: Seconds from the end of the segment being captured to the text being ready
+    decode_seconds: Seconds Whisper spent on the segment
+"""
+
+
+class TranscriptionPipeline:
+    """
+    Record-while-transcribing: capture and Whisper run concurrently.
+
+    A capture thread cuts the live stream into segments - utterances found
+    by the VAD, or fixed-length windows - and submits each to a pool of
+    transcription workers without waiting for the previous one to finish.
+    Results come back in capture order through results()/next_result() or
+    an `on_result` callback, so the microphone side of the loop is never
+    idle while Whisper is busy.
+
+    Whisper can only decode one clip per model instance at a time, so
+    `workers` > 1 loads an extra private copy of the model for each
+    additional worker (PyTorch releases the GIL, so the copies run on
+    separate cores). With one worker the shared cached model is used.
+    With model_size=CASCADE each extra worker gets a private copy of every
+    model in CASCADE_MODELS. Copies are loaded through the WhisperModelManager, so they count
+    toward its memory budget; when the budget cannot hold another copy,
+    fewer workers run. close() releases them.
+
+    Usage:
+        pipeline = TranscriptionPipeline(get_microphone_stream(18), model_size="base")
+        with pipeline:
+            for transcript in pipeline.results():
+                print(transcript.text)
+    """
+
+    def __init__(self, stream, model_size="base", vad=True, duration=3.0, workers=1,
+                 speech_timeout=None, hangover=VAD_HANGOVER, max_duration=VAD_MAX_DURATION,
+                 max_pending=4, on_result=None):
+        """
+        Args:
+            stream: MicrophoneStream to capture from
+            model_size: Whisper model size ("tiny", "base", "small")
+            vad: Segment by voice activity (True) or into fixed `duration` windows (False)
+            duration: Window length in seconds when vad=False
+            workers: Concurrent transcription workers
+            speech_timeout: With vad, emit an empty Transcript if no speech starts
+                            within this many seconds (None = wait forever)
+            hangover: Seconds of silence that end a VAD utterance
+            max_duration: Hard cap on a VAD utterance in seconds
+            max_pending: Segments that may wait for a worker before capture pauses
+                         (audio keeps going into the ring buffer meanwhile)
+            on_result: Optional callback(Transcript), called in capture order from
+                       a delivery thread
+        """
+        self.stream = stream
+        self.model_size = model_size
+        self.vad = vad
+        self.duration = duration
+        self.workers = max(1, workers)
+        self.speech_timeout = speech_timeout
+        self.hangover = hangover
+        self.max_duration = max_duration
+        self.max_pending = max_pending
+        self.on_result = on_result
+        self.rate = stream.sample_rate
+
+        self._models = None
+        self._private = []
+        self._pending = None
+        self._executor = None
+        self._threads = []
+        self._stop = threading.Event()
+        self.reader = None
+        self.stats = {"segments": 0, "gated": 0, "decoded": 0, "decode_seconds": 0.0, "overruns": 0}
+
+    def start(self, position=None):
+        """Start capturing from an absolute sample index (default: now)."""
+        if self._executor is not None:
+            return self
+        if self._models is None:
+            # Worker 0 shares the cached models; the others get private
+            # copies ({size: model}, every size for a cascade)
+            self._models = queue.Queue()
+            self._models.put(None)
+            for _ in range(self.workers - 1):
+                private = self._load_private_models()
+                if private is None:
+                    break
+                self._private.append(private)
+                self._models.put(private)
+            if len(self._private) < self.workers - 1:
+                print(f"[Evie] The {_model_manager.budget_mb:.0f} MB model budget only allows "
+                      f"{len(self._private) + 1} of {self.workers} transcription workers.")
+                self.workers = len(self._private) + 1
+
+        self._stop.clear()
+        self._pending = queue.Queue(maxsize=self.max_pending)
+        self._executor = ThreadPoolExecutor(max_workers=self.workers,
+                                            thread_name_prefix="evie-transcribe")
+        self.reader = self.stream.reader(position)
+        self._threads = [threading.Thread(target=self._capture, daemon=True)]
+        if self.on_result is not None:
+            self._threads.append(threading.Thread(target=self._deliver, daemon=True))
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def stop(self):
+        """Stop capturing and drop segments that have not started decoding."""
+        if self._executor is None:
+            return
+        self._stop.set()
+        for thread in self._threads:
+            if thread is not threading.current_thread():
+                thread.join()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._executor = None
+        self.stats["overruns"] += self.reader.overruns
+
+    def close(self):
+        """Stop, and release the workers' private model copies."""
+        self.stop()
+        for models in self._private:
+            for model in models.values():
+                _model_manager.release_private(model)
+        self._private = []
+        self._models = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def next_result(self, timeout=None):
+        """
+        Return the next Transcript in capture order (including empty ones).
+
+        Returns:
+            Transcript, or None if `timeout` expires or the pipeline stops
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return None
+            try:
+                future = self._pending.get(timeout=0.1 if remaining is None else min(0.1, remaining))
+            except queue.Empty:
+                if self._stop.is_set():
+                    return None
+                continue
+            if future is None:
+                return None
+            try:
+                return future.result()
+            except Exception as e:
+                print(f"[Evie] Transcription error: {e}")
+
+    def results(self, include_empty=False):
+        """Yield Transcripts in capture order until the pipeline stops."""
+        while True:
+            transcript = self.next_result()
+            if transcript is None:
+                return
+            if transcript.text or include_empty:
+                yield transcript
+
+    def _deliver(self):
+        for transcript in self.results(include_empty=True):
+            self.on_result(transcript)
+
+    def _capture(self):
+        """Cut the stream into segments and queue them for transcription."""
+        try:
+            segments = self._vad_segments() if self.vad else self._fixed_segments()
+            for pcm, start, end in segments:
+                self.stats["segments"] += 1
+                if pcm is None:
+                    future = self._executor.submit(self._empty, start, end)
+                else:
+                    future = self._executor.submit(self._transcribe, pcm, start, end)
+                while not self._stop.is_set():
+                    try:
+                        self._pending.put(future, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+        finally:
+            try:
+                self._pending.put_nowait(None)
+            except queue.Full:
+                pass
+
+    def _read(self, n):
+        """Read n samples, waking regularly to honour stop(); None once stopped."""
+        pieces, needed = [], n
+        while needed > 0:
+            if self._stop.is_set():
+                return None
+            data = self.reader.read(needed, timeout=0.1)
+            pieces.append(data)
+            needed -= len(data)
+        return np.concatenate(pieces) if len(pieces) > 1 else pieces[0]
+
+    def _fixed_segments(self):
+        n = int(self.duration * self.rate)
+        gate = get_speech_gate(self.rate)
+        while True:
+            start = self.reader.position
+            pcm = self._read(n)
+            if pcm is None:
+                return
+            if not gate.has_speech(pcm):
+                # Still reported, so callers waiting on a window get an answer
+                self.stats["gated"] += 1
+                pcm = None
+            yield pcm, start, start + n
+
+    def _vad_segments(self):
+        segmenter = evie_audio.UtteranceSegmenter(
+            sample_rate=self.rate,
+            vad=stream_vad(self.stream),
+            hangover_ms=self.hangover * 1000,
+            max_duration=self.max_duration,
+        )
+        waited = 0.0
+        while True:
+            chunk = self._read(self.stream.chunk)
+            if chunk is None:
+                return
+            for pcm in segmenter.feed(chunk):
+                # The utterance ended inside this chunk; its span is approximate
+                end = self.reader.position
+                waited = 0.0
+                yield pcm, end - len(pcm), end
+            if segmenter.in_speech:
+                waited = 0.0
+            else:
+                waited += float(len(chunk)) / self.rate
+                if self.speech_timeout is not None and waited >= self.speech_timeout:
+                    waited = 0.0
+                    yield None, self.reader.position, self.reader.position
+
+    def _load_private_models(self):
+        """One worker's private {size: model} set, or None if the budget cannot hold it."""
+        models = {}
+        for size in resolve_models(self.model_size):
+            model = _model_manager.load_private(size)
+            if model is None:
+                for loaded in models.values():
+                    _model_manager.release_private(loaded)
+                return None
+            models[size] = model
+        return models
+
+    def _empty(self, start, end):
+        return Transcript("", start, end, self.stream.time_at(start), 0.0, 0.0)
+
+    def _transcribe(self, pcm, start, end):
+        captured = self.stream.time_at(end)
+        model = self._models.get()
+        try:
+            started = time.perf_counter()
+            samples = pcm_to_samples(pcm, self.rate)
+            if model is None:
+                result = transcribe_result(samples, self.model_size)
+            elif self.model_size == CASCADE:
+                result = transcribe_cascade(samples, loaded=model)
+            else:
+                result = run_whisper(model[self.model_size], samples)
+            decode_seconds = time.perf_counter() - started
+        finally:
+            self._models.put(model)
+
+        self.stats["decoded"] += 1
+        self.stats["decode_seconds"] += decode_seconds
+        text = result["text"].strip()
+        if is_whisper_hallucination(text, result):
+            text = ""
+        return Transcript(text, start, end, self.stream.time_at(start),
+                          max(0.0, time.monotonic() - captured), decode_seconds)
+
+
+WakeDetection = namedtuple("WakeDetection", "wake_word text timestamp start_index end_index wake_end_index")
+WakeDetection.__doc__ = """
+A wake phrase found by SlidingWakeDetector.
+
+Fields:
+    wake_word: The matched phrase (longest match wins, e.g. "hey evie" over "evie")
+    text: Full transcription of the window it was found in
+    timestamp: time.monotonic() at which the phrase started
+    start_index, end_index: Absolute stream sample range of the window
+    wake_end_index: Absolute sample index where the wake phrase ends (from word
+                    timestamps; the window end if they are unavailable)
+"""
+
+
+def normalize_phrase_text(text):
+    """Lowercase and strip punctuation so "Hey, Evie!" matches "hey evie"."""
+    return " ".join(re.sub(r"[^\w\s']", " ", text.lower()).split())
+
+
+def match_wake_word(text, wake_words):
+    """Return the longest wake phrase contained in text, or None."""
+    normalized = f" {normalize_phrase_text(text)} "
+    matches = [w for w in wake_words if f" {normalize_phrase_text(w)} " in normalized]
+    return max(matches, key=len) if matches else None
+
+
+def find_phrase_words(words, phrase):
+    """
+    Locate a phrase in Whisper word timings.
+
+    Args:
+        words: List of {"word", "start", "end"} dicts (result segments' "words")
+        phrase: Phrase to find (punctuation and case are ignored)
+
+    Returns:
+        (first word index, last word index) of the last occurrence, or None
+    """
+    target = normalize_phrase_text(phrase).split()
+    tokens = []   # (token, index of the word it came from)
+    for i, word in enumerate(words):
+        tokens.extend((token, i) for token in normalize_phrase_text(word["word"]).split())
+    for k in range(len(tokens) - len(target), -1, -1):
+        if [t for t, _ in tokens[k:k + len(target)]] == target:
+            return tokens[k][1], tokens[k + len(target) - 1][1]
+    return None
+
+
+def result_words(result):
+    """All word timings of a result made with word_timestamps=True."""
+    return [word for seg in result.get("segments", []) for word in seg.get("words", [])]
+
+
+class SlidingWakeDetector:
+    """
+    Wake-phrase detection over overlapping windows of a continuous stream.
+
+    Every `hop` seconds the detector considers the latest `window` seconds,
+    so a phrase spoken across what used to be a fixed window boundary is
+    always fully inside at least one window.
+
+    Overlap is not paid for twice:
+
+    - VAD features are computed once per hop, for the new audio only, and
+      kept per frame; a window's speech content is known without rescanning
+    - Whisper only runs on windows that contain speech the previous decode
+      has not already covered
+    - With a keyword spotter (evie-kws.py), Whisper only runs on windows
+      where the spotter hears an enrolled phrase; it then confirms the hit.
+      This needs templates for every wake word: while any is missing
+      (see `unenrolled`), every speech window still goes to Whisper
+    - If decoding falls behind real time, stale hops are skipped instead of
+      queued, keeping CPU bounded on slow machines
+
+    Detections are deduplicated across overlapping windows: after a hit,
+    windows that overlap the detected one are not reported again.
+
+    Usage:
+        detector = SlidingWakeDetector(get_microphone_stream(18), WAKE_WORDS)
+        for detection in detector:
+            print(detection.wake_word, detection.timestamp)
+    """
+
+    def __init__(self, stream, wake_words, model_size="tiny", window=2.5, hop=0.75,
+                 min_speech_frames=5, spotter=None):
+        """
+        Args:
+            stream: MicrophoneStream to scan
+            wake_words: Phrases to detect
+            model_size: Whisper model used to transcribe candidate windows
+            window: Window length in seconds
+            hop: Seconds between successive windows (0.5-1.0 is a good range)
+            min_speech_frames: VAD speech frames a window needs before it is decoded
+            spotter: Optional KeywordSpotter that must fire before a window is
+                     decoded (only once every wake word is enrolled)
+        """
+        self.stream = stream
+        self.wake_words = list(wake_words)
+        self.model_size = model_size
+        self.rate = stream.sample_rate
+        self.min_speech_frames = min_speech_frames
+        self.spotter = spotter
+        # Wake words the spotter has no templates for; screening windows
+        # with it would make them impossible to hear
+        self.unenrolled = spotter.missing(self.wake_words) if spotter is not None else []
+
+        self.vad = stream_vad(stream)
+        self.frame_length = self.vad.frame_length
+        # Hops are whole VAD frames so per-frame results line up across hops
+        self.window = int(window * self.rate)
+        self.hop = max(1, int(hop * self.rate) // self.frame_length) * self.frame_length
+        # Speech decision per frame, keyed by absolute frame number
+        self._frames = np.zeros(0, dtype=bool)
+        self._first_frame = 0
+
+        self.stats = {"hops": 0, "decoded": 0, "skipped_silent": 0,
+                      "skipped_covered": 0, "skipped_behind": 0, "skipped_kws": 0,
+                      "decode_seconds": 0.0, "kws_seconds": 0.0}
+        self.reset()
+
+    def reset(self, position=None):
+        """Restart scanning from an absolute sample index (default: now)."""
+        self.reader = self.stream.reader(position)
+        start_frame = self.reader.position // self.frame_length
+        self.reader.seek(start_frame * self.frame_length)
+        self._first_frame = start_frame
+        self._frames = np.zeros(0, dtype=bool)
+        self._decoded_until = -1     # Last speech frame already sent to Whisper
+        self._suppress_until = -1    # Sample index before which detections are duplicates
+
+    def __iter__(self):
+        while True:
+            detection = self.step()
+            if detection is not None:
+                yield detection
+
+    def next_detection(self):
+        """Block until the next wake phrase is detected and return it."""
+        return next(iter(self))
+
+    def step(self):
+        """
+        Consume one hop of audio and evaluate the window ending there.
+
+        Returns:
+            WakeDetection or None
+        """
+        # If Whisper has left us more than a window behind, jump to the present
+        if self.stream.position - self.reader.position > self.window + self.hop:
+            self.stats["skipped_behind"] += 1
+            self.reset(self.stream.position - self.window)
+
+        pcm = self.reader.read(self.hop)
+        self._append_frames(pcm)
+        self.stats["hops"] += 1
+
+        end = self.reader.position
+        start = max(end - self.window, self._first_frame * self.frame_length)
+        first, last = start // self.frame_length, end // self.frame_length
+        speech = np.flatnonzero(self._frames[first - self._first_frame:last - self._first_frame])
+
+        if len(speech) < self.min_speech_frames:
+            self.stats["skipped_silent"] += 1
+            return None
+        last_speech = first + int(speech[-1])
+        if last_speech <= self._decoded_until:
+            self.stats["skipped_covered"] += 1
+            return None
+        if end <= self._suppress_until:
+            # Overlaps a window that already fired; its speech belongs to that detection
+            self._decoded_until = last_speech
+            self.stats["skipped_covered"] += 1
+            return None
+
+        data, start = self.stream.read(start, end)
+        samples = pcm_to_samples(data, self.rate)
+
+        if self.spotter is not None and not self.unenrolled:
+            started = time.perf_counter()
+            hit = self.spotter.detect(samples)
+            self.stats["kws_seconds"] += time.perf_counter() - started
+            if hit is None:
+                # Not covered: the next window may hold more of the phrase
+                self.stats["skipped_kws"] += 1
+                return None
+
+        started = time.perf_counter()
+        result = transcribe_result(samples, self.model_size, word_timestamps=True)
+        self.stats["decode_seconds"] += time.perf_counter() - started
+        self.stats["decoded"] += 1
+        self._decoded_until = last_speech
+
+        text = result["text"].strip()
+        wake = match_wake_word(text, self.wake_words) if text else None
+        if wake is None:
+            return None
+
+        # Place the detection on the phrase's own words (or at least its segment)
+        offset, wake_end = 0.0, end
+        words = result_words(result)
+        span = find_phrase_words(words, wake)
+        if span is not None:
+            offset = words[span[0]]["start"]
+            wake_end = min(end, start + int(words[span[1]]["end"] * self.rate))
+        else:
+            for segment in result.get("segments", []):
+                if match_wake_word(segment["text"], [wake]):
+                    offset = segment["start"]
+                    break
+        self._suppress_until = end + self.window
+        return WakeDetection(wake, text, self.stream.time_at(start) + offset, start, end, wake_end)
+
+    def _append_frames(self, pcm):
+        """Run the VAD on newly captured audio only and append per-frame decisions."""
+        n = (len(pcm) // self.frame_length) * self.frame_length
+        if n:
+            frames = evie_audio.to_float32(pcm[:n]).reshape(-1, self.frame_length)
+            self._frames = np.concatenate([self._frames, self.vad.classify(frames)])
+
+        # Keep only the frames the current window can still see
+        keep = self.window // self.frame_length + 1
+        if len(self._frames) > keep:
+            drop = len(self._frames) - keep
+            self._frames = self._frames[drop:]
+            self._first_frame += drop
+
+
+def listen_after_wake(stream, detection, model_size="base", timeout=1.5, hangover=1.0,
+                      max_duration=VAD_MAX_DURATION, vad=None):
+    """
+    Transcribe whatever the speaker says straight after a wake phrase.
+
+    Reads the continuous stream from where the wake phrase ended (per its
+    word timestamps), so "hey evie, what's on my calendar" said in one
+    breath becomes the command "what's on my calendar" with no second
+    recording window and no spoken prompt in between. Audio already
+    captured while the wake phrase was being confirmed is read straight
+    from the ring buffer.
+
+    Args:
+        stream: MicrophoneStream the detection came from
+        detection: WakeDetection from SlidingWakeDetector
+        model_size: Whisper model size for the command
+        timeout: Seconds after the wake phrase within which the command must start
+        hangover: Seconds of silence that end the command
+        max_duration: Hard cap on the command length in seconds
+        vad: Optional VoiceActivityDetector (default: stream_vad() of the stream)
+
+    Returns:
+        Command text, or "" if nothing followed the wake phrase
+    """
+    reader = stream.reader(detection.wake_end_index)
+    pcm = record_utterance(
+        reader.chunks(), stream.sample_rate,
+        timeout=timeout,
+        hangover=hangover,
+        max_duration=max_duration,
+        vad=vad or stream_vad(stream),
+        verbose=False,
+    )
+    if pcm is None:
+        return ""
+
+    result = transcribe_result(pcm_to_samples(pcm, stream.sample_rate), model_size)
+    text = result["text"].strip()
+    if not text or is_whisper_hallucination(text, result):
+        return ""
+
+    # Word timings are approximate; drop a wake-phrase tail that leaked in
+    words = text.split()
+    tail = normalize_phrase_text(detection.wake_word).split()[-1]
+    if words and normalize_phrase_text(words[0]) == tail:
+        words = words[1:]
+    return " ".join(words).lstrip(",.!? ")
+
+
+WakeCommand = namedtuple("WakeCommand", "wake_word command detection")
+WakeCommand.__doc__ = """
+Result of listen_wake_command().
+
+Fields:
+    wake_word: The wake phrase heard
+    command: What followed it in the same breath ("" for a bare wake word)
+    detection: The underlying WakeDetection
+"""
+
+
+def listen_wake_command(wake_words, stream=None, mic_index=None, wake_model="tiny",
+                        model_size="base", timeout=1.5, spotter=None):
+    """
+    Wait for a wake phrase and capture the command spoken right after it.
+
+    Args:
+        wake_words: Phrases to wait for
+        stream: MicrophoneStream to use (default: the shared stream for mic_index)
+        mic_index: Microphone index when no stream is given
+        wake_model: Whisper model used to confirm wake phrases
+        model_size: Whisper model size for the command
+        timeout: Seconds after the wake phrase within which the command must start
+        spotter: Optional KeywordSpotter (evie-kws.py) to screen wake windows
+
+    Returns:
+        WakeCommand
+    """
+    stream = stream or get_microphone_stream(mic_index)
+    detector = SlidingWakeDetector(stream, wake_words, model_size=wake_model, spotter=spotter)
+    detection = detector.next_detection()
+    command = listen_after_wake(stream, detection, model_size=model_size,
+                                timeout=timeout, vad=detector.vad)
+    return WakeCommand(detection.wake_word, command, detection)
+
+
+def is_whisper_hallucination(text, result=None):
     """
     Check if Whisper output is a hallucination (common on silence/noise).
-    Whisper sometimes generates these phrases when given silence.
-    """
-    hallucinations = [
-        "thank you",
-        "thanks for watching",
-        "subscribe",
-        "like and subscribe",
-        "see you next time",
-        "bye",
-        "goodbye",
-        "thank you for watching",
-        "please subscribe",
-        "...",
-        "you",
-        "the",
-        # Additional patterns discovered during testing
-        "?!?!",
-        "a&m",
-        "techn bi",
-        "...",
-        "。",
-        "!",
-        "?",
-    ]
+
+    With the full result dict, the decision comes from Whisper's own
+    statistics rather than a list of known phrases: text is a
+    hallucination when every segment it came from looks like silence
+    (high no_speech_prob with a poor avg_logprob) or when it is a
+    repetition loop (compression ratio above COMPRESSION_RATIO_THRESHOLD).
+
+    Args:
+        text: Transcribed text
+        result: The result dict the text came from (recommended)
+    """
     text_lower = text.lower().strip()
-    # Check exact matches or very short outputs
+    # Very short outputs and bare punctuation are never real commands
     if len(text_lower) < 3:
         return True
-    # Check if text is mostly punctuation
-    if len(text_lower.replace(".", "").replace("?", "").replace("!", "").strip()) < 2:
+    if len(re.sub(r"[\W_]", "", text_lower)) < 2:
         return True
-    for h in hallucinations:
-        if text_lower == h or text_lower == h + ".":
-            return True
-    return False
+    if result is None:
+        return False
+
+    segments = [seg for seg in result.get("segments", []) if seg.get("text", "").strip()]
+    if not segments:
+        return False
+    if all(segment_is_silence(seg) for seg in segments):
+        return True
+    return any(seg.get("compression_ratio", 0.0) > COMPRESSION_RATIO_THRESHOLD for seg in segments)
 
 
-def listen_once(timeout=5, phrase_limit=None, mic_index=None, use_whisper=True, model_size="base", verbose=True):
+def listen_once(timeout=5, phrase_limit=None, mic_index=None, use_whisper=True, model_size="base", verbose=True,
+                denoise=None):
     """
     Listen for a single utterance and return transcribed text.
 
@@ -244,58 +2363,41 @@ def listen_once(timeout=5, phrase_limit=None, mic_index=None, use_whisper=True,
         use_whisper: Use Whisper (True) or Google Speech API (False)
         model_size: Whisper model size ("tiny", "base", "small") - tiny is fastest
         verbose: Print status messages
+        denoise: Suppress steady background noise first (None = NOISE_SUPPRESSION)
 
     Returns:
         Transcribed text or None if failed
     """
-    global _ambient_calibrated
-
     recognizer = get_recognizer()
-    mic_kwargs = {"device_index": mic_index} if mic_index is not None else {}
 
     try:
-        with sr.Microphone(**mic_kwargs) as source:
-            # Only calibrate ambient noise once per session
-            if not _ambient_calibrated:
-                if verbose:
-                    print("[Evie] Calibrating for ambient noise...")
-                recognizer.adjust_for_ambient_noise(source, duration=0.3)
-                _ambient_calibrated = True
-
-            if verbose:
-                print("[Evie] Listening...")
-            audio = recognizer.listen(
-                source,
-                timeout=timeout,
-                phrase_time_limit=phrase_limit
-            )
-
-            if use_whisper:
-                # Use Whisper for transcription
-                model = get_whisper_model(model_size)
-
-                # Remove DC offset from audio (fixes mic bias issues that confuse Whisper)
-                wav_data = remove_dc_offset(audio.get_wav_data())
-
-                # Save audio to temp file
-                with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-                    f.write(wav_data)
-                    temp_path = f.name
+        stream = get_microphone_stream(mic_index)
+        if verbose:
+            print("[Evie] Listening...")
+        # The stream's tracked noise floor replaces ambient calibration
+        pcm = record_utterance(
+            stream.reader().chunks(), stream.sample_rate,
+            timeout=timeout,
+            hangover=recognizer.pause_threshold,
+            max_duration=phrase_limit,
+            verbose=False,
+            vad=stream_vad(stream),
+        )
+        if pcm is None:
+            return None
 
-                try:
-                    # Force English language to avoid DC offset causing wrong language detection
-                    result = model.transcribe(temp_path, fp16=False, language='en')
-                    text = result["text"].strip()
-                finally:
-                    os.unlink(temp_path)
-            else:
-                # Use Google Speech Recognition (requires internet)
-                text = recognizer.recognize_google(audio)
+        if use_whisper:
+            # Use Whisper for transcription (in-memory, no temp files)
+            text = transcribe_samples(pcm_to_samples(pcm, stream.sample_rate, denoise=denoise), model_size)
+        else:
+            # Use Google Speech Recognition (requires internet)
+            if NOISE_SUPPRESSION if denoise is None else denoise:
+                denoised = get_noise_suppressor(stream.sample_rate).denoise(pcm)
+                pcm = (np.clip(denoised, -1.0, 1.0) * 32767).astype(np.int16)
+            text = recognizer.recognize_google(sr.AudioData(pcm.tobytes(), stream.sample_rate, 2))
 
-            return text
+        return text
 
-    except sr.WaitTimeoutError:
-        return None
     except sr.UnknownValueError:
         return None
     except sr.RequestError as e:
@@ -307,14 +2409,229 @@ def listen_once(timeout=5, phrase_limit=None, mic_index=None, use_whisper=True,
             print(f"[Evie] Error: {e}")
         return None
 
-def listen_continuous(wake_word=None, exit_phrase="goodbye evie", mic_index=None):
+
+def find_audio_files(paths):
+    """Expand files and directories (searched recursively) into a list of audio files."""
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(sorted(p for p in path.rglob("*") if p.suffix.lower() in AUDIO_EXTENSIONS))
+        else:
+            files.append(path)
+    return files
+
+
+def _decode_audio_file(path):
+    """
+    Raw PCM of an audio file as (bytes, channels, sample_width, framerate).
+
+    WAV files are read directly; other formats (voicemail MP3/M4A, etc.)
+    are decoded with ffmpeg to 16 kHz mono.
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".wav":
+        with wave.open(str(path), 'rb') as wav:
+            return (wav.readframes(wav.getnframes()), wav.getnchannels(),
+                    wav.getsampwidth(), wav.getframerate())
+    raw = subprocess.run(
+        ["ffmpeg", "-nostdin", "-v", "error", "-i", str(path),
+         "-f", "s16le", "-ac", "1", "-ar", str(WHISPER_SAMPLE_RATE), "-"],
+        capture_output=True, check=True,
+    ).stdout
+    return raw, 1, 2, WHISPER_SAMPLE_RATE
+
+
+def load_audio_file(path):
+    """
+    Decode an audio file to normalized float32 16 kHz mono.
+
+    Each file gets its own AudioNormalizer, so the gain one recording
+    settled on never carries over to the next.
+    """
+    raw, channels, sample_width, framerate = _decode_audio_file(path)
+    samples = evie_audio.AudioNormalizer(sample_rate=framerate).process(
+        raw, sample_width=sample_width, channels=channels,
+        out=np.empty(len(raw) // (sample_width * channels), dtype=np.float32))
+    if framerate != WHISPER_SAMPLE_RATE:
+        samples = evie_audio.resample(samples, framerate, WHISPER_SAMPLE_RATE)
+    return samples
+
+
+def read_pcm_file(path, sample_rate=WHISPER_SAMPLE_RATE):
+    """
+    Decode an audio file to int16 mono at `sample_rate` with its levels untouched.
+
+    This is what a microphone would have captured, for ReplayStream: gain
+    control and noise tracking then run on the original recording.
+    """
+    raw, channels, sample_width, framerate = _decode_audio_file(path)
+    if channels == 1 and sample_width == 2 and framerate == sample_rate:
+        return np.frombuffer(raw, dtype=np.int16)
+    samples = evie_audio.pcm_to_float32(raw, sample_width=sample_width, channels=channels)
+    if framerate != sample_rate:
+        samples = evie_audio.resample(samples, framerate, sample_rate)
+    return (np.clip(samples, -1.0, 1.0) * 32767).astype(np.int16)
+
+
+def transcribe_file(path, model_size="base"):
+    """
+    Transcribe one recorded audio file.
+
+    Segments that look like silence or repetition loops are dropped, as
+    for live speech, so long recordings keep their real speech even when
+    Whisper hallucinates over a pause.
+
+    Returns:
+        Dict with file, text, segments (start, end, text), model,
+        audio_seconds, load_seconds and decode_seconds; or file and error
+        if the file could not be read
+    """
+    record = {"file": str(path)}
+    try:
+        for size in resolve_models(model_size):
+            _model_manager.get(size)
+        started = time.monotonic()
+        samples = load_audio_file(path)
+        loaded = time.monotonic()
+        result = transcribe_result(samples, model_size)
+        decoded = time.monotonic()
+    except Exception as e:
+        record["error"] = str(e)
+        return record
+
+    segments = [
+        {"start": round(seg["start"], 2), "end": round(seg["end"], 2), "text": seg["text"].strip()}
+        for seg in result.get("segments", [])
+        if not is_whisper_hallucination(seg["text"], {"segments": [seg]})
+    ]
+    record.update(
+        text=" ".join(seg["text"] for seg in segments),
+        segments=segments,
+        model=result["model_size"],
+        audio_seconds=round(len(samples) / float(WHISPER_SAMPLE_RATE), 2),
+        load_seconds=round(loaded - started, 3),
+        decode_seconds=round(decoded - loaded, 3),
+    )
+    return record
+
+
+_batch_backend = None
+
+def _batch_job(path, model_size, backend, cpu_threads):
+    """Process pool task: configure this worker once, then transcribe one file."""
+    global _batch_backend
+    if _batch_backend != backend:
+        set_stt_backend(backend, cpu_threads=cpu_threads)
+        _batch_backend = backend
+    return transcribe_file(path, model_size)
+
+
+def batch_processes(processes, n_files):
+    """Worker process count: `processes` (default: one per core), at most one per file."""
+    return max(1, min(processes or os.cpu_count() or 1, n_files))
+
+
+def transcribe_files(paths, model_size="base", processes=None):
+    """
+    Transcribe recorded audio files across a pool of worker processes.
+
+    Each worker loads its own model once and decodes, normalizes and
+    transcribes whole files, so the parent only hands out paths. The
+    cores are split evenly between workers (each gets cpu_count /
+    processes inference threads) so they do not contend for the CPU and
+    throughput scales with the number of processes. Every worker holds a
+    full copy of the model, so memory grows with `processes` too.
+
+    Args:
+        paths: Audio files and/or directories (searched recursively)
+        model_size: Whisper model size, or CASCADE
+        processes: Worker processes (default: one per core); 1 runs in this process
+
+    Yields:
+        transcribe_file() result dicts, in input order
+    """
+    files = find_audio_files(paths)
+    if not files:
+        return
+    processes = batch_processes(processes, len(files))
+    if processes == 1:
+        for path in files:
+            yield transcribe_file(path, model_size)
+        return
+
+    cpu_threads = max(1, (os.cpu_count() or 1) // processes)
+    backend = _model_manager.backend.name
+    context = multiprocessing.get_context()
+    pool_options = {}
+    if context.get_start_method() != "fork":
+        # Fresh worker interpreters must import this file before they can
+        # unpickle _batch_job (see the alias at the top of the module)
+        if str(SCRIPT_DIR) not in sys.path:
+            sys.path.insert(0, str(SCRIPT_DIR))
+        pool_options = {"initializer": importlib.import_module, "initargs": (Path(__file__).stem,)}
+
+    with ProcessPoolExecutor(max_workers=processes, mp_context=context, **pool_options) as pool:
+        for record in pool.map(_batch_job, files, repeat(model_size), repeat(backend),
+                               repeat(cpu_threads)):
+            yield record
+
+
+def run_batch(paths, output, model_size="base", processes=None, verbose=True):
+    """
+    Transcribe audio files to a JSONL file, one result per line.
+
+    Args:
+        paths: Audio files and/or directories
+        output: Path of the JSONL file to write
+        model_size: Whisper model size, or CASCADE
+        processes: Worker processes (default: one per core)
+        verbose: Print each transcript and the final throughput
+
+    Returns:
+        Dict with files, errors, audio_seconds, wall_seconds, processes and
+        throughput (audio seconds transcribed per wall-clock second)
+    """
+    n_files = len(find_audio_files(paths))
+    stats = {"files": 0, "errors": 0, "audio_seconds": 0.0,
+             "processes": batch_processes(processes, n_files)}
+    if verbose:
+        print(f"[Evie] Transcribing {n_files} files with {stats['processes']} processes...")
+
+    started = time.monotonic()
+    with open(output, "w", encoding="utf-8") as out:
+        for record in transcribe_files(paths, model_size, processes):
+            out.write(json.dumps(record) + "\n")
+            out.flush()
+            stats["files"] += 1
+            stats["audio_seconds"] += record.get("audio_seconds", 0.0)
+            if "error" in record:
+                stats["errors"] += 1
+            if verbose:
+                print(f"[Evie] {record['file']}: {record.get('text', record.get('error'))}")
+
+    stats["wall_seconds"] = time.monotonic() - started
+    stats["throughput"] = stats["audio_seconds"] / max(stats["wall_seconds"], 1e-9)
+    if verbose:
+        print(f"[Evie] {stats['files']} files, {stats['audio_seconds']:.0f}s of audio in "
+              f"{stats['wall_seconds']:.1f}s ({stats['throughput']:.1f} audio-s per second, "
+              f"{stats['errors']} errors) -> {output}")
+    return stats
+
+
+def listen_continuous(wake_word=None, exit_phrase="goodbye evie", mic_index=None,
+                      model_size="base", workers=1):
     """
     Continuously listen and yield transcriptions.
 
+    Runs on a TranscriptionPipeline: the next utterance is being captured
+    while the previous one is still being transcribed.
+
     Args:
         wake_word: If set, only process after hearing this phrase
         exit_phrase: Stop listening when this is heard
         mic_index: Specific microphone index
+        model_size: Whisper model size ("tiny", "base", "small")
+        workers: Concurrent transcription workers
 
     Yields:
         Transcribed text for each utterance
@@ -325,44 +2642,51 @@ def listen_continuous(wake_word=None, exit_phrase="goodbye evie", mic_index=None
     print(f"[Evie] Say '{exit_phrase}' to stop.\n")
 
     waiting_for_wake = wake_word is not None
-
-    while True:
-        if waiting_for_wake:
-            print("[Evie] Waiting for wake word...")
-
-        text = listen_once(timeout=None, phrase_limit=15, mic_index=mic_index)
-
-        if text is None:
-            continue
-
-        text_lower = text.lower().strip()
-
-        # Check for exit
-        if exit_phrase in text_lower:
-            print("[Evie] Goodbye, love. Chat soon.")
-            break
-
-        # Check for wake word
-        if waiting_for_wake:
-            if wake_word.lower() in text_lower:
-                print("[Evie] Yes, love? I'm listening...")
-                waiting_for_wake = False
-                # Remove wake word from text
-                text = text_lower.replace(wake_word.lower(), "").strip()
-                if text:
-                    yield text
-            continue
-
-        # Normal mode - yield the text
-        if text:
-            print(f"[You said] {text}")
-            yield text
-
-        # Reset wake word requirement after each command
-        if wake_word:
-            waiting_for_wake = True
+    if waiting_for_wake:
+        print("[Evie] Waiting for wake word...")
+
+    for size in resolve_models(model_size):
+        get_whisper_model(size)
+    pipeline = TranscriptionPipeline(
+        get_microphone_stream(mic_index),
+        model_size=model_size,
+        workers=workers,
+        max_duration=15,
+    )
+
+    with pipeline:
+        for transcript in pipeline.results():
+            text = transcript.text
+            text_lower = text.lower().strip()
+
+            # Check for exit
+            if exit_phrase in text_lower:
+                print("[Evie] Goodbye, love. Chat soon.")
+                break
+
+            # Check for wake word
+            if waiting_for_wake:
+                if wake_word.lower() in text_lower:
+                    print("[Evie] Yes, love? I'm listening...")
+                    waiting_for_wake = False
+                    # Remove wake word from text
+                    text = text_lower.replace(wake_word.lower(), "").strip()
+                    if text:
+                        yield text
+                continue
+
+            # Normal mode - yield the text
+            if text:
+                print(f"[You said] {text}")
+                yield text
+
+            # Reset wake word requirement after each command
+            if wake_word:
+                waiting_for_wake = True
+                print("[Evie] Waiting for wake word...")
 
 def main():
+    global NOISE_SUPPRESSION, AUDIO_SOURCE
     parser = argparse.ArgumentParser(description="Evie Voice Listener")
     parser.add_argument("--continuous", "-c", action="store_true",
                        help="Continuous listening mode")
@@ -378,6 +2702,27 @@ def main():
                        help="List available microphones")
     parser.add_argument("--google", action="store_true",
                        help="Use Google Speech API instead of Whisper")
+    parser.add_argument("--vad", action="store_true",
+                       help="Stop recording when you stop talking (voice activity detection)")
+    parser.add_argument("--stream", action="store_true",
+                       help="Show partial transcriptions while you are still talking")
+    parser.add_argument("--stt-backend", default=STT_BACKEND, choices=list(evie_stt.BACKENDS),
+                       help=f"Speech-to-text engine (default: {STT_BACKEND})")
+    parser.add_argument("--model", default="base",
+                       help="Whisper model size, or 'cascade' for tiny first, base only when unsure")
+    parser.add_argument("--denoise", action="store_true",
+                       help="Suppress steady background noise (fans, HVAC) before transcribing")
+    parser.add_argument("--workers", type=int, default=1,
+                       help="Concurrent transcription workers in continuous mode (default: 1)")
+    parser.add_argument("--batch", nargs="+", metavar="PATH",
+                       help="Transcribe recorded audio files or directories instead of the microphone")
+    parser.add_argument("--output", "-o", default="transcripts.jsonl",
+                       help="JSONL file for --batch results (default: transcripts.jsonl)")
+    parser.add_argument("--processes", type=int, default=None,
+                       help="Worker processes for --batch (default: one per CPU core)")
+    parser.add_argument("--source", default=AUDIO_SOURCE, metavar="SPEC",
+                       help="Listen to recordings or test signals instead of the mic, "
+                            "e.g. 'clips/,gap=1,speed=4' or 'noise:3,tone:440:1' (see open_audio_source)")
 
     args = parser.parse_args()
 
@@ -385,23 +2730,50 @@ def main():
         list_microphones()
         return
 
+    if args.stt_backend != STT_BACKEND:
+        set_stt_backend(args.stt_backend)
+    if args.denoise:
+        NOISE_SUPPRESSION = True
+    AUDIO_SOURCE = args.source
+
     use_whisper = not args.google
 
+    if args.batch:
+        run_batch(args.batch, args.output, model_size=args.model, processes=args.processes)
+        return
+
     if args.continuous:
         for text in listen_continuous(
             wake_word=args.wake_word,
-            mic_index=args.mic
+            mic_index=args.mic,
+            model_size=args.model,
+            workers=args.workers
         ):
             # In standalone mode, just print
             # When imported, the caller handles the text
             pass
     else:
-        text = listen_once(
-            timeout=args.timeout,
-            phrase_limit=args.phrase_limit,
-            mic_index=args.mic,
-            use_whisper=use_whisper
-        )
+        if args.stream:
+            text = listen_streaming(
+                mic_index=args.mic,
+                timeout=args.timeout,
+                model_size=args.model
+            )
+        elif args.vad:
+            text = listen_vad(
+                mic_index=args.mic,
+                timeout=args.timeout,
+                max_duration=args.phrase_limit or VAD_MAX_DURATION,
+                model_size=args.model
+            )
+        else:
+            text = listen_once(
+                timeout=args.timeout,
+                phrase_limit=args.phrase_limit,
+                mic_index=args.mic,
+                use_whisper=use_whisper,
+                model_size=args.model
+            )
         if text:
             print(f"\n[Transcription] {text}")
             return text
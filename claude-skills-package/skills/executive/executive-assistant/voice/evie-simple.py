@@ -7,6 +7,9 @@ needing Claude Code integration. Perfect for quick hands-free tasks.
 
 Usage:
     python evie-simple.py
+    python evie-simple.py --vad              # Stop recording when you stop talking
+    python evie-simple.py --cascade          # Fast model first, base only when unsure
+    python evie-simple.py --source clips/    # Replay recordings instead of the mic (headless runs)
 """
 
 import subprocess
@@ -20,6 +23,12 @@ import json
 SCRIPT_DIR = Path(__file__).parent
 DEFAULT_MIC_INDEX = 18
 
+# Capture mode: False = fixed-duration recording, True = stop when the speaker goes quiet (VAD)
+USE_VAD = False
+
+# Speech model: "base", or "cascade" to decode with tiny and re-decode with base only when unsure
+STT_MODEL = "base"
+
 # Import Evie's voice modules
 sys.path.insert(0, str(SCRIPT_DIR))
 
@@ -45,12 +54,24 @@ def speak(text, style="default"):
         print(f"[Voice Error] {e}")
 
 def listen(duration=8):
-    """Listen for user speech."""
+    """
+    Listen for user speech.
+
+    With USE_VAD, `duration` is how long to wait for speech to start and
+    recording stops as soon as the speaker goes quiet.
+    """
     try:
+        if USE_VAD:
+            return listen_module.listen_vad(
+                timeout=duration,
+                mic_index=DEFAULT_MIC_INDEX,
+                model_size=STT_MODEL,
+                verbose=False
+            )
         return listen_module.listen_fixed(
             duration=duration,
             mic_index=DEFAULT_MIC_INDEX,
-            model_size="base",
+            model_size=STT_MODEL,
             verbose=False
         )
     except Exception as e:
@@ -241,5 +262,28 @@ def run_assistant():
             print(f"[Error] {e}")
             speak("Sorry, I had a hiccup. Let's try again.")
 
-if __name__ == "__main__":
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Evie Simple - Voice Assistant")
+    parser.add_argument("--vad", action="store_true",
+                       help="Stop recording when you stop talking instead of fixed-length windows")
+    parser.add_argument("--cascade", action="store_true",
+                       help="Transcribe with the fast model first, re-check with base only when unsure")
+    parser.add_argument("--source", default=None, metavar="SPEC",
+                       help="Listen to recordings or test signals instead of the mic, e.g. 'clips/,gap=1' "
+                            "(see evie-listen.py open_audio_source)")
+
+    args = parser.parse_args()
+
+    global USE_VAD, STT_MODEL
+    USE_VAD = args.vad
+    if args.source:
+        listen_module.AUDIO_SOURCE = args.source
+    if args.cascade:
+        STT_MODEL = listen_module.CASCADE
+
     run_assistant()
+
+if __name__ == "__main__":
+    main()
@@ -8,14 +8,32 @@ Usage:
     python evie-speak-edge.py --play "Your meeting is in 15 minutes."
     python evie-speak-edge.py --save greeting.mp3 "Good morning, darling."
     python evie-speak-edge.py --natural "I will check that for you"  # Auto-converts to natural speech
+    python evie-speak-edge.py --cache-stats  # Size of the phrase cache
+    python evie-speak-edge.py --clear-cache  # Empty it
+
+Phrases are cached on disk after their first synthesis (see TTSCache), so
+repeated lines play immediately and without network access.
 """
 
 import subprocess
 import sys
 import asyncio
 import argparse
+import hashlib
+import io
+import json
+import os
+import atexit
+import functools
 import re
 import random
+import statistics
+import threading
+import time
+import unicodedata
+import wave
+from collections import deque, namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 import tempfile
 
@@ -27,6 +45,46 @@ except ImportError:
     subprocess.run([sys.executable, "-m", "pip", "install", "edge-tts"], check=True)
     import edge_tts
 
+SCRIPT_DIR = Path(__file__).parent
+
+
+def load_module(module_file):
+    """Load a Python module from a file with dashes in the name (shared via sys.modules)."""
+    import importlib.util
+    module_name = module_file.stem.replace("-", "_")
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, module_file)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+# On-disk cache of synthesized phrases, shared by every Evie process
+# (EVIE_TTS_CACHE_MB=0 disables it)
+TTS_CACHE_DIR = Path(os.environ.get("EVIE_TTS_CACHE", Path.home() / ".claude" / "evie-tts-cache"))
+TTS_CACHE_MB = float(os.environ.get("EVIE_TTS_CACHE_MB", 50))
+# Sample rate synthesized speech is decoded to for playback (Edge TTS's own)
+PLAYBACK_RATE = 24000
+# Play Edge TTS audio while it downloads (EVIE_TTS_STREAMING=0 waits for the whole phrase)
+STREAMING_TTS = os.environ.get("EVIE_TTS_STREAMING", "1") != "0"
+# Long passages (speak_sentences): sentences synthesized ahead of the one
+# playing, and Edge TTS requests allowed in flight at once
+SPEECH_LOOK_AHEAD = int(os.environ.get("EVIE_TTS_LOOK_AHEAD", 2))
+TTS_CONCURRENCY = int(os.environ.get("EVIE_TTS_CONCURRENCY", 2))
+# Talk to Edge TTS from one resident event loop (EVIE_TTS_ENGINE=0: asyncio.run per phrase)
+USE_TTS_ENGINE = os.environ.get("EVIE_TTS_ENGINE", "1") != "0"
+# Units shorter than this are joined to the next; longer ones split at clauses
+SENTENCE_MIN_CHARS = 30
+SENTENCE_MAX_CHARS = 250
+# Speech queue priorities (SpeechQueue): higher ones are spoken first, and
+# PRIORITY_HIGH cuts off anything lower that is playing
+PRIORITY_LOW = 0        # Acknowledgements and chatter, fine to drop when stale
+PRIORITY_NORMAL = 1
+PRIORITY_HIGH = 2       # Default for the alert and urgent styles
+STYLE_PRIORITY = {"alert": PRIORITY_HIGH, "urgent": PRIORITY_HIGH}
+
 # Evie's voices - British English
 EVIE_VOICE = "en-GB-SoniaNeural"  # Warm, professional British female
 CONVERSATIONAL_VOICE = "en-GB-LibbyNeural"  # More casual, friendly
@@ -289,75 +347,1357 @@ async def generate_natural_speech(text: str, output_file: str, style: str = "def
     return output_file
 
 
-def play_audio(file_path: str):
-    """Play audio file using system default player."""
+class AudioOutput:
+    """
+    Long-lived in-process speaker stream that plays PCM as it is queued.
+
+    The PyAudio stream is opened once and keeps running (writing silence
+    while idle), so speech starts as soon as its first samples are queued:
+    no device open per phrase, and streamed synthesis (stream_speech) can
+    be played while it is still downloading. Every chunk is published to
+    evie-audio's shared PlaybackReference with the time it reaches the
+    speakers, so a microphone stream in the same process (evie-listen.py)
+    can cancel Evie's voice out of its capture.
+
+    Usage:
+        output = get_audio_output(PLAYBACK_RATE)
+        output.begin()
+        output.play(pcm)                # int16, any number of times
+        output.wait(stop_event)         # until heard, or cut off
+    """
+
+    def __init__(self, sample_rate=PLAYBACK_RATE, chunk=512):
+        """
+        Args:
+            sample_rate: Output sample rate in Hz
+            chunk: Frames per callback (bounds how late a stop takes effect)
+        """
+        self.sample_rate = sample_rate
+        self.chunk = chunk
+        self.first_heard = None     # time.monotonic() the current utterance became audible
+        self.idle_since = None      # time.monotonic() the queued audio last ran out
+        self._queue = deque()
+        self._offset = 0
+        self._queued = 0
+        self._played = 0
+        self._lock = threading.Lock()
+        # Only the callback touches the resampler; stop() just asks for a fresh one
+        self._resampler = None
+        self._resampler_rate = None
+        self._reset_resampler = False
+        self._pa = None
+        self._stream = None
+        self._latency = 0.0
+
+    def start(self):
+        """
+        Open the device and start the stream.
+
+        Returns:
+            False if in-process playback is unavailable (no PyAudio/NumPy or
+            no output device)
+        """
+        try:
+            import numpy as np
+            import pyaudio
+            self._evie_audio = load_module(SCRIPT_DIR / "evie-audio.py")
+        except ImportError:
+            return False
+        self._np = np
+        self._continue = pyaudio.paContinue
+        self._pa = pyaudio.PyAudio()
+        try:
+            self._stream = self._pa.open(format=pyaudio.paInt16, channels=1, rate=self.sample_rate, output=True,
+                                         frames_per_buffer=self.chunk, stream_callback=self._callback, start=False)
+        except (OSError, ValueError):
+            self._pa.terminate()
+            self._pa = None
+            return False
+        self._latency = self._stream.get_output_latency()
+        self._stream.start_stream()
+        return True
+
+    def begin(self):
+        """Start a new utterance (resets first_heard)."""
+        self.first_heard = None
+
+    @property
+    def queued(self):
+        """Samples queued since the stream opened."""
+        return self._queued
+
+    @property
+    def played(self):
+        """Samples taken for playback since the stream opened (all of them once stopped)."""
+        return self._played
+
+    def play(self, pcm):
+        """Queue int16 mono samples behind whatever is still playing."""
+        if len(pcm):
+            with self._lock:
+                self._queue.append(pcm)
+                self._queued += len(pcm)
+
+    def wait(self, stop_event=None):
+        """
+        Block until everything queued has been heard.
+
+        Args:
+            stop_event: Optional threading.Event; setting it cuts playback
+                        off within one chunk (queued audio is discarded)
+
+        Returns:
+            False if stop_event cut playback short
+        """
+        while self._played < self._queued:
+            if stop_event is None:
+                time.sleep(0.01)
+            elif stop_event.wait(0.005):
+                self.stop()
+                return False
+        # The last buffer is still in the device when the callback takes it
+        if stop_event is not None and stop_event.wait(self._latency):
+            self.stop()
+            return False
+        if stop_event is None:
+            time.sleep(self._latency)
+        return True
+
+    def stop(self):
+        """Drop everything queued and take it back out of the echo reference."""
+        with self._lock:
+            self._queue.clear()
+            self._offset = 0
+            self._played = self._queued
+            self._reset_resampler = True
+        self._evie_audio.playback_reference().truncate(time.monotonic())
+
+    def close(self):
+        """Stop and release the device."""
+        if self._stream is not None:
+            self._stream.stop_stream()
+            self._stream.close()
+            self._stream = None
+        if self._pa is not None:
+            self._pa.terminate()
+            self._pa = None
+
+    def _callback(self, in_data, frame_count, time_info, status):
+        np = self._np
+        out = np.zeros(frame_count, dtype=np.int16)
+        filled = 0
+        with self._lock:
+            while filled < frame_count and self._queue:
+                pcm = self._queue[0]
+                take = min(len(pcm) - self._offset, frame_count - filled)
+                out[filled:filled + take] = pcm[self._offset:self._offset + take]
+                filled += take
+                self._offset += take
+                if self._offset == len(pcm):
+                    self._queue.popleft()
+                    self._offset = 0
+            self._played += filled
+            idle = not self._queue
+            if self._reset_resampler:
+                self._resampler = None
+                self._reset_resampler = False
+        if not filled:
+            return (out.tobytes(), self._continue)
+
+        # When the chunk will actually be heard, on the time.monotonic() clock
+        dac_time = time_info.get("output_buffer_dac_time") or 0.0
+        current_time = time_info.get("current_time") or 0.0
+        heard = time.monotonic() + (dac_time - current_time if dac_time and current_time else self._latency)
+        if self.first_heard is None:
+            self.first_heard = heard
+        if idle:
+            self.idle_since = heard + filled / self.sample_rate
+
+        reference = self._evie_audio.playback_reference()
+        samples = out[:filled].astype(np.float32) / 32768.0
+        if reference.sample_rate != self.sample_rate:
+            if self._resampler is None or self._resampler_rate != reference.sample_rate:
+                self._resampler = self._evie_audio.StreamingResampler(self.sample_rate, reference.sample_rate)
+                self._resampler_rate = reference.sample_rate
+            samples = self._resampler.process(samples)
+            if idle:
+                samples = np.concatenate([samples, self._resampler.flush()])
+        reference.add(samples, heard)
+        return (out.tobytes(), self._continue)
+
+
+_audio_outputs = {}
+
+
+def get_audio_output(sample_rate=PLAYBACK_RATE):
+    """
+    The process-wide AudioOutput for a sample rate, opened on first use.
+
+    Returns:
+        AudioOutput, or None when in-process playback is unavailable (the
+        caller should fall back to an external player)
+    """
+    if sample_rate not in _audio_outputs:
+        output = AudioOutput(sample_rate)
+        _audio_outputs[sample_rate] = output if output.start() else None
+        if _audio_outputs[sample_rate] is not None:
+            atexit.register(output.close)
+    return _audio_outputs[sample_rate]
+
+
+def play_wav(file_path: str, stop_event=None) -> bool:
+    """
+    Play a WAV file in-process through the shared AudioOutput.
+
+    Args:
+        file_path: WAV file to play (path or binary file object)
+        stop_event: Optional threading.Event; setting it cuts playback off
+                    within a few milliseconds (queued audio is discarded)
+
+    Returns:
+        False if in-process playback is unavailable (no PyAudio/NumPy or no
+        output device); the caller should fall back to an external player
+    """
+    try:
+        pcm, rate = read_wav_pcm(file_path)
+    except ImportError:
+        return False
+    output = get_audio_output(rate)
+    if output is None:
+        return False
+    output.begin()
+    output.play(pcm)
+    output.wait(stop_event)
+    return True
+
+
+def read_wav_pcm(file_path):
+    """
+    A WAV file as int16 mono samples.
+
+    Args:
+        file_path: WAV file (path or binary file object)
+
+    Returns:
+        (pcm, sample_rate)
+
+    Raises:
+        ImportError: NumPy is not installed
+    """
+    import numpy as np
+    evie_audio = load_module(SCRIPT_DIR / "evie-audio.py")
+    with wave.open(file_path, "rb") as wav:
+        rate = wav.getframerate()
+        samples = evie_audio.pcm_to_float32(wav.readframes(wav.getnframes()),
+                                            wav.getsampwidth(), wav.getnchannels())
+    return (samples * 32767.0).astype(np.int16), rate
+
+
+def run_player(command, stop_event=None):
+    """Run an external player to completion, killing it early if stop_event is set."""
+    if stop_event is None:
+        subprocess.run(command, check=True)
+        return
+    player = subprocess.Popen(command)
+    while player.poll() is None:
+        if stop_event.wait(0.02):
+            player.kill()
+            player.wait()
+            return
+    if player.returncode:
+        raise subprocess.CalledProcessError(player.returncode, command)
+
+
+MEDIA_PLAYER_SCRIPT = (
+    "Add-Type -AssemblyName presentationCore; $player = New-Object System.Windows.Media.MediaPlayer; "
+    "$player.Open('{path}'); Start-Sleep -Milliseconds 500; $player.Play(); "
+    "while($player.Position -lt $player.NaturalDuration.TimeSpan) {{ Start-Sleep -Milliseconds 100 }}; $player.Close()"
+)
+
+
+def play_with_system_player(file_path: str, stop_event=None):
+    """Play an audio file with the platform's command-line player."""
     import platform
 
     system = platform.system()
     if system == "Windows":
         # Use Windows Media Player or default
-        subprocess.run(["powershell", "-c", f"(New-Object Media.SoundPlayer '{file_path}').PlaySync()"], check=True)
+        run_player(["powershell", "-c", f"(New-Object Media.SoundPlayer '{file_path}').PlaySync()"], stop_event)
     elif system == "Darwin":  # macOS
-        subprocess.run(["afplay", file_path], check=True)
+        run_player(["afplay", file_path], stop_event)
     else:  # Linux
-        subprocess.run(["aplay", file_path], check=True)
+        run_player(["aplay", file_path], stop_event)
 
 
-def speak(text: str, style: str = "default", output_file: str = None, play: bool = True, natural: bool = True):
-    """Speak text with Evie's voice."""
+def play_audio(file_path: str, stop_event=None):
+    """Play audio file, in-process when possible (see play_wav), else with the system player."""
+    if file_path.endswith(".wav") and play_wav(file_path, stop_event):
+        return
+    play_with_system_player(file_path, stop_event)
 
-    # Determine output file
-    if output_file:
-        out_path = output_file
-        should_cleanup = False
-    else:
-        # Use temp file
-        temp = tempfile.NamedTemporaryFile(suffix=".mp3", delete=False)
-        out_path = temp.name
+
+def play_audio_data(data: bytes, suffix: str, stop_event=None):
+    """
+    Play audio returned by synthesize_audio().
+
+    WAV plays in-process straight from memory; otherwise the audio goes
+    through a temporary file to an external player (Windows Media Player
+    for MP3, which needs no ffmpeg).
+    """
+    if suffix == ".wav" and play_wav(io.BytesIO(data), stop_event):
+        return
+    temp = tempfile.NamedTemporaryFile(suffix=suffix, delete=False)
+    try:
+        temp.write(data)
         temp.close()
-        should_cleanup = play  # Only cleanup if we're playing
+        if suffix == ".wav":
+            play_with_system_player(temp.name, stop_event)
+        else:
+            run_player(["powershell", "-c", MEDIA_PLAYER_SCRIPT.format(path=temp.name)], stop_event)
+    finally:
+        Path(temp.name).unlink(missing_ok=True)
 
-    print(f"[Evie speaking...]")
 
-    # Generate audio with natural speech
-    if natural:
-        asyncio.run(generate_natural_speech(text, out_path, style))
-    else:
-        asyncio.run(generate_speech(text, out_path, style))
+class TTSCache:
+    """
+    Content-addressed on-disk cache of synthesized speech, shared by all Evie processes.
+
+    An entry is keyed by a SHA-256 of everything that changes the audio:
+    the text actually sent to Edge TTS (after naturalization, whitespace
+    normalized), style, voice, rate, pitch and the naturalization switch.
+    It is stored ready to play, as a PLAYBACK_RATE WAV, or as the MP3 Edge
+    TTS returned when ffmpeg is not installed.
 
-    if output_file:
-        print(f"[OK] Saved to: {output_file}")
+    Several processes can share the directory safely:
+    - New entries are written to a temporary file and renamed into place,
+      so nobody ever reads half an entry.
+    - Hits read the whole file at once, so an entry another process evicts
+      concurrently is just a miss.
+    - Recency is the file's modification time, touched on every hit.
+    - Whenever the directory grows beyond max_bytes, the least recently
+      used entries are deleted.
+
+    Usage:
+        cache = get_tts_cache()
+        entry = cache.get(key)          # (bytes, ".wav" | ".mp3") or None
+        cache.put(key, data, ".wav")
+    """
 
-    if play:
-        # Convert to wav for Windows playback
-        wav_path = out_path.replace(".mp3", ".wav")
+    SUFFIXES = (".wav", ".mp3")
+
+    def __init__(self, directory=None, max_bytes=None):
+        """
+        Args:
+            directory: Cache directory (default: TTS_CACHE_DIR)
+            max_bytes: Size cap (default: TTS_CACHE_MB megabytes)
+        """
+        self.directory = Path(directory or TTS_CACHE_DIR)
+        self.max_bytes = int(TTS_CACHE_MB * 2 ** 20) if max_bytes is None else int(max_bytes)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(text, voice, rate, pitch, style="default", natural=True):
+        """Hex digest identifying the audio for one phrase and voice setting."""
+        text = " ".join(unicodedata.normalize("NFC", text).split())
+        fields = [text, style, voice, rate, pitch, bool(natural), PLAYBACK_RATE]
+        return hashlib.sha256(json.dumps(fields).encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        """Cached (data, suffix) for a key, marking it most recently used; None on a miss."""
+        for suffix in self.SUFFIXES:
+            path = self.directory / (key + suffix)
+            try:
+                data = path.read_bytes()
+            except FileNotFoundError:
+                continue
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+            return data, suffix
+        return None
+
+    def put(self, key, data, suffix):
+        """Store an entry atomically, then evict down to the size cap."""
+        fd, temp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
         try:
-            # Try ffmpeg first
-            result = subprocess.run(
-                ["ffmpeg", "-y", "-i", out_path, "-ar", "22050", wav_path],
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp, self.directory / (key + suffix))
+        except OSError:
+            Path(temp).unlink(missing_ok=True)
+            return
+        self.evict()
+
+    def entries(self):
+        """(mtime, size, path) of every entry, oldest first."""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(self.SUFFIXES):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return sorted(entries)
+
+    def evict(self, max_bytes=None):
+        """
+        Delete least recently used entries until the cache fits in max_bytes.
+
+        Returns:
+            Number of entries deleted
+        """
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        for _, size, path in entries:
+            if total <= max_bytes:
+                break
+            try:
+                os.unlink(path)
+                evicted += 1
+            except FileNotFoundError:
+                pass  # Another process evicted it first
+            except OSError:
+                continue  # Open elsewhere (Windows); try the next one
+            total -= size
+        # Leftovers from writers that crashed before renaming
+        for temp in self.directory.glob("*.tmp"):
+            try:
+                if time.time() - temp.stat().st_mtime > 3600:
+                    temp.unlink()
+            except OSError:
+                pass
+        _tts_cache_stats["evictions"] += evicted
+        return evicted
+
+
+_tts_cache = None
+_tts_cache_stats = {"hits": 0, "misses": 0, "evictions": 0,
+                    "hit_seconds": deque(maxlen=1000), "miss_seconds": deque(maxlen=1000)}
+
+
+def get_tts_cache():
+    """The process-wide TTSCache (None when disabled or the directory is unusable)."""
+    global _tts_cache
+    if _tts_cache is None and TTS_CACHE_MB > 0:
+        try:
+            _tts_cache = TTSCache()
+        except OSError:
+            return None
+    return _tts_cache
+
+
+def get_tts_cache_stats():
+    """
+    TTS cache counters for this process.
+
+    Returns:
+        dict with hits, misses, evictions and the median seconds from
+        request to playable audio for hits (local read) and misses
+        (Edge TTS round trip plus conversion)
+    """
+    hit_seconds = _tts_cache_stats["hit_seconds"]
+    miss_seconds = _tts_cache_stats["miss_seconds"]
+    return {
+        "hits": _tts_cache_stats["hits"],
+        "misses": _tts_cache_stats["misses"],
+        "evictions": _tts_cache_stats["evictions"],
+        "median_hit_seconds": statistics.median(hit_seconds) if hit_seconds else 0.0,
+        "median_miss_seconds": statistics.median(miss_seconds) if miss_seconds else 0.0,
+    }
+
+
+SpeechRequest = namedtuple("SpeechRequest", ["text", "style", "voice", "rate", "pitch", "natural", "key"])
+
+
+def speech_request(text: str, style: str = "default", natural: bool = True, rate: str = None,
+                   pitch: str = None, add_filler: bool = None) -> SpeechRequest:
+    """
+    Settle exactly what Edge TTS will be asked to say.
+
+    Naturalization (which may add a random filler) happens here, once, so
+    the cache key always matches the audio synthesized for it.
+
+    Args:
+        text: What to say
+        style: VOICE_CONFIG style
+        natural: Apply naturalize_text() first
+        rate: Override the style's speaking rate (e.g. "+10%")
+        pitch: Override the style's pitch (e.g. "+2Hz")
+        add_filler: Allow a conversational filler (default: by style)
+    """
+    config = VOICE_CONFIG.get(style, VOICE_CONFIG["default"])
+    rate = rate or config["rate"]
+    pitch = pitch or config["pitch"]
+    if add_filler is None:
+        add_filler = style in ["casual", "greeting", "playful"]
+    spoken = naturalize_text(text, add_filler=add_filler) if natural else text
+    key = TTSCache.key(spoken, config["voice"], rate, pitch, style, natural)
+    return SpeechRequest(spoken, style, config["voice"], rate, pitch, natural, key)
+
+
+def cached_audio(request: SpeechRequest):
+    """Cached (data, suffix) for a request, or None (also when the cache is disabled)."""
+    cache = get_tts_cache()
+    if cache is None:
+        return None
+    started = time.perf_counter()
+    entry = cache.get(request.key)
+    if entry is not None:
+        _tts_cache_stats["hits"] += 1
+        _tts_cache_stats["hit_seconds"].append(time.perf_counter() - started)
+    return entry
+
+
+async def edge_stream(request: SpeechRequest, on_chunk, stop_event=None) -> bool:
+    """
+    Synthesize a request with Edge TTS, passing each MP3 chunk to on_chunk.
+
+    Returns:
+        False if stop_event cut the download short
+    """
+    communicate = edge_tts.Communicate(request.text, request.voice, rate=request.rate, pitch=request.pitch)
+    async for chunk in communicate.stream():
+        if stop_event is not None and stop_event.is_set():
+            return False
+        if chunk["type"] == "audio":
+            on_chunk(chunk["data"])
+    return True
+
+
+class TTSEngine:
+    """
+    Resident Edge TTS client: one asyncio event loop on its own thread.
+
+    Instead of asyncio.run() per phrase (an event loop built and torn down
+    on the caller's thread every time), the engine keeps one loop for the
+    whole process. Any thread can submit work and gets a
+    concurrent.futures.Future back; at most max_concurrency requests are
+    in flight to the service at once, the rest wait their turn on the loop.
+
+    The service takes one synthesis per websocket and edge-tts opens a
+    fresh connection for each, so there is no connection to keep warm
+    between requests; what is saved is the per-call loop setup, and
+    requests from several threads overlap on one loop.
+
+    Usage:
+        engine = get_tts_engine()
+        mp3 = engine.synthesize(request).result()
+        engine.stream(request, on_chunk, stop_event).result()
+        engine.shutdown()
+    """
+
+    def __init__(self, max_concurrency=TTS_CONCURRENCY):
+        """
+        Args:
+            max_concurrency: Edge TTS requests allowed in flight at once
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self._loop = None
+        self._thread = None
+        self._semaphore = None
+        self._closed = False
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive() and not self._closed
+
+    def start(self):
+        """Start the loop thread (returns once the loop is running)."""
+        ready = threading.Event()
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop.call_soon(ready.set)
+            self._loop.run_forever()
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, name="evie-tts-engine", daemon=True)
+        self._thread.start()
+        ready.wait()
+        return self
+
+    def submit(self, coroutine):
+        """
+        Run a coroutine on the engine's loop from any thread.
+
+        Returns:
+            concurrent.futures.Future with its result
+
+        Raises:
+            RuntimeError: The engine has been shut down
+        """
+        if not self.running:
+            coroutine.close()
+        self._check_running()
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+
+    def stream(self, request: SpeechRequest, on_chunk, stop_event=None):
+        """
+        Synthesize a request, passing each MP3 chunk to on_chunk.
+
+        on_chunk runs on the engine's loop, so it must not block for long.
+
+        Returns:
+            Future of True, or False if stop_event cut the download short
+        """
+        self._check_running()
+        return self.submit(self._limited(edge_stream, request, on_chunk, stop_event))
+
+    def synthesize(self, request: SpeechRequest):
+        """Synthesize a whole request; returns a Future of the MP3 bytes."""
+        self._check_running()
+        chunks = []
+
+        async def collect():
+            await edge_stream(request, chunks.append)
+            return b"".join(chunks)
+
+        return self.submit(self._limited(collect))
+
+    def shutdown(self, timeout=2.0):
+        """
+        Stop accepting work, let requests in flight finish for up to
+        `timeout` seconds, cancel the rest and stop the loop thread.
+        """
+        if not self.running:
+            return
+        self._closed = True
+
+        async def drain():
+            pending = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            if pending:
+                _, late = await asyncio.wait(pending, timeout=timeout)
+                for task in late:
+                    task.cancel()
+                await asyncio.gather(*late, return_exceptions=True)
+
+        try:
+            asyncio.run_coroutine_threadsafe(drain(), self._loop).result(timeout + 1.0)
+        except Exception:
+            pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=1.0)
+
+    def _check_running(self):
+        if not self.running:
+            raise RuntimeError("TTS engine is shut down")
+
+    async def _limited(self, coroutine_function, *args):
+        # The coroutine is only created once it has a slot, so nothing
+        # is left un-awaited when queued requests are cancelled
+        async with self._semaphore:
+            return await coroutine_function(*args)
+
+
+_tts_engine = None
+_tts_engine_lock = threading.Lock()
+
+
+def get_tts_engine():
+    """The process-wide TTSEngine, started on first use (None with EVIE_TTS_ENGINE=0)."""
+    global _tts_engine
+    if not USE_TTS_ENGINE:
+        return None
+    with _tts_engine_lock:
+        if _tts_engine is None or not _tts_engine.running:
+            _tts_engine = TTSEngine().start()
+            atexit.register(_tts_engine.shutdown)
+    return _tts_engine
+
+
+def run_edge_stream(request: SpeechRequest, on_chunk, stop_event=None) -> bool:
+    """edge_stream() on the resident TTSEngine, or in a fresh event loop when it is disabled."""
+    engine = get_tts_engine()
+    if engine is None:
+        return asyncio.run(edge_stream(request, on_chunk, stop_event))
+    return engine.stream(request, on_chunk, stop_event).result()
+
+
+def synthesize_audio(request: SpeechRequest, save_mp3: str = None, use_cache: bool = True):
+    """
+    Synthesize a whole phrase with Edge TTS, then convert it for playback.
+
+    Args:
+        request: From speech_request()
+        save_mp3: Also keep Edge TTS's MP3 at this path
+        use_cache: Store the result in the TTS cache
+
+    Returns:
+        (data, suffix): PLAYBACK_RATE WAV bytes and ".wav", or the MP3 and
+        ".mp3" when ffmpeg is not available to convert it
+    """
+    started = time.perf_counter()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        mp3_path = Path(save_mp3) if save_mp3 else Path(temp_dir) / "speech.mp3"
+        wav_path = Path(temp_dir) / "speech.wav"
+        chunks = []
+        run_edge_stream(request, chunks.append)
+        mp3_path.write_bytes(b"".join(chunks))
+        try:
+            converted = subprocess.run(
+                ["ffmpeg", "-y", "-i", str(mp3_path), "-ar", str(PLAYBACK_RATE), "-ac", "1", str(wav_path)],
                 capture_output=True
-            )
-            if result.returncode == 0:
-                play_audio(wav_path)
-                Path(wav_path).unlink(missing_ok=True)
-            else:
-                # Fallback: use PowerShell with Windows Media Player
-                subprocess.run([
-                    "powershell", "-c",
-                    f"Add-Type -AssemblyName presentationCore; $player = New-Object System.Windows.Media.MediaPlayer; $player.Open('{out_path}'); Start-Sleep -Milliseconds 500; $player.Play(); while($player.Position -lt $player.NaturalDuration.TimeSpan) {{ Start-Sleep -Milliseconds 100 }}; $player.Close()"
-                ], check=True)
+            ).returncode == 0
         except FileNotFoundError:
-            # No ffmpeg, try direct
             print("(Install ffmpeg for better audio playback)")
-            subprocess.run([
-                "powershell", "-c",
-                f"Add-Type -AssemblyName presentationCore; $player = New-Object System.Windows.Media.MediaPlayer; $player.Open('{out_path}'); Start-Sleep -Milliseconds 500; $player.Play(); while($player.Position -lt $player.NaturalDuration.TimeSpan) {{ Start-Sleep -Milliseconds 100 }}; $player.Close()"
-            ], check=True)
+            converted = False
+        entry = (wav_path.read_bytes(), ".wav") if converted else (mp3_path.read_bytes(), ".mp3")
+
+    cache = get_tts_cache() if use_cache else None
+    if cache is not None:
+        _tts_cache_stats["misses"] += 1
+        _tts_cache_stats["miss_seconds"].append(time.perf_counter() - started)
+        cache.put(request.key, *entry)
+    return entry
+
+
+def get_speech_audio(request: SpeechRequest, use_cache: bool = True):
+    """Ready-to-play (data, suffix) for a request, from the TTS cache or Edge TTS."""
+    entry = cached_audio(request) if use_cache else None
+    return entry if entry is not None else synthesize_audio(request, use_cache=use_cache)
+
+
+def stream_speech(request: SpeechRequest, on_audio, stop_event=None, sample_rate: int = PLAYBACK_RATE):
+    """
+    Synthesize with Edge TTS, decoding the MP3 while it downloads.
+
+    Chunks from Communicate.stream() are piped into an ffmpeg decoder
+    started alongside the request, and each block of decoded PCM is handed
+    to on_audio as soon as it exists, so playback can begin after the
+    first few hundred milliseconds instead of after the whole phrase.
+
+    Args:
+        request: From speech_request()
+        on_audio: Called (from a reader thread) with each int16 mono block
+        stop_event: Optional threading.Event; setting it abandons the download
+        sample_rate: Rate to decode to
+
+    Returns:
+        The whole phrase as one int16 array, or None if stop_event cut it short
+
+    Raises:
+        FileNotFoundError: ffmpeg is not installed
+    """
+    import numpy as np
+
+    decoder = subprocess.Popen(
+        ["ffmpeg", "-nostdin", "-loglevel", "error", "-probesize", "32", "-analyzeduration", "0",
+         "-fflags", "nobuffer", "-f", "mp3", "-i", "pipe:0",
+         "-f", "s16le", "-ac", "1", "-ar", str(sample_rate), "-flush_packets", "1", "pipe:1"],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, bufsize=0
+    )
+    blocks = []
+
+    def read_pcm():
+        pending = b""
+        while True:
+            data = decoder.stdout.read(8192)
+            if not data:
+                return
+            data = pending + data
+            usable = len(data) - len(data) % 2
+            pending = data[usable:]
+            if usable:
+                pcm = np.frombuffer(data[:usable], dtype=np.int16)
+                blocks.append(pcm)
+                on_audio(pcm)
+
+    reader = threading.Thread(target=read_pcm, daemon=True)
+    reader.start()
+    completed = False
+    try:
+        completed = run_edge_stream(request, decoder.stdin.write, stop_event)
+    except BrokenPipeError:
+        pass
+    finally:
+        try:
+            decoder.stdin.close()
+        except OSError:
+            pass
+        if not completed:
+            decoder.kill()
+        reader.join()
+        decoder.wait()
+    if not completed or decoder.returncode or not blocks:
+        return None
+    return np.concatenate(blocks)
+
+
+def wav_bytes(pcm, sample_rate: int = PLAYBACK_RATE) -> bytes:
+    """int16 mono samples as an in-memory WAV file."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(pcm.tobytes())
+    return buffer.getvalue()
+
+
+_speech_stats = {"played": 0, "streamed": 0, "first_audio_seconds": deque(maxlen=1000)}
+
+
+def get_speech_stats():
+    """
+    Playback latency for this process (in-process playback only).
+
+    Returns:
+        dict with phrases played, how many were streamed from Edge TTS, and
+        the median, 90th percentile and latest seconds from speak() being
+        called to the first sound reaching the speakers
+    """
+    seconds = list(_speech_stats["first_audio_seconds"])
+    return {
+        "played": _speech_stats["played"],
+        "streamed": _speech_stats["streamed"],
+        "median_first_audio": statistics.median(seconds) if seconds else 0.0,
+        "p90_first_audio": statistics.quantiles(seconds, n=10)[-1] if len(seconds) > 1 else sum(seconds),
+        "last_first_audio": seconds[-1] if seconds else 0.0,
+    }
+
+
+def speak_streaming(request: SpeechRequest, output: AudioOutput, stop_event=None, use_cache: bool = True,
+                    wait: bool = True) -> bool:
+    """
+    Play a request through output while Edge TTS is still synthesizing it.
+
+    The complete phrase is stored in the TTS cache afterwards (unless
+    playback was cut off), so the next time it is a plain cache hit.
+
+    With wait=False this returns once the phrase is fully queued on
+    output, which may still be playing it.
+
+    Returns:
+        False if nothing was played: streaming is unavailable (no ffmpeg)
+        or the stream could not be decoded, so the caller should fall back
+        to synthesize_audio()
+    """
+    started = time.perf_counter()
+    first_audio = []
+
+    def on_audio(pcm):
+        if not first_audio:
+            first_audio.append(time.perf_counter() - started)
+        output.play(pcm)
+
+    try:
+        pcm = stream_speech(request, on_audio, stop_event, output.sample_rate)
+    except FileNotFoundError:
+        return False
+    if pcm is None and not first_audio and not (stop_event is not None and stop_event.is_set()):
+        return False
+    cache = get_tts_cache() if use_cache else None
+    if pcm is not None and cache is not None:
+        _tts_cache_stats["misses"] += 1
+        _tts_cache_stats["miss_seconds"].append(first_audio[0])
+        cache.put(request.key, wav_bytes(pcm, output.sample_rate), ".wav")
+    if wait:
+        output.wait(stop_event)
+    return True
+
+
+_voice_lock = threading.RLock()
+
+
+def one_voice(function):
+    """Serialize everything that plays speech, so two threads never talk over each other."""
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        with _voice_lock:
+            return function(*args, **kwargs)
+    return wrapper
+
+
+@one_voice
+def speak(text: str, style: str = "default", output_file: str = None, play: bool = True, natural: bool = True,
+          stop_event=None, rate: str = None, pitch: str = None, use_cache: bool = True):
+    """
+    Speak text with Evie's voice.
+
+    Phrases come from the TTS cache when they have been said before (no
+    network round trip). Otherwise, when PyAudio and ffmpeg are available,
+    Edge TTS's audio is played as it streams in (see stream_speech) and
+    cached once complete; failing that, the whole phrase is synthesized,
+    cached and then played with an external player.
+
+    Pass a threading.Event as `stop_event` to make playback cancellable
+    from another thread (barge-in); setting it before playback starts
+    skips playing altogether.
+
+    Blocks until the phrase has been spoken, after anything another thread
+    (e.g. the SpeechQueue) is saying; use say() to queue it instead.
+
+    Args:
+        rate, pitch: Override the style's rate/pitch (e.g. "+10%", "+2Hz")
+        use_cache: Use the TTS cache (False always synthesizes)
+    """
+    print(f"[Evie speaking...]")
+    started = time.monotonic()
+    request = speech_request(text, style, natural=natural, rate=rate, pitch=pitch)
+
+    if play and stop_event is not None and stop_event.is_set():
+        play = False
+
+    output = get_audio_output(PLAYBACK_RATE) if play and output_file is None else None
+    if output is not None:
+        output.begin()
+    entry = cached_audio(request) if use_cache and output_file is None else None
+    streamed = (entry is None and output is not None and STREAMING_TTS
+                and speak_streaming(request, output, stop_event, use_cache))
+
+    if not streamed:
+        if entry is None:
+            entry = synthesize_audio(request, save_mp3=output_file, use_cache=use_cache)
+        if output_file:
+            print(f"[OK] Saved to: {output_file}")
+        if play:
+            play_audio_data(*entry, stop_event)
+
+    if output is not None and output.first_heard is not None:
+        _speech_stats["played"] += 1
+        _speech_stats["streamed"] += bool(streamed)
+        _speech_stats["first_audio_seconds"].append(output.first_heard - started)
+
+    print("[OK] Done")
+
+
+ABBREVIATIONS = {"mr", "mrs", "ms", "dr", "prof", "st", "sr", "jr", "vs", "etc", "e.g", "i.e",
+                 "approx", "no", "fig", "inc", "ltd", "co"}
+_SENTENCE_END = re.compile(r"[.!?\u2026]+[\"'\u201d\u2019)\]]*\s+")
+_CLAUSE_END = re.compile(r"(?<=[,;:\u2013\u2014])\s+")
+
+
+def split_sentences(text: str, min_chars: int = SENTENCE_MIN_CHARS, max_chars: int = SENTENCE_MAX_CHARS):
+    """
+    Split a passage into units to synthesize one at a time.
+
+    Breaks after sentence-ending punctuation (but not after abbreviations
+    such as "Dr." or "e.g."), splits sentences longer than max_chars at
+    clause punctuation (then at spaces), and joins units shorter than
+    min_chars onto the next so short interjections keep their intonation.
+
+    Returns:
+        List of non-empty strings that join back into the passage
+    """
+    sentences = []
+    start = 0
+    for match in _SENTENCE_END.finditer(text):
+        sentence = text[start:match.end()].strip()
+        last_word = sentence.split()[-1]
+        if last_word.endswith(".") and last_word.rstrip(".").lower() in ABBREVIATIONS:
+            continue
+        sentences.append(sentence)
+        start = match.end()
+    sentences.append(text[start:].strip())
+
+    units = []
+    for sentence in filter(None, sentences):
+        pieces = _CLAUSE_END.split(sentence) if len(sentence) > max_chars else [sentence]
+        current = ""
+        for piece in pieces:
+            words = piece.split(" ") if len(piece) > max_chars else [piece]
+            for word in words:
+                if current and len(current) + 1 + len(word) > max_chars:
+                    units.append(current)
+                    current = word
+                else:
+                    current = f"{current} {word}" if current else word
+        units.append(current)
+
+    merged = []
+    for unit in units:
+        if merged and len(merged[-1]) < min_chars:
+            merged[-1] = f"{merged[-1]} {unit}"
+        else:
+            merged.append(unit)
+    if len(merged) > 1 and len(merged[-1]) < min_chars:
+        merged[-2:] = [f"{merged[-2]} {merged[-1]}"]
+    return merged
+
+
+_pipeline_stats = {"passages": 0, "units": 0, "stalls": 0,
+                   "synth_seconds": deque(maxlen=1000), "stall_seconds": deque(maxlen=1000)}
+
+
+def get_pipeline_stats():
+    """
+    Sentence pipeline (speak_sentences) counters for this process.
+
+    Returns:
+        dict with passages and units spoken, stalls (units that started
+        more than 20 ms late because synthesis had not kept up), the
+        longest stall and the median seconds to synthesize a unit
+    """
+    synth = _pipeline_stats["synth_seconds"]
+    return {
+        "passages": _pipeline_stats["passages"],
+        "units": _pipeline_stats["units"],
+        "stalls": _pipeline_stats["stalls"],
+        "max_stall_seconds": max(_pipeline_stats["stall_seconds"], default=0.0),
+        "median_synth_seconds": statistics.median(synth) if synth else 0.0,
+    }
+
+
+def _timed_speech_audio(request, use_cache):
+    started = time.perf_counter()
+    entry = get_speech_audio(request, use_cache)
+    return entry, time.perf_counter() - started
+
+
+@one_voice
+def speak_sentences(text: str, style: str = "default", natural: bool = True, stop_event=None,
+                    rate: str = None, pitch: str = None, use_cache: bool = True,
+                    look_ahead: int = SPEECH_LOOK_AHEAD, max_workers: int = TTS_CONCURRENCY):
+    """
+    Speak a long passage sentence by sentence, synthesizing ahead of playback.
+
+    The passage is split with split_sentences(). The first unit is
+    streamed as in speak(), while the next `look_ahead` units are
+    synthesized concurrently (at most `max_workers` Edge TTS requests at
+    a time, each through the TTS cache). Each unit's audio is queued on
+    the AudioOutput right behind the previous one, so there is no gap
+    between sentences as long as synthesis keeps ahead. Every unit uses
+    the same voice, rate and pitch, and only the first may get a filler.
+
+    Without in-process playback, units play one after another with the
+    external player while later ones are still synthesized in the
+    background.
 
-    if should_cleanup:
-        Path(out_path).unlink(missing_ok=True)
+    Args:
+        stop_event: Optional threading.Event; cuts playback off and
+                    abandons units not yet synthesized
+        look_ahead: Units synthesized beyond the one playing
+        max_workers: Concurrent Edge TTS requests
+        (other arguments as for speak())
 
+    Returns:
+        One dict per unit spoken: text, synth_seconds (request to playable
+        audio), stall_seconds (silence before the unit caused by waiting
+        for it) and audio_seconds (0 when an external player was used)
+    """
+    print(f"[Evie speaking...]")
+    started = time.monotonic()
+    units = split_sentences(text)
+    requests = [speech_request(unit, style, natural=natural, rate=rate, pitch=pitch,
+                               add_filler=None if i == 0 else False) for i, unit in enumerate(units)]
+    output = get_audio_output(PLAYBACK_RATE)
+    if output is not None:
+        output.begin()
+
+    def stopped():
+        return stop_event is not None and stop_event.is_set()
+
+    pool = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="evie-tts")
+    futures = {}
+    starts = []     # output.queued where each unit begins
+    timings = []
+    streamed = False
+    try:
+        for i, request in enumerate(requests):
+            # Keep synthesis within look_ahead units of what is being heard
+            while i and output is not None and output.played < starts[-1] and not stopped():
+                time.sleep(0.01)
+            if stopped():
+                break
+            for j in range(i + 1, min(i + 1 + look_ahead, len(requests))):
+                if j not in futures:
+                    futures[j] = pool.submit(_timed_speech_audio, requests[j], use_cache)
+
+            if i == 0 and output is not None and STREAMING_TTS and (not use_cache or cached_audio(request) is None):
+                # Stream the first unit so the passage starts right away
+                before = output.queued
+                unit_started = time.perf_counter()
+                streamed = speak_streaming(request, output, stop_event, use_cache, wait=False)
+                if streamed:
+                    starts.append(before)
+                    timings.append({"text": request.text, "synth_seconds": time.perf_counter() - unit_started,
+                                    "stall_seconds": 0.0, "audio_seconds": (output.queued - before) / output.sample_rate})
+                    continue
+            if i not in futures:
+                futures[i] = pool.submit(_timed_speech_audio, request, use_cache)
+
+            waited = time.perf_counter()
+            while not futures[i].done() and not stopped():
+                time.sleep(0.005)
+            if stopped():
+                break
+            (data, suffix), synth_seconds = futures[i].result()
+            if output is not None and suffix == ".wav":
+                pcm, _ = read_wav_pcm(io.BytesIO(data))
+                dry = i and output.played >= output.queued and output.idle_since is not None
+                stall = max(0.0, time.monotonic() - output.idle_since) if dry else 0.0
+                starts.append(output.queued)
+                output.play(pcm)
+                audio_seconds = len(pcm) / output.sample_rate
+            else:
+                # External player: the unit plays to the end before the next one
+                stall = time.perf_counter() - waited if i else 0.0
+                if output is not None:
+                    output.wait(stop_event)
+                play_audio_data(data, suffix, stop_event)
+                starts.append(output.queued if output is not None else 0)
+                audio_seconds = 0.0
+            timings.append({"text": request.text, "synth_seconds": synth_seconds,
+                            "stall_seconds": stall, "audio_seconds": audio_seconds})
+        if output is not None:
+            output.wait(stop_event)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    if timings:
+        _pipeline_stats["passages"] += 1
+        _pipeline_stats["units"] += len(timings)
+        for timing in timings:
+            _pipeline_stats["synth_seconds"].append(timing["synth_seconds"])
+            _pipeline_stats["stall_seconds"].append(timing["stall_seconds"])
+            _pipeline_stats["stalls"] += timing["stall_seconds"] > 0.02
+    if output is not None and output.first_heard is not None:
+        _speech_stats["played"] += 1
+        _speech_stats["streamed"] += streamed
+        _speech_stats["first_audio_seconds"].append(output.first_heard - started)
     print("[OK] Done")
+    return timings
+
+
+class QueuedSpeech:
+    """One utterance waiting in (or being spoken by) a SpeechQueue."""
+
+    def __init__(self, text, style, priority, deadline, coalesce, sentences, speak_args):
+        self.text = text
+        self.style = style
+        self.priority = priority
+        self.deadline = deadline        # time.monotonic() after which it is too stale to start
+        self.coalesce = coalesce
+        self.sentences = sentences
+        self.speak_args = speak_args
+        self.queued_at = time.monotonic()
+        self.stop_event = threading.Event()
+        self.future = Future()
+
+
+class SpeechQueue:
+    """
+    Non-blocking, prioritized speech: say() returns at once with a Future.
+
+    One worker thread speaks queued utterances one at a time, highest
+    priority first and in order within a priority. A PRIORITY_HIGH
+    utterance preempts a lower one that is playing: playback stops within
+    one chunk (the stop_event used for barge-in) and the interrupted
+    utterance is dropped. Utterances still waiting after their
+    max_age are dropped unspoken, and a new utterance with the same
+    coalesce key replaces one that is still waiting (e.g. successive
+    "still working on it" acknowledgements).
+
+    Each Future resolves True once its utterance has been spoken, False if
+    it was dropped, replaced or preempted, or with the exception speaking
+    raised. Callers that need speech finished call .result(), or await
+    asyncio.wrap_future(future) from async code.
+
+    Usage:
+        queue = get_speech_queue()
+        ack = queue.say("Let me think about that.", priority=PRIORITY_LOW, max_age=2.0, coalesce="ack")
+        answer = do_work()              # while the acknowledgement plays
+        ack.result()
+        queue.say(answer, sentences=True).result()
+    """
+
+    def __init__(self):
+        self._waiting = []
+        self._current = None
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="evie-speech-queue", daemon=True)
+        self._thread.start()
+
+    def say(self, text: str, style: str = "default", priority: int = None, max_age: float = None,
+            coalesce=None, sentences: bool = False, **speak_args) -> Future:
+        """
+        Queue an utterance and return immediately.
+
+        Args:
+            text: What to say
+            style: VOICE_CONFIG style
+            priority: PRIORITY_LOW/NORMAL/HIGH (default: by style, see STYLE_PRIORITY)
+            max_age: Seconds it may wait before it is too stale to say (None: no limit)
+            coalesce: Key; replaces a waiting utterance with the same key
+            sentences: Speak it with speak_sentences() (long passages)
+            **speak_args: Passed to speak()/speak_sentences() (natural, rate, pitch, use_cache)
+
+        Returns:
+            concurrent.futures.Future (see the class docstring)
+        """
+        if priority is None:
+            priority = STYLE_PRIORITY.get(style, PRIORITY_NORMAL)
+        deadline = time.monotonic() + max_age if max_age is not None else None
+        item = QueuedSpeech(text, style, priority, deadline, coalesce, sentences, speak_args)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Speech queue is shut down")
+            if coalesce is not None:
+                for old in [old for old in self._waiting if old.coalesce == coalesce]:
+                    self._waiting.remove(old)
+                    self._resolve(old, False, "coalesced")
+            self._waiting.append(item)
+            if self._current is not None and priority >= PRIORITY_HIGH and priority > self._current.priority:
+                self._current.stop_event.set()
+                _speech_queue_stats["preempted"] += 1
+            self._condition.notify_all()
+        return item.future
+
+    def clear(self, stop_current: bool = True):
+        """Drop everything waiting (and stop what is playing)."""
+        with self._condition:
+            for item in self._waiting:
+                self._resolve(item, False, "dropped")
+            self._waiting.clear()
+            if stop_current and self._current is not None:
+                self._current.stop_event.set()
+
+    @property
+    def pending(self):
+        """Utterances waiting or being spoken."""
+        with self._condition:
+            return len(self._waiting) + (self._current is not None)
+
+    def wait_idle(self, timeout: float = None) -> bool:
+        """
+        Block until nothing is waiting or being spoken.
+
+        Returns:
+            False if the timeout expired first
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._waiting and self._current is None, timeout)
+
+    def shutdown(self, timeout: float = 2.0):
+        """Drop what is waiting, let the current utterance finish (up to timeout) and stop the worker."""
+        with self._condition:
+            self._closed = True
+        self.clear(stop_current=False)
+        with self._condition:
+            self._condition.notify_all()
+        self._thread.join(timeout)
+        if self._thread.is_alive() and self._current is not None:
+            self._current.stop_event.set()
+            self._thread.join(1.0)
+
+    def _resolve(self, item, result, reason=None):
+        if reason is not None:
+            _speech_queue_stats[reason] += 1
+        if item.future.set_running_or_notify_cancel():
+            item.future.set_result(result)
+
+    def _next(self):
+        """Highest-priority utterance still worth saying, or None once shut down."""
+        with self._condition:
+            while True:
+                while not self._waiting and not self._closed:
+                    self._condition.wait()
+                if not self._waiting:
+                    return None
+                item = max(self._waiting, key=lambda item: (item.priority, -item.queued_at))
+                self._waiting.remove(item)
+                if item.deadline is not None and time.monotonic() > item.deadline:
+                    self._resolve(item, False, "dropped")
+                elif item.future.set_running_or_notify_cancel():
+                    self._current = item
+                    return item
+
+    def _run(self):
+        while True:
+            item = self._next()
+            if item is None:
+                return
+            _speech_queue_stats["queue_seconds"].append(time.monotonic() - item.queued_at)
+            try:
+                if item.sentences:
+                    speak_sentences(item.text, item.style, stop_event=item.stop_event, **item.speak_args)
+                else:
+                    speak(item.text, item.style, stop_event=item.stop_event, **item.speak_args)
+            except Exception as e:
+                item.future.set_exception(e)
+            else:
+                spoken = not item.stop_event.is_set()
+                _speech_queue_stats["spoken" if spoken else "interrupted"] += 1
+                item.future.set_result(spoken)
+            with self._condition:
+                self._current = None
+                self._condition.notify_all()
+
+
+_speech_queue = None
+_speech_queue_lock = threading.Lock()
+_speech_queue_stats = {"spoken": 0, "interrupted": 0, "preempted": 0, "dropped": 0, "coalesced": 0,
+                       "queue_seconds": deque(maxlen=1000)}
+
+
+def get_speech_queue():
+    """The process-wide SpeechQueue, started on first use."""
+    global _speech_queue
+    with _speech_queue_lock:
+        if _speech_queue is None:
+            _speech_queue = SpeechQueue()
+            atexit.register(_speech_queue.shutdown)
+    return _speech_queue
+
+
+def say(text: str, style: str = "default", **kwargs) -> Future:
+    """Queue speech on the process-wide SpeechQueue without waiting (see SpeechQueue.say)."""
+    return get_speech_queue().say(text, style, **kwargs)
+
+
+def get_speech_queue_stats():
+    """
+    Speech queue counters for this process.
+
+    Returns:
+        dict with utterances spoken, interrupted (preempted or stopped),
+        preemptions, dropped as stale, replaced by a newer one with the
+        same coalesce key, and the median seconds they waited to start
+    """
+    waits = _speech_queue_stats["queue_seconds"]
+    stats = {key: value for key, value in _speech_queue_stats.items() if key != "queue_seconds"}
+    stats["median_queue_seconds"] = statistics.median(waits) if waits else 0.0
+    return stats
+
+
+def format_session_stats(barge_in=None):
+    """
+    End-of-session speech report shared by the Evie frontends.
+
+    Args:
+        barge_in: Optional evie-listen.py get_barge_in_stats() result to include
+
+    Returns:
+        List of report lines (empty if nothing was spoken)
+    """
+    lines = []
+    if barge_in and barge_in["interrupted"]:
+        lines.append(f"[Barge-in] {barge_in['interrupted']} of {barge_in['played']} answers interrupted; "
+                     f"playback stopped {barge_in['median_onset_to_stop'] * 1000:.0f} ms (median) after you spoke.")
+    stats = get_tts_cache_stats()
+    if stats["hits"] + stats["misses"]:
+        lines.append(f"[TTS cache] {stats['hits']} of {stats['hits'] + stats['misses']} phrases replayed from cache "
+                     f"({stats['median_hit_seconds'] * 1000:.0f} ms vs "
+                     f"{stats['median_miss_seconds'] * 1000:.0f} ms from Edge TTS).")
+    stats = get_speech_stats()
+    if stats["played"]:
+        lines.append(f"[TTS] First audio after {stats['median_first_audio'] * 1000:.0f} ms (median, "
+                     f"p90 {stats['p90_first_audio'] * 1000:.0f} ms) over {stats['played']} phrases, "
+                     f"{stats['streamed']} streamed from Edge TTS.")
+    stats = get_pipeline_stats()
+    if stats["passages"]:
+        lines.append(f"[TTS] {stats['units']} sentences in {stats['passages']} answers, {stats['stalls']} "
+                     f"started late (longest wait {stats['max_stall_seconds'] * 1000:.0f} ms, median synthesis "
+                     f"{stats['median_synth_seconds'] * 1000:.0f} ms).")
+    return lines
 
 
 def main():
@@ -374,9 +1714,25 @@ def main():
                        help="Disable natural speech processing")
     parser.add_argument("--list-voices", action="store_true", help="List available British voices")
     parser.add_argument("--list-styles", action="store_true", help="List available speaking styles")
+    parser.add_argument("--no-cache", action="store_true", help="Always synthesize, bypassing the phrase cache")
+    parser.add_argument("--cache-stats", action="store_true", help="Show the phrase cache's size")
+    parser.add_argument("--clear-cache", action="store_true", help="Delete every cached phrase")
 
     args = parser.parse_args()
 
+    if args.cache_stats or args.clear_cache:
+        cache = get_tts_cache()
+        if cache is None:
+            print("Phrase cache is disabled (EVIE_TTS_CACHE_MB=0)")
+            return
+        if args.clear_cache:
+            cache.evict(max_bytes=0)
+        entries = cache.entries()
+        size = sum(size for _, size, _ in entries)
+        print(f"Phrase cache: {len(entries)} phrase(s), {size / 2 ** 20:.1f} of "
+              f"{cache.max_bytes / 2 ** 20:.0f} MB in {cache.directory}")
+        return
+
     if args.list_voices:
         print("\nAvailable British Female Voices:")
         print("-" * 40)
@@ -414,7 +1770,7 @@ def main():
 
     play = not args.no_play
     natural = not args.no_natural
-    speak(text, args.style, args.save, play, natural)
+    speak(text, args.style, args.save, play, natural, use_cache=not args.no_cache)
 
 
 if __name__ == "__main__":
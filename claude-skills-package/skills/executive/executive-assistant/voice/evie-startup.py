@@ -18,6 +18,7 @@ import json
 import datetime
 import signal
 import atexit
+import time
 from pathlib import Path
 
 # Paths
@@ -40,6 +41,9 @@ WAKE_WORDS = [
     "hello evie",
 ]
 
+# Phrases that shut the listener down
+EXIT_PHRASES = ["goodbye evie", "stop listening"]
+
 # Microphone settings
 # Index 18 = Logitech C525 HD WebCam (correct endpoint with actual speech, not noise)
 # Note: Index 8 captures high levels but it's noise/interference, not speech
@@ -51,6 +55,12 @@ DEFAULT_MIC_INDEX = 18
 WAKE_WORD_MODEL = "tiny"
 COMMAND_MODEL = "base"
 
+# Wake scanning looks at the last WAKE_WORD_WINDOW seconds every WAKE_WORD_HOP seconds
+WAKE_WORD_WINDOW = 2.5
+WAKE_WORD_HOP = 0.75
+COMMAND_DURATION = 8     # Seconds to record (or wait for speech, with --vad) for a command
+COMMAND_GRACE = 1.5      # Seconds after a wake phrase for a same-breath command to start
+
 # Greeting response when activated
 def get_greeting():
     return "Yes dear, I am here to serve."
@@ -84,34 +94,125 @@ def save_command(text, wake_word_used):
         json.dump(command_data, f, indent=2)
     log(f"Command saved: {text}")
 
-def is_wake_word(text):
-    """Check if text contains a wake word."""
-    text_lower = text.lower().strip()
-    for wake in WAKE_WORDS:
-        if wake in text_lower:
-            return wake
-    return None
-
-def run_listener():
-    """Run the continuous listener with wake word detection."""
+def run_listener(vad=False, use_kws=True, model_budget=None, stt_backend=None, cascade=False,
+                 denoise=False, bus=None, source=None):
+    """
+    Run the continuous listener with wake word detection.
+
+    Args:
+        vad: Capture each utterance with voice activity detection instead of
+             fixed-duration windows (recording stops when the speaker goes quiet)
+        use_kws: Screen wake windows with the keyword spotter when phrases are enrolled
+        model_budget: Memory cap in MB for loaded speech models (None = no cap)
+        stt_backend: Speech-to-text engine from evie-stt.py (None = EVIE_STT_BACKEND or "whisper")
+        cascade: Transcribe commands with the wake-word model first and re-decode
+                 with COMMAND_MODEL only when Whisper's confidence is low
+        denoise: Suppress steady fan/HVAC noise before transcription, which lets
+                 the small model handle more commands on its own (pairs well with cascade)
+        bus: Read the microphone from this evie-bus.py audio bus (owned by an
+             `evie-bus.py capture` process) instead of opening it here
+        source: Listen to recordings or test signals instead of the mic
+                (an evie-listen.py AUDIO_SOURCE spec, e.g. "clips/,gap=1")
+    """
     # Import the listener module
     sys.path.insert(0, str(EVIE_DIR))
 
     try:
-        from evie_listen import listen_fixed, get_whisper_model
+        import evie_listen
     except ImportError:
         # Try alternate import
         import importlib.util
         spec = importlib.util.spec_from_file_location("evie_listen", EVIE_DIR / "evie-listen.py")
         evie_listen = importlib.util.module_from_spec(spec)
+        sys.modules["evie_listen"] = evie_listen
         spec.loader.exec_module(evie_listen)
-        listen_fixed = evie_listen.listen_fixed
-        get_whisper_model = evie_listen.get_whisper_model
 
-    # Preload both models for instant switching
+    if stt_backend is not None:
+        evie_listen.set_stt_backend(stt_backend)
+    if denoise:
+        evie_listen.NOISE_SUPPRESSION = True
+    if source:
+        evie_listen.AUDIO_SOURCE = source
+
+    # Load both models in parallel in the background; until the command
+    # model is ready, commands are transcribed with the wake-word model
     log("Loading speech models...")
-    get_whisper_model(WAKE_WORD_MODEL)  # Fast model for wake words
-    get_whisper_model(COMMAND_MODEL)    # Accurate model for commands
+    models = evie_listen.get_model_manager()
+    if model_budget is not None:
+        models.budget_mb = model_budget
+    models.preload([WAKE_WORD_MODEL, COMMAND_MODEL])
+
+    # Keep the microphone open for the whole session: wake scanning and
+    # command capture read the same continuous stream, so nothing said
+    # between windows (or while Whisper is busy) is lost and there is no
+    # reopen cost
+    if bus:
+        evie_bus = evie_listen.load_module(EVIE_DIR / "evie-bus.py")
+        log(f"Waiting for audio bus '{bus}'...")
+        stream = evie_bus.AudioBus.attach(bus)
+    else:
+        stream = evie_listen.get_microphone_stream(DEFAULT_MIC_INDEX)
+
+    # Commands are captured and transcribed concurrently: with --vad the
+    # pipeline cuts utterances and waits up to COMMAND_DURATION for speech,
+    # otherwise it records COMMAND_DURATION windows
+    command_model = COMMAND_MODEL
+    if cascade:
+        evie_listen.CASCADE_MODELS = [WAKE_WORD_MODEL, COMMAND_MODEL]
+        command_model = evie_listen.CASCADE
+    commands = evie_listen.TranscriptionPipeline(
+        stream,
+        model_size=command_model,
+        vad=vad,
+        duration=COMMAND_DURATION,
+        speech_timeout=COMMAND_DURATION,
+    )
+
+    # With enrolled templates, a keyword spotter screens windows so Whisper
+    # only runs when a wake phrase was probably said
+    spotter = None
+    if use_kws:
+        evie_kws = evie_listen.load_module(EVIE_DIR / "evie-kws.py")
+        spotter = evie_kws.KeywordSpotter.load()
+        if spotter.phrases:
+            log(f"Keyword spotter enrolled for: {', '.join(spotter.phrases)}")
+        else:
+            log("No wake phrases enrolled (python evie-kws.py enroll); using Whisper for every speech window.")
+            spotter = None
+
+    # Overlapping windows, so a wake phrase split across a boundary is still heard
+    wake_detector = evie_listen.SlidingWakeDetector(
+        stream,
+        WAKE_WORDS + EXIT_PHRASES,
+        model_size=WAKE_WORD_MODEL,
+        window=WAKE_WORD_WINDOW,
+        hop=WAKE_WORD_HOP,
+        spotter=spotter,
+    )
+    if wake_detector.unenrolled:
+        log(f"Keyword spotter has no templates for: {', '.join(wake_detector.unenrolled)}; "
+            f"Whisper checks every speech window until they are enrolled (python evie-kws.py enroll).")
+
+    # Speak in this process: playback then feeds the microphone stream's
+    # echo canceller, so Evie's voice is removed from what the wake detector hears
+    speak_module = evie_listen.load_module(EVIE_DIR / "evie-speak-edge.py")
+
+    def speak(text, style):
+        """
+        Speak via evie-speak-edge.py.
+
+        With echo cancellation the wake detector then scans what was said
+        during playback like any other audio; otherwise it skips past
+        Evie's own voice in the stream.
+        """
+        commands.stop()
+        started = time.monotonic()
+        try:
+            speak_module.speak(text, style=style, play=True)
+        except Exception as e:
+            log(f"Speak error: {e}")
+        if not stream.echo_cancelled_since(started):
+            wake_detector.reset(stream.position)
 
     log("Evie is now listening for wake words...")
     log(f"Say any of: {', '.join(WAKE_WORDS)}")
@@ -119,35 +220,23 @@ def run_listener():
     waiting_for_command = False
     active_wake_word = None
 
-    # Recording durations
-    WAKE_WORD_DURATION = 3   # Short recordings for wake word detection
-    COMMAND_DURATION = 8     # Longer recordings for commands
-
     while True:
         try:
-            # Choose model and duration based on state
             if waiting_for_command:
-                current_model = COMMAND_MODEL
-                duration = COMMAND_DURATION
+                # Capture starts right after the greeting finished playing
+                transcript = commands.next_result()
+                text = transcript.text if transcript else ""
             else:
-                current_model = WAKE_WORD_MODEL
-                duration = WAKE_WORD_DURATION
-
-            # Record fixed-duration audio (reliable method)
-            text = listen_fixed(
-                duration=duration,
-                mic_index=DEFAULT_MIC_INDEX,
-                model_size=current_model,
-                verbose=False
-            )
+                detection = wake_detector.next_detection()
+                text = detection.text
 
             if not text:
                 continue
 
-            text_lower = text.lower().strip()
+            text_lower = evie_listen.normalize_phrase_text(text)
 
             # Check for exit commands
-            if "goodbye evie" in text_lower or "stop listening" in text_lower:
+            if any(phrase in text_lower for phrase in EXIT_PHRASES):
                 log("Exit command received.")
                 break
 
@@ -156,60 +245,39 @@ def run_listener():
                 save_command(text, active_wake_word)
 
                 # Speak acknowledgment
-                try:
-                    speak_script = EVIE_DIR / "evie-speak-edge.py"
-                    subprocess.run([
-                        sys.executable, str(speak_script),
-                        "Got it, love. Let me work on that.",
-                        "--style", "casual",
-                        "--play"
-                    ], check=False)
-                except Exception as e:
-                    log(f"Speak error: {e}")
+                speak("Got it, love. Let me work on that.", "casual")
 
                 waiting_for_command = False
                 active_wake_word = None
+                wake_detector.reset(stream.position)
                 continue
 
-            # Check for wake word
-            wake = is_wake_word(text)
+            # The detector only returns windows that contain a wake phrase
+            wake = detection.wake_word
             if wake:
                 log(f"Wake word detected: {wake}")
                 active_wake_word = wake
 
-                # Extract command if it came with the wake word
-                command_text = text_lower.replace(wake, "").strip()
+                # A command said in the same breath is read from the stream
+                # right after the wake phrase, without a greeting in between
+                command_text = evie_listen.listen_after_wake(
+                    stream, detection,
+                    model_size=command_model,
+                    timeout=COMMAND_GRACE,
+                    vad=wake_detector.vad,
+                )
 
                 if command_text and len(command_text) > 3:
                     # Command included with wake word
                     save_command(command_text, wake)
-
-                    try:
-                        speak_script = EVIE_DIR / "evie-speak-edge.py"
-                        subprocess.run([
-                            sys.executable, str(speak_script),
-                            "On it, love.",
-                            "--style", "casual",
-                            "--play"
-                        ], check=False)
-                    except Exception:
-                        pass
+                    speak("On it, love.", "casual")
                 else:
                     # Just wake word, wait for command
                     waiting_for_command = True
 
                     # Respond to greeting
-                    try:
-                        speak_script = EVIE_DIR / "evie-speak-edge.py"
-                        greeting = get_greeting()
-                        subprocess.run([
-                            sys.executable, str(speak_script),
-                            greeting,
-                            "--style", "greeting",
-                            "--play"
-                        ], check=False)
-                    except Exception as e:
-                        log(f"Speak error: {e}")
+                    speak(get_greeting(), "greeting")
+                    commands.start(stream.position)
 
         except KeyboardInterrupt:
             log("Interrupted by user.")
@@ -218,6 +286,30 @@ def run_listener():
             log(f"Error: {e}")
             continue
 
+    commands.close()
+
+    if stream.noise_floor_db is not None:
+        log(f"Background noise floor: {stream.noise_floor_db:.1f} dB "
+            f"(speech threshold {wake_detector.vad.threshold_db():.1f} dB).")
+    stats = evie_listen.get_gate_stats()
+    if stats["checked"]:
+        log(f"Silence gate skipped Whisper on {stats['gated']} of {stats['checked']} "
+            f"windows ({stats['gated_fraction']:.0%}).")
+    stats = wake_detector.stats
+    log(f"Wake scan: {stats['hops']} hops, {stats['decoded']} decoded, "
+        f"{stats['skipped_silent']} silent, {stats['skipped_covered']} already covered, "
+        f"{stats['skipped_kws']} rejected by keyword spotter.")
+    if cascade:
+        stats = evie_listen.get_cascade_stats()
+        log(f"Cascade: {stats['escalated']} of {stats['decodes']} commands re-decoded with "
+            f"{COMMAND_MODEL}, median {stats['median_seconds']:.2f}s per command.")
+    for size, entry in models.report().items():
+        if "load_seconds" in entry:
+            log(f"Model {size}: {entry['resident_mb']:.0f} MB resident, {entry['load_seconds']:.1f}s load, "
+                f"{entry['warmup_seconds']:.1f}s warm-up, {entry['evictions']} eviction(s).")
+    for line in speak_module.format_session_stats():
+        log(line)
+
 def main():
     """Main entry point."""
     import argparse
@@ -229,7 +321,26 @@ def main():
                        help="Stop running daemon")
     parser.add_argument("--status", action="store_true",
                        help="Check if Evie is running")
+    parser.add_argument("--vad", action="store_true",
+                       help="Stop recording when you stop talking instead of fixed-length windows")
+    parser.add_argument("--no-kws", action="store_true",
+                       help="Don't use the keyword spotter; run Whisper on every speech window")
+    parser.add_argument("--stt-backend", default=None, choices=["whisper", "faster-whisper"],
+                       help="Speech-to-text engine (faster-whisper = int8 CTranslate2)")
+    parser.add_argument("--cascade", action="store_true",
+                       help="Transcribe commands with the fast model first, re-check with base only when unsure")
+    parser.add_argument("--denoise", action="store_true",
+                       help="Suppress steady background noise (fans, HVAC) before transcribing")
+    parser.add_argument("--model-budget", type=float, default=None, metavar="MB",
+                       help="Memory cap for loaded speech models; least recently used are unloaded")
+    parser.add_argument("--bus", nargs="?", const="evie-mic", default=None, metavar="NAME",
+                       help="Read the mic from a shared audio bus (python evie-bus.py capture) instead of opening it")
+    parser.add_argument("--source", default=None, metavar="SPEC",
+                       help="Listen to recordings or test signals instead of the mic, e.g. 'clips/,gap=1' "
+                            "(see evie-listen.py open_audio_source)")
     args = parser.parse_args()
+    if args.bus and args.source:
+        parser.error("--bus and --source are alternative audio inputs; give one")
 
     if args.status:
         if PID_FILE.exists():
@@ -290,7 +401,9 @@ def main():
         # Run in background (on Windows, use pythonw)
         log("Running in daemon mode...")
 
-    run_listener()
+    run_listener(vad=args.vad, use_kws=not args.no_kws, model_budget=args.model_budget,
+                 stt_backend=args.stt_backend, cascade=args.cascade, denoise=args.denoise, bus=args.bus,
+                 source=args.source)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Evie STT Backends - Interchangeable speech-to-text engines
+
+evie-listen.py loads and runs models only through a backend, so the
+engine is a configuration choice:
+
+    whisper          openai-whisper, float32 PyTorch on CPU (the original engine)
+    faster-whisper   CTranslate2 with int8 weights on CPU; short clips are not
+                     padded to Whisper's 30-second window
+
+Select one with the EVIE_STT_BACKEND environment variable or the
+--stt-backend flag of evie-listen.py / evie-startup.py. Both return
+openai-whisper style result dicts (text, segments with timings and
+decoding statistics), so callers do not care which one ran.
+
+Usage:
+    stt = load_module(SCRIPT_DIR / "evie-stt.py")
+    backend = stt.get_backend("faster-whisper")
+    model = backend.load("base")
+    result = backend.transcribe(model, samples)   # float32 16 kHz
+"""
+
+import math
+import subprocess
+import sys
+
+# Parameter counts of the Whisper sizes, for backends whose models do not
+# expose their tensors (used to estimate resident memory)
+WHISPER_PARAMETERS = {
+    "tiny": 39e6,
+    "base": 74e6,
+    "small": 244e6,
+    "medium": 769e6,
+    "large": 1550e6,
+}
+
+# Shortest window the int8 backend pads clips to, in seconds
+MIN_CHUNK_SECONDS = 5
+
+
+def _require(module, package):
+    """Import a module, installing its package first if needed."""
+    try:
+        return __import__(module)
+    except ImportError:
+        print(f"Installing {package}...")
+        subprocess.run([sys.executable, "-m", "pip", "install", package], check=True)
+        return __import__(module)
+
+
+class WhisperBackend:
+    """openai-whisper running float32 on the CPU."""
+
+    name = "whisper"
+
+    def __init__(self, cpu_threads=0):
+        """
+        Args:
+            cpu_threads: PyTorch intra-op threads for this process (0 = PyTorch default)
+        """
+        self.cpu_threads = cpu_threads
+
+    def load(self, model_size):
+        whisper = _require("whisper", "openai-whisper")
+        if self.cpu_threads:
+            import torch
+            torch.set_num_threads(self.cpu_threads)
+        return whisper.load_model(model_size)
+
+    def transcribe(self, model, samples, **options):
+        # Force English language to avoid DC offset causing wrong language detection
+        return model.transcribe(samples, fp16=False, language='en', **options)
+
+    def memory_mb(self, model, model_size):
+        """Exact size of the model's parameters and buffers."""
+        tensors = list(model.parameters()) + list(model.buffers())
+        return sum(t.numel() * t.element_size() for t in tensors) / (1024.0 * 1024.0)
+
+
+class FasterWhisperBackend:
+    """
+    CTranslate2 Whisper (faster-whisper) with int8 weights on the CPU.
+
+    Weights are quantized to int8 at load time, which roughly quarters
+    memory and speeds up the matrix products on CPUs with int8 dot-product
+    instructions. Clips are padded only up to the next whole second (at
+    least MIN_CHUNK_SECONDS) instead of Whisper's fixed 30-second window,
+    so a 3-second wake clip costs a 5-second encoder pass, not a 30-second
+    one.
+    """
+
+    name = "faster-whisper"
+
+    def __init__(self, compute_type="int8", cpu_threads=0, short_input=True):
+        """
+        Args:
+            compute_type: CTranslate2 weight type ("int8", "int8_float32", "float32")
+            cpu_threads: Threads per model (0 = CTranslate2 default)
+            short_input: Pad clips to their own length rather than 30 seconds
+        """
+        self.compute_type = compute_type
+        self.cpu_threads = cpu_threads
+        self.short_input = short_input
+
+    def load(self, model_size):
+        faster_whisper = _require("faster_whisper", "faster-whisper")
+        return faster_whisper.WhisperModel(
+            model_size,
+            device="cpu",
+            compute_type=self.compute_type,
+            cpu_threads=self.cpu_threads,
+        )
+
+    def transcribe(self, model, samples, **options):
+        word_timestamps = options.pop("word_timestamps", False)
+        if self.short_input:
+            seconds = len(samples) / 16000.0
+            options.setdefault("chunk_length", min(30, max(MIN_CHUNK_SECONDS, math.ceil(seconds))))
+        options.setdefault("beam_size", 5)
+        segments, info = model.transcribe(
+            samples,
+            language="en",
+            word_timestamps=word_timestamps,
+            **options
+        )
+
+        result_segments = []
+        for seg in segments:
+            entry = {
+                "id": seg.id,
+                "start": seg.start,
+                "end": seg.end,
+                "text": seg.text,
+                "temperature": seg.temperature,
+                "avg_logprob": seg.avg_logprob,
+                "compression_ratio": seg.compression_ratio,
+                "no_speech_prob": seg.no_speech_prob,
+            }
+            if word_timestamps and seg.words:
+                entry["words"] = [{"word": w.word, "start": w.start, "end": w.end,
+                                   "probability": w.probability} for w in seg.words]
+            result_segments.append(entry)
+
+        return {
+            "text": "".join(seg["text"] for seg in result_segments),
+            "segments": result_segments,
+            "language": info.language,
+        }
+
+    def memory_mb(self, model, model_size):
+        """Estimate from the parameter count (CTranslate2 does not expose its tensors)."""
+        base = model_size.split(".")[0].split("-")[0]
+        bytes_per_weight = 1 if self.compute_type.startswith("int8") else 4
+        return WHISPER_PARAMETERS.get(base, 0) * bytes_per_weight / (1024.0 * 1024.0)
+
+
+BACKENDS = {
+    WhisperBackend.name: WhisperBackend,
+    FasterWhisperBackend.name: FasterWhisperBackend,
+}
+
+
+def get_backend(name="whisper", **kwargs):
+    """
+    Create a backend by name.
+
+    Raises:
+        ValueError: for an unknown backend name
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown STT backend '{name}' (choose from: {', '.join(BACKENDS)})")
+    return BACKENDS[name](**kwargs)
@@ -0,0 +1,222 @@
+"""
+Behavior checks for SpeechQueue (evie-speak-edge.py).
+
+speak()/speak_sentences() are replaced by a FakeVoice that records what
+would have been said and "plays" each utterance until the test releases
+it or its stop_event is set, so ordering, preemption and dropping can be
+checked without audio or network.
+
+Run:
+    python -m pytest voice/tests -q
+"""
+
+import importlib.util
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("edge_tts")  # Imported (or pip-installed) by evie-speak-edge at load
+
+VOICE_DIR = Path(__file__).resolve().parent.parent
+TIMEOUT = 2.0
+
+
+def load_module(module_file):
+    """Load a Python module from a file with dashes in the name (shared via sys.modules)."""
+    module_name = module_file.stem.replace("-", "_")
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, module_file)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+evie_speak = load_module(VOICE_DIR / "evie-speak-edge.py")
+
+
+class FakeVoice:
+    """Records speak()/speak_sentences() calls; each one plays until released or stopped."""
+
+    def __init__(self):
+        self.calls = []         # (function name, text, style, speak_args)
+        self.stopped = []       # Texts whose stop_event cut them off
+        self.raises = {}        # text -> exception to raise instead of speaking
+        self.released = threading.Event()
+        self._condition = threading.Condition()
+
+    def speak(self, text, style="default", stop_event=None, **speak_args):
+        self._play("speak", text, style, stop_event, speak_args)
+
+    def speak_sentences(self, text, style="default", stop_event=None, **speak_args):
+        self._play("speak_sentences", text, style, stop_event, speak_args)
+
+    def _play(self, function, text, style, stop_event, speak_args):
+        with self._condition:
+            self.calls.append((function, text, style, speak_args))
+            self._condition.notify_all()
+        if text in self.raises:
+            raise self.raises[text]
+        while not self.released.is_set():
+            if stop_event.wait(0.005):
+                self.stopped.append(text)
+                return
+
+    @property
+    def texts(self):
+        return [text for _, text, _, _ in self.calls]
+
+    def wait_for_calls(self, count):
+        """Block until `count` utterances have started playing."""
+        with self._condition:
+            assert self._condition.wait_for(lambda: len(self.calls) >= count, TIMEOUT)
+
+
+@pytest.fixture
+def voice(monkeypatch):
+    fake = FakeVoice()
+    monkeypatch.setattr(evie_speak, "speak", fake.speak)
+    monkeypatch.setattr(evie_speak, "speak_sentences", fake.speak_sentences)
+    return fake
+
+
+@pytest.fixture
+def speech(voice):
+    queue = evie_speak.SpeechQueue()
+    yield queue
+    voice.released.set()
+    queue.shutdown()
+
+
+def hold(speech, voice, text="holding", priority=evie_speak.PRIORITY_NORMAL):
+    """Start an utterance that keeps playing until voice.released is set."""
+    started = len(voice.calls)
+    future = speech.say(text, priority=priority)
+    voice.wait_for_calls(started + 1)
+    return future
+
+
+def test_priority_order_then_fifo(speech, voice):
+    hold(speech, voice)
+    futures = [speech.say("low 1", priority=evie_speak.PRIORITY_LOW),
+               speech.say("normal 1"),
+               speech.say("low 2", priority=evie_speak.PRIORITY_LOW),
+               speech.say("normal 2")]
+    voice.released.set()
+
+    assert all(future.result(TIMEOUT) for future in futures)
+    assert voice.texts == ["holding", "normal 1", "normal 2", "low 1", "low 2"]
+
+
+def test_style_sets_default_priority(speech, voice):
+    hold(speech, voice, priority=evie_speak.PRIORITY_HIGH)
+    speech.say("normal")
+    speech.say("alert", style="alert")
+    voice.released.set()
+
+    assert speech.wait_idle(TIMEOUT)
+    assert voice.texts == ["holding", "alert", "normal"]
+
+
+def test_high_priority_preempts_lower(speech, voice):
+    current = hold(speech, voice)
+    urgent = speech.say("urgent", priority=evie_speak.PRIORITY_HIGH)
+
+    assert current.result(TIMEOUT) is False
+    voice.released.set()
+    assert urgent.result(TIMEOUT) is True
+    assert voice.stopped == ["holding"]
+    assert voice.texts == ["holding", "urgent"]
+
+
+def test_high_priority_does_not_preempt_high(speech, voice):
+    current = hold(speech, voice, priority=evie_speak.PRIORITY_HIGH)
+    second = speech.say("second", priority=evie_speak.PRIORITY_HIGH)
+    time.sleep(0.05)
+    assert not current.done()
+
+    voice.released.set()
+    assert current.result(TIMEOUT) is True
+    assert second.result(TIMEOUT) is True
+    assert voice.stopped == []
+
+
+def test_normal_priority_does_not_preempt_low(speech, voice):
+    current = hold(speech, voice, priority=evie_speak.PRIORITY_LOW)
+    speech.say("normal")
+    time.sleep(0.05)
+    assert not current.done()
+
+    voice.released.set()
+    assert current.result(TIMEOUT) is True
+    assert voice.stopped == []
+    assert voice.texts == ["holding", "normal"]
+
+
+def test_stale_utterances_are_dropped(speech, voice):
+    hold(speech, voice)
+    stale = speech.say("stale", max_age=0.01)
+    fresh = speech.say("fresh", max_age=60)
+    time.sleep(0.05)
+    voice.released.set()
+
+    assert stale.result(TIMEOUT) is False
+    assert fresh.result(TIMEOUT) is True
+    assert voice.texts == ["holding", "fresh"]
+
+
+def test_coalesce_replaces_waiting_utterance(speech, voice):
+    hold(speech, voice)
+    first = speech.say("still working", coalesce="ack")
+    other = speech.say("unrelated")
+    second = speech.say("nearly there", coalesce="ack")
+
+    # Replaced at once, not when the queue reaches it
+    assert first.result(TIMEOUT) is False
+    voice.released.set()
+    assert second.result(TIMEOUT) is True
+    assert other.result(TIMEOUT) is True
+    assert voice.texts == ["holding", "unrelated", "nearly there"]
+
+
+def test_future_carries_speaking_errors(speech, voice):
+    voice.raises["broken"] = RuntimeError("no audio device")
+    voice.released.set()
+    failed = speech.say("broken")
+    after = speech.say("after")
+
+    with pytest.raises(RuntimeError, match="no audio device"):
+        failed.result(TIMEOUT)
+    assert after.result(TIMEOUT) is True
+
+
+def test_clear_drops_waiting_and_stops_current(speech, voice):
+    current = hold(speech, voice)
+    waiting = speech.say("waiting")
+    speech.clear()
+
+    assert waiting.result(TIMEOUT) is False
+    assert current.result(TIMEOUT) is False
+    assert speech.wait_idle(TIMEOUT)
+    assert speech.pending == 0
+
+
+def test_sentences_and_speak_args_are_passed_through(speech, voice):
+    voice.released.set()
+    speech.say("A long answer. In two sentences.", style="warm", sentences=True, natural=False).result(TIMEOUT)
+    speech.say("Short.", rate="+5%").result(TIMEOUT)
+
+    assert voice.calls == [
+        ("speak_sentences", "A long answer. In two sentences.", "warm", {"natural": False}),
+        ("speak", "Short.", "default", {"rate": "+5%"}),
+    ]
+
+
+def test_say_after_shutdown_raises(speech):
+    speech.shutdown()
+    with pytest.raises(RuntimeError):
+        speech.say("too late")
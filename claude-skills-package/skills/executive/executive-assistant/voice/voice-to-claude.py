@@ -9,6 +9,10 @@ Usage:
     python voice-to-claude.py
     python voice-to-claude.py --model opus    # Use Claude Opus 4.6
     python voice-to-claude.py --stream        # Stream responses (faster)
+    python voice-to-claude.py --vad           # Stop recording when you stop talking
+    python voice-to-claude.py --cascade       # Fast model first, base only when unsure
+    python voice-to-claude.py --no-barge-in   # Don't stop answers when you talk over them
+    python voice-to-claude.py --source clips/ # Replay recordings instead of the mic (headless runs)
 
 Features:
 - Full conversational AI via Anthropic API
@@ -41,6 +45,15 @@ API_KEY = os.getenv("ANTHROPIC_API_KEY", "YOUR_API_KEY_HERE")
 DEFAULT_MODEL = "claude-sonnet-4-5-20250929"
 DEFAULT_MIC_INDEX = 18
 
+# Capture mode: False = fixed-duration recording, True = stop when the speaker goes quiet (VAD)
+USE_VAD = False
+
+# Speech model: "base", or "cascade" to decode with tiny and re-decode with base only when unsure
+STT_MODEL = "base"
+
+# Talking over a spoken answer stops it and becomes the next message
+BARGE_IN = True
+
 # Import Evie's voice modules
 sys.path.insert(0, str(SCRIPT_DIR))
 
@@ -57,21 +70,58 @@ def load_module(module_file):
 listen_module = load_module(SCRIPT_DIR / "evie-listen.py")
 speak_module = load_module(SCRIPT_DIR / "evie-speak-edge.py")
 
-def speak(text, style="default"):
-    """Have Evie speak text."""
+def speak(text, style="default", barge_in=False):
+    """
+    Have Evie speak text.
+
+    barge_in is for answers: they are spoken sentence by sentence, each
+    synthesized while the previous one plays (speak_sentences), and with
+    BARGE_IN on, talking over Evie stops her and what was said is
+    transcribed and returned, so it can be the next message.
+
+    Returns:
+        Text the user spoke over the playback, or None
+    """
     print(f"\n[Evie] {text}\n")
     try:
-        speak_module.speak(text, style=style, play=True)
+        if not barge_in:
+            speak_module.speak(text, style=style, play=True)
+            return None
+        if not BARGE_IN:
+            speak_module.speak_sentences(text, style=style)
+            return None
+        result = listen_module.speak_with_barge_in(
+            lambda stop: speak_module.speak_sentences(text, style=style, stop_event=stop),
+            mic_index=DEFAULT_MIC_INDEX,
+            verbose=False
+        )
+        if result.interrupted:
+            print(f"[Interrupted after {result.onset_to_stop * 1000:.0f} ms]")
+        if result.pcm is not None:
+            return listen_module.transcribe_pcm(result.pcm, result.sample_rate, STT_MODEL, gate=True)
     except Exception as e:
         print(f"[Voice Error] {e}")
+    return None
 
 def listen(duration=8):
-    """Listen for user speech."""
+    """
+    Listen for user speech.
+
+    With USE_VAD, `duration` is how long to wait for speech to start and
+    recording stops as soon as the speaker goes quiet.
+    """
     try:
+        if USE_VAD:
+            return listen_module.listen_vad(
+                timeout=duration,
+                mic_index=DEFAULT_MIC_INDEX,
+                model_size=STT_MODEL,
+                verbose=False
+            )
         return listen_module.listen_fixed(
             duration=duration,
             mic_index=DEFAULT_MIC_INDEX,
-            model_size="base",
+            model_size=STT_MODEL,
             verbose=False
         )
     except Exception as e:
@@ -178,16 +228,13 @@ Response guidelines:
         If response is very long, speak a summary and note that
         the full response is on screen.
         """
-        # Remove markdown code blocks for speech (but keep in printed version)
-        import re
-
         # Count words
         word_count = len(text.split())
 
         # If very long (>150 words), create a summary
         if word_count > 150:
-            # Take first 2-3 sentences as summary
-            sentences = re.split(r'(?<=[.!?])\s+', text)
+            # Take first 2-3 sentences as summary (split as the speech pipeline does)
+            sentences = speak_module.split_sentences(text, min_chars=0, max_chars=len(text))
             summary = ' '.join(sentences[:3])
 
             return summary + " ... I've put the full answer on your screen for reference."
@@ -204,12 +251,16 @@ Response guidelines:
         print("=" * 60)
 
         speak("Hello love, I'm Evie, powered by Claude. What can I help you with?", style="greeting")
+        interrupted_text = None  # What the user said over the last answer
 
         while self.running:
             try:
-                # Listen for user input
-                print("\n[Listening...]")
-                user_text = listen(duration=10)
+                # Listen for user input (unless they already spoke over the last answer)
+                if interrupted_text:
+                    user_text, interrupted_text = interrupted_text, None
+                else:
+                    print("\n[Listening...]")
+                    user_text = listen(duration=10)
 
                 if not user_text:
                     continue
@@ -240,8 +291,8 @@ Response guidelines:
                 # Process for speech (may summarize if long)
                 spoken_response = self.process_response_for_speech(response)
 
-                # Speak the response
-                speak(spoken_response, style="default")
+                # Speak the response; talking over it stops it
+                interrupted_text = speak(spoken_response, style="default", barge_in=True)
 
             except KeyboardInterrupt:
                 speak("Interrupted. Goodbye love.", style="default")
@@ -254,6 +305,9 @@ Response guidelines:
         self.save_history()
         print(f"\n[Conversation saved to {CONVERSATION_FILE}]")
 
+        for line in speak_module.format_session_stats(listen_module.get_barge_in_stats()):
+            print(line)
+
 
 def main():
     import argparse
@@ -270,9 +324,26 @@ def main():
                        help="Stream responses (experimental)")
     parser.add_argument("--clear-history", action="store_true",
                        help="Clear conversation history and start fresh")
+    parser.add_argument("--vad", action="store_true",
+                       help="Stop recording when you stop talking instead of fixed-length windows")
+    parser.add_argument("--cascade", action="store_true",
+                       help="Transcribe with the fast model first, re-check with base only when unsure")
+    parser.add_argument("--no-barge-in", action="store_true",
+                       help="Always let answers finish instead of stopping when you talk over them")
+    parser.add_argument("--source", default=None, metavar="SPEC",
+                       help="Listen to recordings or test signals instead of the mic, e.g. 'clips/,gap=1' "
+                            "(see evie-listen.py open_audio_source)")
 
     args = parser.parse_args()
 
+    global USE_VAD, STT_MODEL, BARGE_IN
+    USE_VAD = args.vad
+    BARGE_IN = not args.no_barge_in
+    if args.source:
+        listen_module.AUDIO_SOURCE = args.source
+    if args.cascade:
+        STT_MODEL = listen_module.CASCADE
+
     # Clear history if requested
     if args.clear_history:
         if CONVERSATION_FILE.exists():